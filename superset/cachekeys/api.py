@@ -28,6 +28,7 @@ from superset.cachekeys.schemas import CacheInvalidationRequestSchema
 from superset.connectors.sqla.models import SqlaTable
 from superset.extensions import cache_manager, db, event_logger, stats_logger_manager
 from superset.models.cache import CacheKey
+from superset.utils.cache import bump_datasource_generations
 from superset.views.base_api import BaseSupersetModelRestApi, statsd_metrics
 
 logger = logging.getLogger(__name__)
@@ -51,8 +52,9 @@ class CacheRestApi(BaseSupersetModelRestApi):
     @event_logger.log_this_with_context(log_to_statsd=False)
     def invalidate(self) -> Response:
         """
-        Take a list of datasources, find and invalidate the associated cache records
-        and remove the database records.
+        Take a list of datasources, invalidate their cached data by incrementing
+        their generations, and find and invalidate the associated cache records and
+        remove the database records, if any.
         ---
         post:
           summary: Invalidate cache records and remove the database records
@@ -92,6 +94,7 @@ class CacheRestApi(BaseSupersetModelRestApi):
             if ds_obj:
                 datasource_uids.add(ds_obj.uid)
 
+        bump_datasource_generations(datasource_uids)
         cache_key_objs = (
             db.session.query(CacheKey)
             .filter(CacheKey.datasource_uid.in_(datasource_uids))
@@ -19,6 +19,7 @@ from __future__ import annotations
 import contextlib
 import json
 import logging
+from collections.abc import Callable, Iterable
 from typing import Any, TYPE_CHECKING
 
 import simplejson
@@ -47,8 +48,15 @@ from superset.daos.exceptions import DatasourceNotFound
 from superset.exceptions import QueryObjectValidationError
 from superset.extensions import event_logger
 from superset.models.sql_lab import Query
-from superset.utils.core import create_zip, get_user_id, json_int_dttm_ser
-from superset.views.base import CsvResponse, generate_download_headers, XlsxResponse
+from superset.utils.arrow import iter_arrow_stream, iter_parquet
+from superset.utils.core import get_user_id, iter_zip, json_int_dttm_ser
+from superset.views.base import (
+    ArrowResponse,
+    CsvResponse,
+    generate_download_headers,
+    ParquetResponse,
+    XlsxResponse,
+)
 from superset.views.base_api import statsd_metrics
 
 if TYPE_CHECKING:
@@ -372,11 +380,14 @@ class ChartDataRestApi(ChartRestApi):
 
                 return XlsxResponse(data, headers=generate_download_headers("xlsx"))
 
-            # return multi-query results bundled as a zip file
-            def _process_data(query_data: Any) -> Any:
+            # return multi-query results bundled as a zip file, streamed as the
+            # files are written
+            def _process_data(query_data: Any) -> Iterable[bytes]:
+                if isinstance(query_data, (str, bytes)):
+                    query_data = [query_data]
                 if result_format == ChartDataResultFormat.CSV:
                     encoding = current_app.config["CSV_EXPORT"].get("encoding", "utf-8")
-                    return query_data.encode(encoding)
+                    return (chunk.encode(encoding) for chunk in query_data)
                 return query_data
 
             files = {
@@ -384,11 +395,39 @@ class ChartDataRestApi(ChartRestApi):
                 for idx, query in enumerate(result["queries"])
             }
             return Response(
-                create_zip(files),
+                iter_zip(files),
                 headers=generate_download_headers("zip"),
                 mimetype="application/zip",
             )
 
+        if result_format == ChartDataResultFormat.ARROW:
+            # the query payload, minus the data, is carried in the schema metadata
+            return self._send_stream_response(
+                result,
+                lambda query: iter_arrow_stream(
+                    query["data"],
+                    metadata={key: val for key, val in query.items() if key != "data"},
+                    max_chunksize=current_app.config["ARROW_RESULT_BATCH_SIZE"],
+                ),
+                ArrowResponse,
+                result_format,
+            )
+
+        if result_format == ChartDataResultFormat.PARQUET:
+            # Verify user has permission to export file
+            if not security_manager.can_access("can_csv", "Superset"):
+                return self.response_403()
+
+            # the files are written straight from the Arrow tables
+            return self._send_stream_response(
+                result,
+                lambda query: iter_parquet(
+                    query["data"], **current_app.config["PARQUET_EXPORT"]
+                ),
+                ParquetResponse,
+                result_format,
+            )
+
         if result_format == ChartDataResultFormat.JSON:
             response_data = simplejson.dumps(
                 {"result": result["queries"]},
@@ -401,6 +440,38 @@ class ChartDataRestApi(ChartRestApi):
 
         return self.response_400(message=f"Unsupported result_format: {result_format}")
 
+    def _send_stream_response(
+        self,
+        result: dict[Any, Any],
+        iter_fn: Callable[[dict[str, Any]], Iterable[bytes]],
+        response_class: type[Response],
+        ext: str,
+    ) -> Response:
+        """
+        Stream the data of the queries as a file, or as a zip file of one file per
+        query when there are several of them.
+
+        :param result: the chart data result
+        :param iter_fn: a function streaming the file of a query payload
+        :param response_class: the response of a single file
+        :param ext: the extension of the files
+        :returns: the streamed response
+        """
+        if not result["queries"]:
+            return self.response_400(_("Empty query result"))
+
+        streams = [iter_fn(query) for query in result["queries"]]
+        if len(streams) == 1:
+            return response_class(streams[0], headers=generate_download_headers(ext))
+
+        # return multi-query results bundled as a zip file
+        files = {f"query_{idx + 1}.{ext}": stream for idx, stream in enumerate(streams)}
+        return Response(
+            iter_zip(files),
+            headers=generate_download_headers("zip"),
+            mimetype="application/zip",
+        )
+
     def _get_data_response(
         self,
         command: ChartDataCommand,
@@ -425,8 +496,12 @@ class ChartDataRestApi(ChartRestApi):
         self, form_data: dict[str, Any]
     ) -> QueryContext:
         try:
-            return ChartDataQueryContextSchema().load(form_data)
+            query_context = ChartDataQueryContextSchema().load(form_data)
         except KeyError as ex:
             raise ValidationError("Request is incorrect") from ex
         except ValidationError as error:
             raise error
+
+        # CSV and XLSX files are streamed in the response as they are written
+        query_context.stream_export = True
+        return query_context
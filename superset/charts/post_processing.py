@@ -26,6 +26,7 @@ In order to do that, we reproduce the post-processing in Python
 for these chart types.
 """
 
+from collections.abc import Iterator
 from io import StringIO
 from typing import Any, Optional, TYPE_CHECKING, Union
 
@@ -33,6 +34,7 @@ import pandas as pd
 from flask_babel import gettext as __
 
 from superset.common.chart_data import ChartDataResultFormat
+from superset.utils.arrow import df_to_arrow_table
 from superset.utils.core import (
     extract_dataframe_dtypes,
     get_column_names,
@@ -295,6 +297,10 @@ def apply_post_process(
 
         data = query["data"]
 
+        if isinstance(data, Iterator):
+            # CSV data streamed in chunks
+            data = "".join(data)
+
         if isinstance(data, str):
             data = data.strip()
 
@@ -306,6 +312,11 @@ def apply_post_process(
             df = pd.DataFrame.from_dict(data)
         elif query["result_format"] == ChartDataResultFormat.CSV:
             df = pd.read_csv(StringIO(data))
+        elif query["result_format"] in {
+            ChartDataResultFormat.ARROW,
+            ChartDataResultFormat.PARQUET,
+        }:
+            df = data.to_pandas()
 
         # convert all columns to verbose (label) name
         if datasource:
@@ -341,5 +352,10 @@ def apply_post_process(
             processed_df.to_csv(buf)
             buf.seek(0)
             query["data"] = buf.getvalue()
+        elif query["result_format"] in {
+            ChartDataResultFormat.ARROW,
+            ChartDataResultFormat.PARQUET,
+        }:
+            query["data"] = df_to_arrow_table(processed_df, index=True)
 
     return result
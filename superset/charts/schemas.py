@@ -25,7 +25,11 @@ from marshmallow import EXCLUDE, fields, post_load, Schema, validate
 from marshmallow.validate import Length, Range
 
 from superset import app
-from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.chart_data import (
+    ChartDataResultFormat,
+    ChartDataResultShape,
+    ChartDataResultType,
+)
 from superset.db_engine_specs.base import builtin_time_grains
 from superset.tags.models import TagType
 from superset.utils import pandas_postprocessing, schema as utils
@@ -1364,6 +1368,14 @@ class ChartDataQueryContextSchema(Schema):
 
     result_type = fields.Enum(ChartDataResultType, by_value=True)
     result_format = fields.Enum(ChartDataResultFormat, by_value=True)
+    result_shape = fields.Enum(
+        ChartDataResultShape,
+        by_value=True,
+        metadata={
+            "description": "Shape of the data in JSON responses: a list of "
+            "records (default), or a mapping of column name to values."
+        },
+    )
 
     form_data = fields.Raw(allow_none=True, required=False)
 
@@ -1433,6 +1445,13 @@ class ChartDataResponseResult(Schema):
         required=True,
         allow_none=None,
     )
+    is_stale = fields.Boolean(
+        metadata={
+            "description": "Is the result served from the cache after it expired, "
+            "while it is being refreshed"
+        },
+        allow_none=True,
+    )
     query = fields.String(
         metadata={"description": "The executed query statement"},
         required=True,
@@ -17,9 +17,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, cast, TypedDict
+from collections.abc import Iterator
+from typing import cast, TypedDict
 
 import pandas as pd
+import pyarrow as pa
 from flask_babel import gettext as __
 
 from superset import app, db, results_backend, results_backend_use_msgpack
@@ -29,29 +31,45 @@ from superset.exceptions import SupersetErrorException, SupersetSecurityExceptio
 from superset.models.sql_lab import Query
 from superset.sql_parse import ParsedQuery
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.utils import core as utils, csv
-from superset.views.utils import _deserialize_results_payload
+from superset.utils import csv
+from superset.utils.arrow import iter_parquet
+from superset.utils.backports import StrEnum
+from superset.utils.compression import decompress
+from superset.utils.decorators import stats_timing
+from superset.views.utils import (
+    _deserialize_results_payload,
+    _deserialize_results_table,
+)
 
 config = app.config
+stats_logger = config["STATS_LOGGER"]
 
 logger = logging.getLogger(__name__)
 
 
+class SqlExportFormat(StrEnum):
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
 class SqlExportResult(TypedDict):
     query: Query
     count: int
-    data: list[Any]
+    data: str | Iterator[bytes]
 
 
 class SqlResultExportCommand(BaseCommand):
     _client_id: str
+    _export_format: SqlExportFormat
     _query: Query
 
     def __init__(
         self,
         client_id: str,
+        export_format: SqlExportFormat = SqlExportFormat.CSV,
     ) -> None:
         self._client_id = client_id
+        self._export_format = export_format
 
     def validate(self) -> None:
         self._query = (
@@ -86,52 +104,84 @@ class SqlResultExportCommand(BaseCommand):
         self,
     ) -> SqlExportResult:
         self.validate()
-        blob = None
+        payload = None
         if results_backend and self._query.results_key:
             logger.info(
-                "Fetching CSV from results backend [%s]", self._query.results_key
-            )
-            blob = results_backend.get(self._query.results_key)
-        if blob:
-            logger.info("Decompressing")
-            payload = utils.zlib_decompress(
-                blob, decode=not results_backend_use_msgpack
+                "Fetching %s from results backend [%s]",
+                self._export_format.upper(),
+                self._query.results_key,
             )
+            if blob := results_backend.get(self._query.results_key):
+                logger.info("Decompressing")
+                with stats_timing(
+                    "sqllab.query.results_backend_decompress", stats_logger
+                ):
+                    payload = decompress(blob, decode=not results_backend_use_msgpack)
+
+        if self._export_format == SqlExportFormat.PARQUET:
+            table = self._get_table(payload)
+            return {
+                "query": self._query,
+                "count": table.num_rows,
+                "data": iter_parquet(table, **config["PARQUET_EXPORT"]),
+            }
+
+        df = self._get_df(payload)
+        csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
+
+        return {
+            "query": self._query,
+            "count": len(df.index),
+            "data": csv_data,
+        }
+
+    def _get_df(self, payload: bytes | str | None) -> pd.DataFrame:
+        if payload:
             obj = _deserialize_results_payload(
                 payload, self._query, cast(bool, results_backend_use_msgpack)
             )
-
-            df = pd.DataFrame(
+            logger.info("Using pandas to convert to CSV")
+            return pd.DataFrame(
                 data=obj["data"],
                 dtype=object,
                 columns=[c["name"] for c in obj["columns"]],
             )
 
-            logger.info("Using pandas to convert to CSV")
-        else:
-            logger.info("Running a query to turn into CSV")
-            if self._query.select_sql:
-                sql = self._query.select_sql
-                limit = None
-            else:
-                sql = self._query.executed_sql
-                limit = ParsedQuery(
-                    sql,
-                    engine=self._query.database.db_engine_spec.engine,
-                ).limit
-            if limit is not None and self._query.limiting_factor in {
-                LimitingFactor.QUERY,
-                LimitingFactor.DROPDOWN,
-                LimitingFactor.QUERY_AND_DROPDOWN,
-            }:
-                # remove extra row from `increased_limit`
-                limit -= 1
-            df = self._query.database.get_df(sql, self._query.schema)[:limit]
-
-        csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
+        logger.info("Running a query to turn into CSV")
+        sql, limit = self._get_sql()
+        return self._query.database.get_df(sql, self._query.schema)[:limit]
+
+    def _get_table(self, payload: bytes | str | None) -> pa.Table:
+        """
+        Get the results as an Arrow table, without converting them to pandas.
+        """
+        if payload:
+            return _deserialize_results_table(
+                payload, cast(bool, results_backend_use_msgpack)
+            )
 
-        return {
-            "query": self._query,
-            "count": len(df.index),
-            "data": csv_data,
-        }
+        logger.info("Running a query to turn into Parquet")
+        sql, limit = self._get_sql()
+        table = self._query.database.get_result_set(sql, self._query.schema).pa_table
+        return table.slice(0, limit)
+
+    def _get_sql(self) -> tuple[str, int | None]:
+        """
+        Get the SQL to run to export the results, and the number of rows to export.
+        """
+        if self._query.select_sql:
+            return self._query.select_sql, None
+
+        sql = self._query.executed_sql
+        limit = ParsedQuery(
+            sql,
+            engine=self._query.database.db_engine_spec.engine,
+        ).limit
+        if limit is not None and self._query.limiting_factor in {
+            LimitingFactor.QUERY,
+            LimitingFactor.DROPDOWN,
+            LimitingFactor.QUERY_AND_DROPDOWN,
+        }:
+            # remove extra row from `increased_limit`
+            limit -= 1
+        return sql, limit
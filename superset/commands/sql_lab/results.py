@@ -27,9 +27,10 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SerializationError, SupersetErrorException
 from superset.models.sql_lab import Query
 from superset.sqllab.utils import apply_display_max_row_configuration_if_require
-from superset.utils import core as utils
+from superset.utils.compression import decompress
 from superset.utils.dates import now_as_float
-from superset.views.utils import _deserialize_results_payload
+from superset.utils.decorators import stats_timing
+from superset.views.utils import _deserialize_results_payload, ResultsOptions
 
 config = app.config
 SQLLAB_QUERY_COST_ESTIMATE_TIMEOUT = config["SQLLAB_QUERY_COST_ESTIMATE_TIMEOUT"]
@@ -41,6 +42,7 @@ logger = logging.getLogger(__name__)
 class SqlExecutionResultsCommand(BaseCommand):
     _key: str
     _rows: int | None
+    _options: ResultsOptions
     _blob: Any
     _query: Query
 
@@ -48,9 +50,11 @@ class SqlExecutionResultsCommand(BaseCommand):
         self,
         key: str,
         rows: int | None = None,
+        options: ResultsOptions | None = None,
     ) -> None:
         self._key = key
         self._rows = rows
+        self._options = options or ResultsOptions()
 
     def validate(self) -> None:
         if not results_backend:
@@ -103,12 +107,20 @@ class SqlExecutionResultsCommand(BaseCommand):
     ) -> dict[str, Any]:
         """Runs arbitrary sql and returns data as json"""
         self.validate()
-        payload = utils.zlib_decompress(
-            self._blob, decode=not results_backend_use_msgpack
-        )
+        with stats_timing("sqllab.query.results_backend_decompress", stats_logger):
+            payload = decompress(self._blob, decode=not results_backend_use_msgpack)
+        # only the rows of the requested page, within the display limit, are read
+        options = self._options
+        if self._rows:
+            offset, limit = options.offset, options.limit
+            end = self._rows if limit is None else min(offset + limit, self._rows)
+            options = options._replace(limit=max(end - offset, 0))
         try:
             obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+                payload,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                options,
             )
         except SerializationError as ex:
             raise SupersetErrorException(
@@ -127,4 +139,7 @@ class SqlExecutionResultsCommand(BaseCommand):
         if self._rows:
             obj = apply_display_max_row_configuration_if_require(obj, self._rows)
 
+        if self._options.offset or self._options.limit is not None:
+            obj["offset"] = self._options.offset
+
         return obj
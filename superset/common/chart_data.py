@@ -22,8 +22,10 @@ class ChartDataResultFormat(StrEnum):
     Chart data response format
     """
 
+    ARROW = "arrow"
     CSV = "csv"
     JSON = "json"
+    PARQUET = "parquet"
     XLSX = "xlsx"
 
     @classmethod
@@ -31,6 +33,15 @@ class ChartDataResultFormat(StrEnum):
         return {cls.CSV} | {cls.XLSX}
 
 
+class ChartDataResultShape(StrEnum):
+    """
+    Chart data JSON response shape
+    """
+
+    COLUMNAR = "columnar"
+    RECORDS = "records"
+
+
 class ChartDataResultType(StrEnum):
     """
     Chart data response type
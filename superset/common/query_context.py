@@ -17,11 +17,17 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from typing import Any, ClassVar, TYPE_CHECKING
 
 import pandas as pd
+import pyarrow as pa
 
-from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.chart_data import (
+    ChartDataResultFormat,
+    ChartDataResultShape,
+    ChartDataResultType,
+)
 from superset.common.query_context_processor import (
     CachedTimeOffset,
     QueryContextProcessor,
@@ -52,11 +58,16 @@ class QueryContext:
     form_data: dict[str, Any] | None
     result_type: ChartDataResultType
     result_format: ChartDataResultFormat
+    result_shape: ChartDataResultShape
     force: bool
     custom_cache_timeout: int | None
 
     cache_values: dict[str, Any]
 
+    # whether CSV and XLSX data is returned as an iterator over chunks of the file,
+    # to be streamed in the response, rather than as a whole
+    stream_export: bool = False
+
     _processor: QueryContextProcessor
 
     # TODO: Type datasource and query_object dictionary with TypedDict when it becomes
@@ -70,6 +81,7 @@ class QueryContext:
         form_data: dict[str, Any] | None,
         result_type: ChartDataResultType,
         result_format: ChartDataResultFormat,
+        result_shape: ChartDataResultShape = ChartDataResultShape.RECORDS,
         force: bool = False,
         custom_cache_timeout: int | None = None,
         cache_values: dict[str, Any],
@@ -78,6 +90,7 @@ class QueryContext:
         self.slice_ = slice_
         self.result_type = result_type
         self.result_format = result_format
+        self.result_shape = result_shape
         self.queries = queries
         self.form_data = form_data
         self.force = force
@@ -88,7 +101,7 @@ class QueryContext:
     def get_data(
         self,
         df: pd.DataFrame,
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | Iterator[Any] | list[dict[str, Any]] | dict[str, list[Any]] | pa.Table:
         return self._processor.get_data(df)
 
     def get_payload(
@@ -110,6 +123,32 @@ class QueryContext:
             return self.datasource.database.cache_timeout
         return None
 
+    def get_stale_while_revalidate(self) -> int | None:
+        return self._get_cache_setting("stale_while_revalidate")
+
+    def get_incremental_settled_after(self) -> int | None:
+        return self._get_cache_setting("incremental_settled_after")
+
+    def _get_cache_setting(self, key: str) -> int | None:
+        """
+        Returns a caching setting of the chart, falling back to the one of the
+        dataset.
+
+        :param key: the key of the setting in the chart params and the dataset extra
+        :returns: the setting in seconds, or `None` when it is not set or invalid
+        """
+        value = self.slice_.params_dict.get(key) if self.slice_ else None
+        if value is None:
+            extra = getattr(self.datasource, "extra_dict", None) or {}
+            value = extra.get(key)
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            logger.warning("Invalid value for the %s setting: %r", key, value)
+            return None
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         return self._processor.query_cache_key(query_obj, **kwargs)
 
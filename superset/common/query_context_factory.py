@@ -19,7 +19,11 @@ from __future__ import annotations
 from typing import Any, TYPE_CHECKING
 
 from superset import app
-from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.chart_data import (
+    ChartDataResultFormat,
+    ChartDataResultShape,
+    ChartDataResultType,
+)
 from superset.common.query_context import QueryContext
 from superset.common.query_object import QueryObject
 from superset.common.query_object_factory import QueryObjectFactory
@@ -52,6 +56,7 @@ class QueryContextFactory:  # pylint: disable=too-few-public-methods
         form_data: dict[str, Any] | None = None,
         result_type: ChartDataResultType | None = None,
         result_format: ChartDataResultFormat | None = None,
+        result_shape: ChartDataResultShape | None = None,
         force: bool = False,
         custom_cache_timeout: int | None = None,
     ) -> QueryContext:
@@ -65,6 +70,7 @@ class QueryContextFactory:  # pylint: disable=too-few-public-methods
 
         result_type = result_type or ChartDataResultType.FULL
         result_format = result_format or ChartDataResultFormat.JSON
+        result_shape = result_shape or ChartDataResultShape.RECORDS
         queries_ = [
             self._process_query_object(
                 datasource_model_instance,
@@ -80,6 +86,7 @@ class QueryContextFactory:  # pylint: disable=too-few-public-methods
             "queries": queries,
             "result_type": result_type,
             "result_format": result_format,
+            "result_shape": result_shape,
         }
         return QueryContext(
             datasource=datasource_model_instance,
@@ -88,6 +95,7 @@ class QueryContextFactory:  # pylint: disable=too-few-public-methods
             form_data=form_data,
             result_type=result_type,
             result_format=result_format,
+            result_shape=result_shape,
             force=force,
             custom_cache_timeout=custom_cache_timeout,
             cache_values=cache_values,
@@ -14,20 +14,28 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+# pylint: disable=too-many-lines
 from __future__ import annotations
 
 import copy
 import logging
 import re
-from typing import Any, ClassVar, TYPE_CHECKING, TypedDict
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any, cast, ClassVar, TYPE_CHECKING, TypedDict
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from flask_babel import gettext as _
 from pandas import DateOffset
 
 from superset import app
-from superset.common.chart_data import ChartDataResultFormat
+from superset.common.chart_data import (
+    ChartDataResultFormat,
+    ChartDataResultShape,
+    ChartDataResultType,
+)
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
 from superset.common.utils import dataframe_utils
@@ -36,6 +44,16 @@ from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
     get_since_until_from_time_range,
 )
+from superset.common.utils.time_windows import (
+    can_splice_time_windows,
+    get_incremental_query_object,
+    get_settled_coverage,
+    get_time_window_coverage,
+    get_time_window_query_object,
+    splice_time_window_results,
+    TIME_GRAIN_FREQUENCIES,
+    TimeWindowCoverage,
+)
 from superset.connectors.sqla.models import BaseDatasource
 from superset.constants import CacheRegion, TimeGrain
 from superset.daos.annotation_layer import AnnotationLayerDAO
@@ -48,8 +66,13 @@ from superset.exceptions import (
 from superset.extensions import cache_manager, security_manager
 from superset.models.helpers import QueryResult
 from superset.models.sql_lab import Query
-from superset.utils import csv, excel
-from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils import arrow, csv, excel
+from superset.utils.cache import (
+    generate_cache_key,
+    get_datasource_generation,
+    set_and_log_cache,
+)
+from superset.utils.concurrency import map_in_app_context
 from superset.utils.core import (
     DatasourceType,
     DateColumn,
@@ -59,11 +82,13 @@ from superset.utils.core import (
     get_column_names_from_columns,
     get_column_names_from_metrics,
     get_metric_names,
+    get_user_id,
     get_xaxis_label,
     normalize_dttm_col,
     TIME_COMPARISON,
 )
 from superset.utils.date_parser import get_past_or_future, normalize_time_delta
+from superset.utils.dates import now_as_float
 from superset.utils.pandas_postprocessing.utils import unescape_separator
 from superset.views.utils import get_viz
 from superset.viz import viz_types
@@ -98,6 +123,14 @@ AGGREGATED_JOIN_GRAINS = {
 # Right suffix used for joining offset results
 R_SUFFIX = "__right_suffix"
 
+# result types whose payloads are loaded with `get_df_payload` for the query objects
+# of the query context themselves
+DF_PAYLOAD_RESULT_TYPES = {
+    ChartDataResultType.FULL,
+    ChartDataResultType.RESULTS,
+    ChartDataResultType.POST_PROCESSED,
+}
+
 
 class CachedTimeOffset(TypedDict):
     df: pd.DataFrame
@@ -105,6 +138,13 @@ class CachedTimeOffset(TypedDict):
     cache_keys: list[str | None]
 
 
+class OffsetQuery(TimeWindowCoverage):
+    offset: str
+    query_object: QueryObject
+    cache_key: str | None
+    cache: QueryCacheManager
+
+
 class QueryContextProcessor:
     """
     The query context contains the query object and additional fields necessary
@@ -114,9 +154,17 @@ class QueryContextProcessor:
     _query_context: QueryContext
     _qc_datasource: BaseDatasource
 
+    # cache keys and cached payloads of the query objects, by query object id
+    _prefetched: dict[int, tuple[str | None, QueryCacheManager]]
+    # payloads of the query objects loaded concurrently, or the errors raised loading
+    # them, by query object id
+    _loaded: dict[int, tuple[dict[str, Any] | None, Exception | None]]
+
     def __init__(self, query_context: QueryContext):
         self._query_context = query_context
         self._qc_datasource = query_context.datasource
+        self._prefetched = {}
+        self._loaded = {}
 
     cache_type: ClassVar[str] = "df"
     enforce_numerical_metrics: ClassVar[bool] = True
@@ -125,48 +173,29 @@ class QueryContextProcessor:
         self, query_obj: QueryObject, force_cached: bool | None = False
     ) -> dict[str, Any]:
         """Handles caching around the df payload retrieval"""
-        cache_key = self.query_cache_key(query_obj)
-        timeout = self.get_cache_timeout()
-        force_query = self._query_context.force or timeout == -1
-        cache = QueryCacheManager.get(
-            key=cache_key,
-            region=CacheRegion.DATA,
-            force_query=force_query,
-            force_cached=force_cached,
-        )
+        if loaded := self._loaded.pop(id(query_obj), None):
+            payload, error = loaded
+            if error:
+                raise error
+            return cast(dict[str, Any], payload)
+
+        force_query = self._query_context.force or self.get_cache_timeout() == -1
+        if prefetched := self._prefetched.pop(id(query_obj), None):
+            cache_key, cache = prefetched
+        else:
+            cache_key = self.query_cache_key(query_obj)
+            cache = QueryCacheManager.get(
+                key=cache_key,
+                region=CacheRegion.DATA,
+                force_query=force_query,
+                force_cached=force_cached,
+            )
 
+        cache, is_stale = self._revalidate_cache(
+            query_obj, cache_key, cache, force_cached
+        )
         if query_obj and cache_key and not cache.is_loaded:
-            try:
-                if invalid_columns := [
-                    col
-                    for col in get_column_names_from_columns(query_obj.columns)
-                    + get_column_names_from_metrics(query_obj.metrics or [])
-                    if (
-                        col not in self._qc_datasource.column_names
-                        and col != DTTM_ALIAS
-                    )
-                ]:
-                    raise QueryObjectValidationError(
-                        _(
-                            "Columns missing in dataset: %(invalid_columns)s",
-                            invalid_columns=invalid_columns,
-                        )
-                    )
-
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=force_query,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
-            except QueryObjectValidationError as ex:
-                cache.error_message = str(ex)
-                cache.status = QueryStatus.FAILED
+            cache = self._load_df_payload(query_obj, cache_key, cache, force_query)
 
         # the N-dimensional DataFrame has converted into flat DataFrame
         # by `flatten operator`, "comma" in the column is escaped by `escape_separator`
@@ -190,6 +219,7 @@ class QueryContextProcessor:
             "annotation_data": cache.annotation_data,
             "error": cache.error_message,
             "is_cached": cache.is_cached,
+            "is_stale": is_stale,
             "query": cache.query,
             "status": cache.status,
             "stacktrace": cache.stacktrace,
@@ -199,12 +229,239 @@ class QueryContextProcessor:
             "label_map": label_map,
         }
 
+    def _revalidate_cache(
+        self,
+        query_obj: QueryObject,
+        cache_key: str | None,
+        cache: QueryCacheManager,
+        force_cached: bool | None = False,
+    ) -> tuple[QueryCacheManager, bool]:
+        """
+        Check the age of a cached payload. Data cached for longer than the cache
+        timeout is served while it is refreshed in the background, for up to
+        `stale_while_revalidate` seconds, and reloaded past that.
+
+        :param query_obj: the query object of the payload
+        :param cache_key: the cache key of the query object
+        :param cache: the cached payload
+        :param force_cached: whether the payload must be loaded from the cache
+        :returns: the payload to serve, not loaded when it must be reloaded, and
+            whether it is stale
+        """
+        stale_while_revalidate = self.get_stale_while_revalidate()
+        if (
+            not cache_key
+            or not cache.is_loaded
+            or not cache.cache_dttm
+            or not stale_while_revalidate
+            or force_cached
+        ):
+            return cache, False
+
+        timeout = self.get_cache_timeout()
+        cached_dttm = datetime.fromisoformat(cache.cache_dttm)
+        age = (datetime.utcnow() - cached_dttm).total_seconds()
+        if age < timeout:
+            return cache, False
+        if age < timeout + stale_while_revalidate and self._refresh_df_payload(
+            query_obj, cache_key, stale_while_revalidate
+        ):
+            return cache, True
+        return QueryCacheManager(), False
+
+    def _load_df_payload(
+        self,
+        query_obj: QueryObject,
+        cache_key: str,
+        cache: QueryCacheManager,
+        force_query: bool,
+    ) -> QueryCacheManager:
+        """
+        Run the query of a query object missing from the data cache and cache its
+        payload, unless another request is already doing so, in which case the payload
+        it cached is returned.
+
+        :param query_obj: the query object
+        :param cache_key: the cache key of the query object
+        :param cache: the payload to load the query result into
+        :param force_query: whether the payload is being refreshed
+        :returns: the loaded payload
+        """
+        try:
+            if invalid_columns := [
+                col
+                for col in get_column_names_from_columns(query_obj.columns)
+                + get_column_names_from_metrics(query_obj.metrics or [])
+                if (col not in self._qc_datasource.column_names and col != DTTM_ALIAS)
+            ]:
+                raise QueryObjectValidationError(
+                    _(
+                        "Columns missing in dataset: %(invalid_columns)s",
+                        invalid_columns=invalid_columns,
+                    )
+                )
+
+            with QueryCacheManager.lock(
+                key=cache_key,
+                region=CacheRegion.DATA,
+                force_query=force_query,
+            ) as cached:
+                if cached:
+                    return cached
+
+                query_result = self.get_query_result(query_obj)
+                annotation_data = self.get_annotation_data(query_obj)
+                cache.set_query_result(
+                    key=cache_key,
+                    query_result=query_result,
+                    annotation_data=annotation_data,
+                    force_query=force_query,
+                    timeout=self.get_cache_timeout()
+                    + self.get_stale_while_revalidate(),
+                    datasource_uid=self._qc_datasource.uid,
+                    region=CacheRegion.DATA,
+                )
+        except QueryObjectValidationError as ex:
+            cache.error_message = str(ex)
+            cache.status = QueryStatus.FAILED
+        return cache
+
+    def prefetch_df_payloads(
+        self, query_objs: list[QueryObject], force_cached: bool | None = False
+    ) -> None:
+        """
+        Read the cached payloads of several query objects from the data cache at once,
+        rather than one at a time in `get_df_payload`, which then only runs the
+        queries of the objects missing from the cache.
+
+        :param query_objs: the query objects whose payloads are about to be loaded
+        :param force_cached: whether the payloads must be loaded from the cache
+        """
+        force_query = self._query_context.force or self.get_cache_timeout() == -1
+        if not query_objs or force_query:
+            return
+
+        cache_keys = [self.query_cache_key(query_obj) for query_obj in query_objs]
+        caches = QueryCacheManager.get_many(
+            keys=cache_keys,
+            region=CacheRegion.DATA,
+            force_cached=force_cached,
+        )
+        for query_obj, cache_key, cache in zip(query_objs, cache_keys, caches):
+            self._prefetched[id(query_obj)] = (cache_key, cache)
+
+        hits = sum(cache.is_loaded for cache in caches)
+        stats_logger.gauge("query_context.cache_hits", hits)
+        stats_logger.gauge("query_context.cache_misses", len(caches) - hits)
+
+    def load_df_payloads(
+        self, query_objs: list[QueryObject], force_cached: bool | None = False
+    ) -> None:
+        """
+        Load the payloads of the query objects missing from the data cache concurrently,
+        rather than one after the other in `get_df_payload`, so that a query context
+        takes as long as its slowest query rather than the sum of them. Each query runs
+        in its own thread, with its own database connection, and the error raised by
+        a query is only raised when reading its payload.
+
+        :param query_objs: the query objects whose payloads are about to be loaded
+        :param force_cached: whether the payloads must be loaded from the cache
+        """
+        max_workers = config["QUERY_CONTEXT_MAX_WORKERS"]
+        missing = [
+            query_obj
+            for query_obj in query_objs
+            if not (prefetched := self._prefetched.get(id(query_obj)))
+            or not prefetched[1].is_loaded
+        ]
+        if force_cached or max_workers < 2 or len(missing) < 2:
+            return
+
+        # the relationships of the datasources are loaded beforehand, as lazy loading
+        # them in the threads would use the session of the calling thread
+        for datasource in {self._qc_datasource, *(q.datasource for q in missing)}:
+            if datasource:
+                _ = datasource.columns, datasource.metrics
+                _ = getattr(datasource, "database", None)
+
+        def load(
+            query_obj: QueryObject,
+        ) -> tuple[dict[str, Any] | None, Exception | None]:
+            start = now_as_float()
+            try:
+                return self.get_df_payload(query_obj, force_cached), None
+            except Exception as ex:  # pylint: disable=broad-except
+                return None, ex
+            finally:
+                stats_logger.timing("query_context.query_time", now_as_float() - start)
+
+        for query_obj, loaded in zip(
+            missing, map_in_app_context(load, missing, max_workers)
+        ):
+            self._loaded[id(query_obj)] = loaded
+
+    def _refresh_df_payload(
+        self, query_obj: QueryObject, cache_key: str, timeout: int
+    ) -> bool:
+        """
+        Refresh the cached payload of a query object in the background.
+
+        :param query_obj: the query object, one of the queries of the query context
+        :param cache_key: the cache key of the query object
+        :param timeout: the stale while revalidate window of the key
+        :returns: whether the payload is being refreshed
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.async_queries import refresh_chart_data_cache
+
+        query_context = self._query_context
+        queries = query_context.cache_values.get("queries") or []
+        index = next(
+            (i for i, query in enumerate(query_context.queries) if query is query_obj),
+            None,
+        )
+        if index is None or index >= len(queries):
+            return False
+
+        # the key is deleted once refreshed, and expires should the refresh be lost
+        refresh_key = f"{cache_key}__refresh"
+        if not QueryCacheManager.add(
+            refresh_key,
+            True,
+            timeout=min(timeout, config["SQLLAB_ASYNC_TIME_LIMIT_SEC"]),
+            region=CacheRegion.DATA,
+        ):
+            return True
+
+        form_data = {
+            **query_context.cache_values,
+            "queries": [queries[index]],
+            "result_format": ChartDataResultFormat.JSON,
+            "form_data": query_context.form_data,
+            "custom_cache_timeout": query_context.custom_cache_timeout,
+        }
+        job_metadata: dict[str, Any] = {"user_id": get_user_id()}
+        if guest_user := security_manager.get_current_guest_user_if_guest():
+            job_metadata["guest_token"] = guest_user.guest_token
+
+        try:
+            refresh_chart_data_cache.delay(job_metadata, form_data, refresh_key)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Unable to enqueue the refresh of key %s", cache_key)
+            QueryCacheManager.delete(refresh_key, region=CacheRegion.DATA)
+            return False
+
+        stats_logger.incr("stale_while_revalidate_refresh")
+        return True
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
         Returns a QueryObject cache key for objects in self.queries
         """
         datasource = self._qc_datasource
         extra_cache_keys = datasource.get_extra_cache_keys(query_obj.to_dict())
+        if (generation := get_datasource_generation(datasource.uid)) is not None:
+            kwargs["generation"] = generation
 
         cache_key = (
             query_obj.cache_key(
@@ -219,30 +476,116 @@ class QueryContextProcessor:
         )
         return cache_key
 
+    def _raw_query_cache_key(self, query_obj: QueryObject) -> str | None:
+        """
+        Returns the cache key of the DataFrame of a QueryObject before its post
+        processing, which is shared by the objects running the same query
+        """
+        raw_query_obj = copy.copy(query_obj)
+        raw_query_obj.annotation_layers = []
+        raw_query_obj.post_processing = []
+        raw_query_obj.result_type = None
+        return self.query_cache_key(raw_query_obj, raw=True)
+
     def get_query_result(self, query_object: QueryObject) -> QueryResult:
         """Returns a pandas dataframe based on the query object"""
+        if query_object.post_processing and config["DATA_CACHE_RAW_QUERY_RESULTS"]:
+            result = self._get_cached_raw_query_result(query_object)
+        else:
+            result = self._get_raw_query_result(query_object)
+
+        if not result.df.empty:
+            # Re-raising QueryObjectValidationError
+            try:
+                result.df = query_object.exec_post_processing(result.df)
+            except InvalidPostProcessingError as ex:
+                raise QueryObjectValidationError(ex.message) from ex
+
+        result.from_dttm = query_object.from_dttm
+        result.to_dttm = query_object.to_dttm
+        return result
+
+    def _get_cached_raw_query_result(self, query_object: QueryObject) -> QueryResult:
+        """
+        Returns the result of the query object before its post processing, from the
+        data cache when another query object ran the same query
+        """
+        timeout = self.get_cache_timeout()
+        force_query = self._query_context.force or timeout == -1
+        cache_key = self._raw_query_cache_key(query_object)
+        cache = QueryCacheManager.get(
+            key=cache_key,
+            region=CacheRegion.DATA,
+            force_query=force_query,
+        )
+        if not cache.is_loaded:
+            with QueryCacheManager.lock(
+                key=cache_key,
+                region=CacheRegion.DATA,
+                force_query=force_query,
+            ) as cached:
+                if not cached:
+                    result = self._get_raw_query_result(query_object)
+                    cache.set_query_result(
+                        key=cache_key,  # type: ignore
+                        query_result=result,
+                        force_query=force_query,
+                        timeout=timeout + self.get_stale_while_revalidate(),
+                        datasource_uid=self._qc_datasource.uid,
+                        region=CacheRegion.DATA,
+                    )
+                    return result
+                cache = cached
+
+        stats_logger.incr("loaded_from_raw_cache")
+        return QueryResult(
+            df=cache.df,
+            query=cache.query,
+            duration=timedelta(0),
+            applied_template_filters=cache.applied_template_filters,
+            applied_filter_columns=cache.applied_filter_columns,
+            rejected_filter_columns=cache.rejected_filter_columns,
+        )
+
+    def _get_raw_query_result(self, query_object: QueryObject) -> QueryResult:
+        """
+        Returns the result of the query object, including its time offsets, before
+        its post processing
+        """
         query_context = self._query_context
         # Here, we assume that all the queries will use the same datasource, which is
         # a valid assumption for current setting. In the long term, we may
         # support multiple queries from different data sources.
 
         query = ""
-        if isinstance(query_context.datasource, Query):
-            # todo(hugh): add logic to manage all sip68 models here
-            result = query_context.datasource.exc_query(query_object.to_dict())
-        else:
-            result = query_context.datasource.query(query_object.to_dict())
+        if (settled_after := self.get_incremental_settled_after()) and (
+            incremental_query_object := get_incremental_query_object(
+                self._qc_datasource, query_object, self.get_time_grain(query_object)
+            )
+        ):
+            result = self._get_incremental_query_result(
+                incremental_query_object, settled_after
+            )
             query = result.query + ";\n\n"
+            df = result.df
+        else:
+            if isinstance(query_context.datasource, Query):
+                # todo(hugh): add logic to manage all sip68 models here
+                result = query_context.datasource.exc_query(query_object.to_dict())
+            else:
+                result = query_context.datasource.query(query_object.to_dict())
+                query = result.query + ";\n\n"
+
+            df = result.df
+            # Transform the timestamp we received from database to pandas supported
+            # datetime format. If no python_date_format is specified, the pattern will
+            # be considered as the default ISO date format
+            # If the datetime format is unix, the parse will use the corresponding
+            # parsing logic
+            if not df.empty:
+                df = self.normalize_df(df, query_object)
 
-        df = result.df
-        # Transform the timestamp we received from database to pandas supported
-        # datetime format. If no python_date_format is specified, the pattern will
-        # be considered as the default ISO date format
-        # If the datetime format is unix, the parse will use the corresponding
-        # parsing logic
         if not df.empty:
-            df = self.normalize_df(df, query_object)
-
             if query_object.time_offsets:
                 time_offsets = self.processing_time_offsets(df, query_object)
                 df = time_offsets["df"]
@@ -251,16 +594,87 @@ class QueryContextProcessor:
                 query += ";\n\n".join(queries)
                 query += ";\n\n"
 
-            # Re-raising QueryObjectValidationError
-            try:
-                df = query_object.exec_post_processing(df)
-            except InvalidPostProcessingError as ex:
-                raise QueryObjectValidationError(ex.message) from ex
-
         result.df = df
         result.query = query
-        result.from_dttm = query_object.from_dttm
-        result.to_dttm = query_object.to_dttm
+        return result
+
+    def _get_incremental_query_result(
+        self, query_object: QueryObject, settled_after: int
+    ) -> QueryResult:
+        """
+        Returns the normalized result of a query object from its previous result,
+        merged with the result of the query over the time buckets that were not
+        settled yet, or not covered by the previous result.
+
+        :param query_object: the query object, as returned by
+            `get_incremental_query_object`
+        :param settled_after: the number of seconds after which the rows of a time
+            bucket are not expected to change anymore
+        :returns: the result of the query object
+        """
+        time_grain = cast(str, self.get_time_grain(query_object))
+        cache_query_object = copy.copy(query_object)
+        cache_query_object.time_range = None
+        cache_query_object.annotation_layers = []
+        cache_query_object.result_type = None
+        cache_query_object.inner_from_dttm = None
+        cache_query_object.inner_to_dttm = None
+        cache_key = self.query_cache_key(cache_query_object, incremental=True)
+        cache = QueryCacheManager.get(
+            cache_key, CacheRegion.DATA, self._query_context.force
+        )
+
+        coverage = get_settled_coverage(
+            self._qc_datasource, query_object, cache, time_grain
+        )
+        results = [
+            self._get_time_window_query_result(
+                get_time_window_query_object(query_object, window)
+            )
+            for window in coverage["windows"]
+        ]
+        df = splice_time_window_results(
+            query_object, coverage["covered_df"], results, self.normalize_df
+        )
+        if df is None:
+            # the result is truncated by the row limit, the whole time window is
+            # queried as the truncated rows depend on it
+            results = [self._get_time_window_query_result(query_object)]
+            df = splice_time_window_results(
+                query_object, None, results, self.normalize_df
+            )
+
+        if failed := [
+            result for result in results if result.status == QueryStatus.FAILED
+        ]:
+            return failed[0]
+
+        result = results[0] if results else QueryResult(df, "", timedelta(0))
+        result.df = df
+        result.query = ";\n\n".join(
+            window_result.query for window_result in results
+        ) or cast(str, cache.query)
+
+        # buckets are settled once they are older than `settled_after`, and must end
+        # before the end of the time window, the last one being partial otherwise
+        freq = TIME_GRAIN_FREQUENCIES[time_grain]
+        settled_dttm = min(
+            pd.Timestamp(datetime.now() - timedelta(seconds=settled_after)).floor(freq),
+            pd.Timestamp(query_object.to_dttm).floor(freq),
+        ).to_pydatetime()
+        cache.set(
+            key=cache_key,
+            value={
+                **QueryCacheManager.serialize_df(df),
+                "query": result.query,
+                "from_dttm": query_object.from_dttm,
+                "to_dttm": query_object.to_dttm,
+                "settled_dttm": settled_dttm,
+            },
+            timeout=config["DATA_CACHE_INCREMENTAL_TIMEOUT"],
+            datasource_uid=self._qc_datasource.uid,
+            region=CacheRegion.DATA,
+        )
         return result
 
     def normalize_df(self, df: pd.DataFrame, query_object: QueryObject) -> pd.DataFrame:
@@ -360,8 +774,6 @@ class QueryContextProcessor:
         query_object: QueryObject,
     ) -> CachedTimeOffset:
         query_context = self._query_context
-        # ensure query_object is immutable
-        query_object_clone = copy.copy(query_object)
         queries: list[str] = []
         cache_keys: list[str | None] = []
         offset_dfs: list[pd.DataFrame] = []
@@ -398,7 +810,12 @@ class QueryContextProcessor:
         metric_names = get_metric_names(query_object.metrics)
         join_keys = [col for col in columns if col not in metric_names]
 
+        can_splice = can_splice_time_windows(
+            self._qc_datasource, query_object, time_grain
+        )
+        offset_queries: list[OffsetQuery] = []
         for offset in query_object.time_offsets:
+            query_object_clone = copy.copy(query_object)
             try:
                 # pylint: disable=line-too-long
                 # Since the xaxis is also a column name for the time filter, xaxis_label will be set as granularity
@@ -433,85 +850,117 @@ class QueryContextProcessor:
                 if flt.get("col") != xaxis_label
             ]
 
+            # the cached results are keyed on the query rather than on its time
+            # window, which is stored alongside them instead, so that the part of
+            # the window they cover can be reused when the time range moves
+            cache_query_object = copy.copy(query_object_clone)
+            cache_query_object.time_range = None
+            if can_splice:
+                cache_query_object.inner_from_dttm = None
+                cache_query_object.inner_to_dttm = None
             # `offset` is added to the hash function
             cache_key = self.query_cache_key(
-                query_object_clone, time_offset=offset, time_grain=time_grain
+                cache_query_object, time_offset=offset, time_grain=time_grain
             )
             cache = QueryCacheManager.get(
                 cache_key, CacheRegion.DATA, query_context.force
             )
+            coverage = get_time_window_coverage(
+                self._qc_datasource,
+                query_object_clone,
+                cache,
+                time_grain if can_splice else None,
+            )
+            offset_queries.append(
+                OffsetQuery(
+                    offset=offset,
+                    query_object=query_object_clone,
+                    cache_key=cache_key,
+                    cache=cache,
+                    covered_df=coverage["covered_df"],
+                    windows=coverage["windows"],
+                )
+            )
+
+        # the queries of the uncovered windows of all the offsets run concurrently
+        window_query_objects = [
+            get_time_window_query_object(offset_query["query_object"], window)
+            for offset_query in offset_queries
+            for window in offset_query["windows"]
+        ]
+        window_results = iter(
+            map_in_app_context(
+                self._get_time_window_query_result,
+                window_query_objects,
+                config["TIME_OFFSET_QUERIES_MAX_WORKERS"],
+            )
+        )
+
+        for offset_query in offset_queries:
+            offset = offset_query["offset"]
+            query_object_clone = offset_query["query_object"]
+            cache_key = offset_query["cache_key"]
+            cache = offset_query["cache"]
             # whether hit on the cache
-            if cache.is_loaded:
-                offset_dfs.append(cache.df)
+            if not offset_query["windows"]:
+                offset_dfs.append(
+                    self._process_time_offset_df(
+                        cache.df,
+                        query_object_clone,
+                        offset,
+                        join_keys,
+                        time_grain,
+                        join_column_producer,
+                    )
+                )
                 queries.append(cache.query)
                 cache_keys.append(cache_key)
                 continue
 
-            query_object_clone_dct = query_object_clone.to_dict()
-            # rename metrics: SUM(value) => SUM(value) 1 year ago
-            metrics_mapping = {
-                metric: TIME_COMPARISON.join([metric, offset])
-                for metric in metric_names
-            }
-
-            if isinstance(self._qc_datasource, Query):
-                result = self._qc_datasource.exc_query(query_object_clone_dct)
-            else:
-                result = self._qc_datasource.query(query_object_clone_dct)
+            results = [next(window_results) for _ in offset_query["windows"]]
+            offset_df = splice_time_window_results(
+                query_object_clone,
+                offset_query["covered_df"],
+                results,
+                self.normalize_df,
+            )
+            if offset_df is None:
+                # the result is truncated by the row limit, the whole window is
+                # queried as the truncated rows depend on it
+                results = [self._get_time_window_query_result(query_object_clone)]
+                offset_df = splice_time_window_results(
+                    query_object_clone, None, results, self.normalize_df
+                )
 
-            queries.append(result.query)
+            query = ";\n\n".join(result.query for result in results)
+            queries.append(query)
             cache_keys.append(None)
 
-            offset_metrics_df = result.df
-            if offset_metrics_df.empty:
-                offset_metrics_df = pd.DataFrame(
-                    {
-                        col: [np.NaN]
-                        for col in join_keys + list(metrics_mapping.values())
-                    }
-                )
-            else:
-                # 1. normalize df, set dttm column
-                offset_metrics_df = self.normalize_df(
-                    offset_metrics_df, query_object_clone
+            # cache df and query
+            if all(result.status != QueryStatus.FAILED for result in results):
+                value = {
+                    **QueryCacheManager.serialize_df(offset_df),
+                    "query": query,
+                    "from_dttm": query_object_clone.from_dttm,
+                    "to_dttm": query_object_clone.to_dttm,
+                }
+                cache.set(
+                    key=cache_key,
+                    value=value,
+                    timeout=self.get_cache_timeout(),
+                    datasource_uid=query_context.datasource.uid,
+                    region=CacheRegion.DATA,
                 )
-
-                # 2. rename extra query columns
-                offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
-
-                # 3. set time offset for index
-                index = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
-                if not dataframe_utils.is_datetime_series(offset_metrics_df.get(index)):
-                    raise QueryObjectValidationError(
-                        _(
-                            "A time column must be specified "
-                            "when using a Time Comparison."
-                        )
-                    )
-
-                # modifies temporal column using offset
-                offset_metrics_df[index] = offset_metrics_df[index] - DateOffset(
-                    **normalize_time_delta(offset)
+            offset_dfs.append(
+                self._process_time_offset_df(
+                    offset_df,
+                    query_object_clone,
+                    offset,
+                    join_keys,
+                    time_grain,
+                    join_column_producer,
                 )
-
-                if use_aggregated_join_column:
-                    self.add_aggregated_join_column(
-                        offset_metrics_df, time_grain, join_column_producer
-                    )
-
-            # cache df and query
-            value = {
-                "df": offset_metrics_df,
-                "query": result.query,
-            }
-            cache.set(
-                key=cache_key,
-                value=value,
-                timeout=self.get_cache_timeout(),
-                datasource_uid=query_context.datasource.uid,
-                region=CacheRegion.DATA,
             )
-            offset_dfs.append(offset_metrics_df)
 
         if offset_dfs:
             # iterate on offset_dfs, left join each with df
@@ -532,6 +981,59 @@ class QueryContextProcessor:
 
         return CachedTimeOffset(df=df, queries=queries, cache_keys=cache_keys)
 
+    def _get_time_window_query_result(self, query_object: QueryObject) -> QueryResult:
+        """
+        Returns the result of a time offset query, before its normalization.
+        """
+        query_object_dct = query_object.to_dict()
+        if isinstance(self._qc_datasource, Query):
+            return self._qc_datasource.exc_query(query_object_dct)
+        return self._qc_datasource.query(query_object_dct)
+
+    def _process_time_offset_df(  # pylint: disable=too-many-arguments
+        self,
+        offset_metrics_df: pd.DataFrame,
+        query_object: QueryObject,
+        offset: str,
+        join_keys: list[str],
+        time_grain: str,
+        join_column_producer: Any,
+    ) -> pd.DataFrame:
+        """
+        Prepares the normalized result of a time offset query to be joined with the
+        result of the main query.
+        """
+        # rename metrics: SUM(value) => SUM(value) 1 year ago
+        metrics_mapping = {
+            metric: TIME_COMPARISON.join([metric, offset])
+            for metric in get_metric_names(query_object.metrics)
+        }
+        if offset_metrics_df.empty:
+            return pd.DataFrame(
+                {col: [np.NaN] for col in join_keys + list(metrics_mapping.values())}
+            )
+
+        # 1. rename extra query columns
+        offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
+
+        # 2. set time offset for index
+        index = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
+        if not dataframe_utils.is_datetime_series(offset_metrics_df.get(index)):
+            raise QueryObjectValidationError(
+                _("A time column must be specified when using a Time Comparison.")
+            )
+
+        # modifies temporal column using offset
+        offset_metrics_df[index] = offset_metrics_df[index] - DateOffset(
+            **normalize_time_delta(offset)
+        )
+
+        if join_column_producer or time_grain in AGGREGATED_JOIN_GRAINS:
+            self.add_aggregated_join_column(
+                offset_metrics_df, time_grain, join_column_producer
+            )
+        return offset_metrics_df
+
     @staticmethod
     def get_aggregated_join_column(
         row: pd.Series, column_index: int, time_grain: str
@@ -557,7 +1059,15 @@ class QueryContextProcessor:
 
         return row[column_index].strftime("%Y")
 
-    def get_data(self, df: pd.DataFrame) -> str | list[dict[str, Any]]:
+    def get_data(
+        self, df: pd.DataFrame
+    ) -> str | Iterator[Any] | list[dict[str, Any]] | dict[str, list[Any]] | pa.Table:
+        if self._query_context.result_format in {
+            ChartDataResultFormat.ARROW,
+            ChartDataResultFormat.PARQUET,
+        }:
+            return arrow.df_to_arrow_table(df)
+
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -567,13 +1077,22 @@ class QueryContextProcessor:
 
             result = None
             if self._query_context.result_format == ChartDataResultFormat.CSV:
+                if self._query_context.stream_export:
+                    return csv.df_to_escaped_csv_chunks(
+                        df, index=include_index, **config["CSV_EXPORT"]
+                    )
                 result = csv.df_to_escaped_csv(
                     df, index=include_index, **config["CSV_EXPORT"]
                 )
             elif self._query_context.result_format == ChartDataResultFormat.XLSX:
+                if self._query_context.stream_export:
+                    return excel.df_to_excel_chunks(df, **config["EXCEL_EXPORT"])
                 result = excel.df_to_excel(df, **config["EXCEL_EXPORT"])
             return result or ""
 
+        if self._query_context.result_shape == ChartDataResultShape.COLUMNAR:
+            return df.to_dict(orient="list")
+
         return df.to_dict(orient="records")
 
     def get_payload(
@@ -583,16 +1102,29 @@ class QueryContextProcessor:
     ) -> dict[str, Any]:
         """Returns the query results with both metadata and data"""
 
-        # Get all the payloads from the QueryObjects
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
-                query_obj,
-                force_cached,
-            )
+        df_query_objs = [
+            query_obj
             for query_obj in self._query_context.queries
+            if (query_obj.result_type or self._query_context.result_type)
+            in DF_PAYLOAD_RESULT_TYPES
         ]
+        self.prefetch_df_payloads(df_query_objs, force_cached)
+
+        # Get all the payloads from the QueryObjects
+        try:
+            self.load_df_payloads(df_query_objs, force_cached)
+            query_results = [
+                get_query_results(
+                    query_obj.result_type or self._query_context.result_type,
+                    self._query_context,
+                    query_obj,
+                    force_cached,
+                )
+                for query_obj in self._query_context.queries
+            ]
+        finally:
+            self._prefetched.clear()
+            self._loaded.clear()
         return_value = {"queries": query_results}
 
         if cache_query_context:
@@ -626,6 +1158,19 @@ class QueryContextProcessor:
             return data_cache_timeout
         return config["CACHE_DEFAULT_TIMEOUT"]
 
+    def get_stale_while_revalidate(self) -> int:
+        if self.get_cache_timeout() <= 0:
+            # data that is not cached, or cached forever, never gets stale
+            return 0
+        if (value := self._query_context.get_stale_while_revalidate()) is not None:
+            return value
+        return config["DATA_CACHE_STALE_WHILE_REVALIDATE"]
+
+    def get_incremental_settled_after(self) -> int:
+        if (value := self._query_context.get_incremental_settled_after()) is not None:
+            return value
+        return config["DATA_CACHE_INCREMENTAL_SETTLED_AFTER"]
+
     def cache_key(self, **extra: Any) -> str:
         """
         The QueryContext cache key is made out of the key/values from
@@ -17,6 +17,9 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from flask_caching import Cache
@@ -30,6 +33,7 @@ from superset.extensions import cache_manager
 from superset.models.helpers import QueryResult
 from superset.stats_logger import BaseStatsLogger
 from superset.superset_typing import Column
+from superset.utils.arrow import df_to_ipc, ipc_to_df
 from superset.utils.cache import set_and_log_cache
 from superset.utils.core import error_msg_from_exception, get_stacktrace
 
@@ -42,6 +46,9 @@ _cache: dict[CacheRegion, Cache] = {
     CacheRegion.DATA: cache_manager.data_cache,
 }
 
+# how often to check the cache while waiting for another request to load a key
+CACHE_LOCK_POLL_INTERVAL = 0.1
+
 
 class QueryCacheManager:
     """
@@ -49,6 +56,10 @@ class QueryCacheManager:
     """
 
     # pylint: disable=too-many-instance-attributes,too-many-arguments
+
+    # the Arrow buffer of the DataFrame loaded from the cache, until deserialized
+    _df_buffer: bytes | None
+
     def __init__(
         self,
         df: DataFrame = DataFrame(),
@@ -80,6 +91,41 @@ class QueryCacheManager:
         self.cache_dttm = cache_dttm
         self.cache_value = cache_value
 
+    @property
+    def df(self) -> DataFrame:
+        """
+        The DataFrame of the query result, deserialized on first access when it was
+        loaded from the cache as an Arrow buffer.
+        """
+        if self._df_buffer is not None:
+            self._df = ipc_to_df(self._df_buffer)
+            self._df_buffer = None
+        return self._df
+
+    @df.setter
+    def df(self, df: DataFrame) -> None:
+        self._df = df
+        self._df_buffer = None
+
+    @staticmethod
+    def serialize_df(df: DataFrame) -> dict[str, Any]:
+        """
+        Serialize a DataFrame to be stored in the cache, according to
+        `DATA_CACHE_DATAFRAME_FORMAT`.
+
+        :param df: the DataFrame to serialize
+        :returns: the cache value entries holding the DataFrame
+        """
+        if config["DATA_CACHE_DATAFRAME_FORMAT"] == "arrow":
+            try:
+                return {
+                    "df_arrow": df_to_ipc(df, config["DATA_CACHE_ARROW_COMPRESSION"])
+                }
+            except Exception:  # pylint: disable=broad-except
+                # e.g. mixed types or ints beyond int64, which can still be pickled
+                logger.debug("Unable to convert DataFrame to Arrow", exc_info=True)
+        return {"df": df}
+
     # pylint: disable=too-many-arguments
     def set_query_result(
         self,
@@ -111,7 +157,7 @@ class QueryCacheManager:
                 self.is_loaded = True
 
             value = {
-                "df": self.df,
+                **self.serialize_df(self.df),
                 "query": self.query,
                 "applied_template_filters": self.applied_template_filters,
                 "applied_filter_columns": self.applied_filter_columns,
@@ -125,6 +171,11 @@ class QueryCacheManager:
                     timeout=timeout,
                     datasource_uid=datasource_uid,
                     region=region,
+                    cost=(
+                        query_result.duration.total_seconds()
+                        if query_result.duration
+                        else None
+                    ),
                 )
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
@@ -144,63 +195,168 @@ class QueryCacheManager:
         """
         Initialize QueryCacheManager by query-cache key
         """
-        query_cache = cls()
-        if not key or not _cache[region] or force_query:
-            return query_cache
+        return cls.get_many([key], region, force_query, force_cached)[0]
 
-        if cache_value := _cache[region].get(key):
-            logger.debug("Cache key: %s", key)
-            stats_logger.incr("loading_from_cache")
-            try:
-                query_cache.df = cache_value["df"]
-                query_cache.query = cache_value["query"]
-                query_cache.annotation_data = cache_value.get("annotation_data", {})
-                query_cache.applied_template_filters = cache_value.get(
-                    "applied_template_filters", []
-                )
-                query_cache.applied_filter_columns = cache_value.get(
-                    "applied_filter_columns", []
-                )
-                query_cache.rejected_filter_columns = cache_value.get(
-                    "rejected_filter_columns", []
-                )
-                query_cache.status = QueryStatus.SUCCESS
-                query_cache.is_loaded = True
-                query_cache.is_cached = cache_value is not None
-                query_cache.cache_dttm = (
-                    cache_value["dttm"] if cache_value is not None else None
-                )
-                query_cache.cache_value = cache_value
-                stats_logger.incr("loaded_from_cache")
-            except KeyError as ex:
-                logger.exception(ex)
-                logger.error(
-                    "Error reading cache: %s",
-                    error_msg_from_exception(ex),
-                    exc_info=True,
+    @classmethod
+    def get_many(
+        cls,
+        keys: list[str | None],
+        region: CacheRegion = CacheRegion.DEFAULT,
+        force_query: bool | None = False,
+        force_cached: bool | None = False,
+    ) -> list[QueryCacheManager]:
+        """
+        Initialize QueryCacheManagers by query-cache keys, with a single cache read
+        """
+        if not _cache[region] or force_query:
+            return [cls() for _ in keys]
+
+        present_keys = [key for key in keys if key]
+        cache_values = (
+            dict(zip(present_keys, _cache[region].cache.get_many(*present_keys)))
+            if present_keys
+            else {}
+        )
+        query_caches = []
+        for key in keys:
+            query_cache = cls()
+            if key and (cache_value := cache_values.get(key)):
+                logger.debug("Cache key: %s", key)
+                query_cache = cls.from_cache_value(cache_value)
+                logger.debug("Serving from cache")
+
+            if key and force_cached and not query_cache.is_loaded:
+                logger.warning(
+                    "force_cached (QueryContext): value not found for key %s", key
                 )
-            logger.debug("Serving from cache")
+                raise CacheLoadError("Error loading data from cache")
+            query_caches.append(query_cache)
+        return query_caches
+
+    @classmethod
+    def from_cache_value(cls, cache_value: dict[str, Any]) -> QueryCacheManager:
+        """
+        Initialize QueryCacheManager from a value read from the cache
 
-        if force_cached and not query_cache.is_loaded:
-            logger.warning(
-                "force_cached (QueryContext): value not found for key %s", key
+        :param cache_value: the cached value
+        :returns: the QueryCacheManager, not loaded if the value is malformed
+        """
+        query_cache = cls()
+        stats_logger.incr("loading_from_cache")
+        try:
+            if "df_arrow" in cache_value:
+                query_cache._df_buffer = cache_value["df_arrow"]
+            else:
+                query_cache.df = cache_value["df"]
+            query_cache.query = cache_value["query"]
+            query_cache.annotation_data = cache_value.get("annotation_data", {})
+            query_cache.applied_template_filters = cache_value.get(
+                "applied_template_filters", []
+            )
+            query_cache.applied_filter_columns = cache_value.get(
+                "applied_filter_columns", []
+            )
+            query_cache.rejected_filter_columns = cache_value.get(
+                "rejected_filter_columns", []
+            )
+            query_cache.status = QueryStatus.SUCCESS
+            query_cache.is_loaded = True
+            query_cache.is_cached = True
+            query_cache.cache_dttm = cache_value["dttm"]
+            query_cache.cache_value = cache_value
+            stats_logger.incr("loaded_from_cache")
+        except KeyError as ex:
+            logger.exception(ex)
+            logger.error(
+                "Error reading cache: %s",
+                error_msg_from_exception(ex),
+                exc_info=True,
             )
-            raise CacheLoadError("Error loading data from cache")
         return query_cache
 
+    @classmethod
+    @contextmanager
+    def lock(
+        cls,
+        key: str | None,
+        region: CacheRegion = CacheRegion.DEFAULT,
+        force_query: bool | None = False,
+    ) -> Iterator[QueryCacheManager | None]:
+        """
+        Coalesce concurrent loads of the same cache key.
+
+        The first caller acquires a lock stored next to the key with the atomic
+        `add` of the cache backend and gets `None`, meaning it should load and cache
+        the value itself. The lock expires after `CACHE_LOCK_TTL` seconds, should
+        the caller die while holding it. Other callers wait for the value to be
+        cached, for up to `CACHE_LOCK_TIMEOUT` seconds, and get it. If the value
+        does not show up, e.g. because the query failed, they also get `None`.
+
+        :param key: the cache key about to be loaded
+        :param region: the cache region of the key
+        :param force_query: whether the value is being refreshed, bypassing the lock
+        :returns: a context manager yielding the cached value, if any
+        """
+        timeout = config["CACHE_LOCK_TIMEOUT"]
+        if not key or not _cache[region] or force_query or not timeout:
+            yield None
+            return
+
+        cache = _cache[region]
+        lock_key = f"{key}__lock"
+        lock_ttl = config["CACHE_LOCK_TTL"] or config["SUPERSET_WEBSERVER_TIMEOUT"]
+        if cache.add(lock_key, True, timeout=lock_ttl):
+            stats_logger.incr("query_cache_lock_acquired")
+            try:
+                yield None
+            finally:
+                cache.delete(lock_key)
+            return
+
+        stats_logger.incr("query_cache_lock_wait")
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(CACHE_LOCK_POLL_INTERVAL)
+            query_cache = cls.get(key, region)
+            if query_cache.is_loaded:
+                stats_logger.incr("query_cache_lock_coalesced")
+                yield query_cache
+                return
+            if not cache.has(lock_key):
+                break
+
+        logger.warning("Value for key %s was not loaded by another request", key)
+        stats_logger.incr("query_cache_lock_timeout")
+        yield None
+
     @staticmethod
-    def set(
+    def set(  # pylint: disable=too-many-arguments
         key: str | None,
         value: dict[str, Any],
         timeout: int | None = None,
         datasource_uid: str | None = None,
         region: CacheRegion = CacheRegion.DEFAULT,
+        cost: float | None = None,
     ) -> None:
         """
         set value to specify cache region, proxy for `set_and_log_cache`
         """
         if key:
-            set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
+            set_and_log_cache(
+                _cache[region], key, value, timeout, datasource_uid, cost=cost
+            )
+
+    @staticmethod
+    def add(
+        key: str | None,
+        value: Any,
+        timeout: int | None = None,
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> bool:
+        """
+        add value to specify cache region if the key doesn't exist yet
+        """
+        return bool(_cache[region].add(key, value, timeout=timeout)) if key else False
 
     @staticmethod
     def delete(
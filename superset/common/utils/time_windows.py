@@ -0,0 +1,355 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import copy
+from datetime import datetime, timedelta
+from typing import Callable, cast, TYPE_CHECKING, TypedDict
+
+import pandas as pd
+
+from superset import app
+from superset.common.utils.time_range_utils import get_since_until_from_query_object
+from superset.constants import TimeGrain
+from superset.models.sql_lab import Query
+from superset.utils.core import DTTM_ALIAS, get_base_axis_labels, get_xaxis_label
+
+if TYPE_CHECKING:
+    from superset.common.query_object import QueryObject
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.connectors.sqla.models import BaseDatasource
+    from superset.models.helpers import QueryResult
+    from superset.stats_logger import BaseStatsLogger
+
+config = app.config
+stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
+
+# Time grains whose time buckets can be checked to start at a datetime, for the
+# results of queries to be spliced together across time windows
+TIME_GRAIN_FREQUENCIES: dict[str, str] = {
+    TimeGrain.SECOND: "S",
+    TimeGrain.MINUTE: "min",
+    TimeGrain.HOUR: "H",
+    TimeGrain.DAY: "D",
+}
+
+
+class TimeWindowCoverage(TypedDict):
+    # the cached rows within the time window of the query
+    covered_df: pd.DataFrame | None
+    # the parts of the time window that are not covered by the cached rows
+    windows: list[tuple[datetime, datetime]]
+
+
+def can_splice_time_windows(
+    datasource: BaseDatasource, query_object: QueryObject, time_grain: str | None
+) -> bool:
+    """
+    Whether the results of a query object, or of its time offset queries, can be
+    spliced together from results over adjacent time windows, which requires their
+    rows to be partitioned by the time windows.
+
+    :param datasource: the datasource of the query object
+    :param query_object: the query object
+    :param time_grain: the time grain of the query object
+    :returns: whether the results can be spliced
+    """
+    return (
+        time_grain in TIME_GRAIN_FREQUENCIES
+        and not isinstance(datasource, Query)
+        and query_object.time_shift is None
+        # series are limited over the whole time window
+        and not query_object.series_limit
+    )
+
+
+def is_time_grain_aligned(dttm: datetime, time_grain: str) -> bool:
+    """
+    Whether a datetime is the start of a time bucket of the time grain.
+    """
+    timestamp = pd.Timestamp(dttm)
+    return timestamp == timestamp.floor(TIME_GRAIN_FREQUENCIES[time_grain])
+
+
+def is_truncated(query_object: QueryObject, df: pd.DataFrame) -> bool:
+    """
+    Whether the rows of a result may be truncated by the row limit of the query.
+    """
+    return bool(query_object.row_limit and len(df) >= query_object.row_limit)
+
+
+def is_spliceable_window(
+    window: tuple[datetime, datetime],
+    cached_window: tuple[datetime, datetime],
+    time_grain: str,
+) -> bool:
+    """
+    Whether the rows cached over a time window can be spliced with the results over
+    the rest of another one: the windows must overlap, and be aligned on the time
+    grain for no time bucket to be split.
+    """
+    (from_dttm, to_dttm), (cached_from_dttm, cached_to_dttm) = window, cached_window
+    return (
+        cached_from_dttm < to_dttm
+        and cached_to_dttm > from_dttm
+        and all(
+            is_time_grain_aligned(dttm, time_grain) for dttm in window + cached_window
+        )
+    )
+
+
+def get_window_rows(
+    datasource: BaseDatasource,
+    query_object: QueryObject,
+    df: pd.DataFrame,
+    window: tuple[datetime, datetime],
+) -> pd.DataFrame | None:
+    """
+    Returns the rows of a result whose time bucket is within a time window.
+
+    :param datasource: the datasource of the query object
+    :param query_object: the query object of the result
+    :param df: the rows of the result
+    :param window: the time window
+    :returns: the rows, or `None` when the result has no temporal column
+    """
+    index = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
+    if index not in df:
+        return None
+
+    # the temporal column is shifted by the offset of the datasource
+    offset = timedelta(hours=datasource.offset or 0)
+    start, end = window
+    return df[(df[index] >= start + offset) & (df[index] < end + offset)].reset_index(
+        drop=True
+    )
+
+
+def get_time_window_coverage(
+    datasource: BaseDatasource,
+    query_object: QueryObject,
+    cache: QueryCacheManager,
+    time_grain: str | None = None,
+) -> TimeWindowCoverage:
+    """
+    Returns the rows of the cached result within the time window of a time
+    offset query, and the parts of the window that remain to be queried.
+
+    :param datasource: the datasource of the query
+    :param query_object: the time offset query
+    :param cache: the cached result of the query, over any time window
+    :param time_grain: the time grain of the query, when the rows of its results
+        can be spliced together across time windows
+    :returns: the cached rows and the uncovered time windows
+    """
+    window = (
+        cast(datetime, query_object.from_dttm),
+        cast(datetime, query_object.to_dttm),
+    )
+    if not cache.is_loaded:
+        return TimeWindowCoverage(covered_df=None, windows=[window])
+
+    cache_value = cache.cache_value or {}
+    cached_window = (cache_value.get("from_dttm"), cache_value.get("to_dttm"))
+    if cached_window == window:
+        return TimeWindowCoverage(covered_df=cache.df, windows=[])
+
+    cached_from_dttm, cached_to_dttm = cached_window
+    if (
+        not time_grain
+        or not cached_from_dttm
+        or not cached_to_dttm
+        or not is_spliceable_window(
+            window, (cached_from_dttm, cached_to_dttm), time_grain
+        )
+        or is_truncated(query_object, cache.df)
+    ):
+        return TimeWindowCoverage(covered_df=None, windows=[window])
+
+    covered_df = get_window_rows(datasource, query_object, cache.df, window)
+    if covered_df is None:
+        return TimeWindowCoverage(covered_df=None, windows=[window])
+
+    windows = [
+        (start, end)
+        for start, end in ((window[0], cached_from_dttm), (cached_to_dttm, window[1]))
+        if start < end
+    ]
+    stats_logger.incr("time_offset_cache_spliced")
+    return TimeWindowCoverage(covered_df=covered_df, windows=windows)
+
+
+def get_settled_coverage(
+    datasource: BaseDatasource,
+    query_object: QueryObject,
+    cache: QueryCacheManager,
+    time_grain: str,
+) -> TimeWindowCoverage:
+    """
+    Returns the rows of the settled time buckets of a previous result within the
+    time window of a query object, and the parts of the window that remain to be
+    queried.
+
+    :param datasource: the datasource of the query object
+    :param query_object: the query object
+    :param cache: the previous result of the query, over any time window
+    :param time_grain: the time grain of the query
+    :returns: the settled rows and the uncovered time windows
+    """
+    window = (
+        cast(datetime, query_object.from_dttm),
+        cast(datetime, query_object.to_dttm),
+    )
+    cache_value = cache.cache_value or {}
+    cached_from_dttm = cache_value.get("from_dttm")
+    settled_dttm = cache_value.get("settled_dttm")
+    if (
+        not cache.is_loaded
+        or not cached_from_dttm
+        or not settled_dttm
+        or is_truncated(query_object, cache.df)
+    ):
+        return TimeWindowCoverage(covered_df=None, windows=[window])
+
+    # the first time bucket of a window is partial unless the window starts with
+    # it, so only the buckets after the start of both windows are reused
+    freq = TIME_GRAIN_FREQUENCIES[time_grain]
+    start = max(
+        pd.Timestamp(window[0]).ceil(freq),
+        pd.Timestamp(cached_from_dttm).ceil(freq),
+    ).to_pydatetime()
+    end = min(settled_dttm, pd.Timestamp(window[1]).floor(freq).to_pydatetime())
+    covered_df = (
+        get_window_rows(datasource, query_object, cache.df, (start, end))
+        if start < end
+        else None
+    )
+    if covered_df is None:
+        return TimeWindowCoverage(covered_df=None, windows=[window])
+
+    windows = [
+        (window_start, window_end)
+        for window_start, window_end in ((window[0], start), (end, window[1]))
+        if window_start < window_end
+    ]
+    stats_logger.incr("incremental_cache_spliced")
+    return TimeWindowCoverage(covered_df=covered_df, windows=windows)
+
+
+def has_time_buckets(query_object: QueryObject) -> bool:
+    """
+    Whether the time buckets of a query object are part of its result.
+    """
+    return bool(
+        (query_object.is_timeseries or get_base_axis_labels(query_object.columns))
+        and (query_object.granularity or get_xaxis_label(query_object.columns))
+    )
+
+
+def is_filtered_on_window(
+    query_object: QueryObject, window: tuple[datetime, datetime]
+) -> bool:
+    """
+    Whether a query object is filtered on a time window, if at all, for its results
+    to be merged on the bounds of the window.
+    """
+    return query_object.from_dttm in (None, window[0]) and query_object.to_dttm in (
+        None,
+        window[1],
+    )
+
+
+def get_incremental_query_object(
+    datasource: BaseDatasource, query_object: QueryObject, time_grain: str | None
+) -> QueryObject | None:
+    """
+    Returns a copy of the query object filtered on its time window with its
+    temporal x-axis, when its result can be updated incrementally.
+
+    :param datasource: the datasource of the query object
+    :param query_object: the query object
+    :param time_grain: the time grain of the query object
+    :returns: the query object to run incrementally, or `None` when its rows are not
+        partitioned by time buckets
+    """
+    from_dttm, to_dttm = get_since_until_from_query_object(query_object)
+    if (
+        not from_dttm
+        or not to_dttm
+        or not can_splice_time_windows(datasource, query_object, time_grain)
+        or not has_time_buckets(query_object)
+        or not is_filtered_on_window(query_object, (from_dttm, to_dttm))
+    ):
+        return None
+
+    xaxis_label = get_xaxis_label(query_object.columns)
+    incremental_query_object = get_time_window_query_object(
+        query_object, (from_dttm, to_dttm)
+    )
+    incremental_query_object.granularity = query_object.granularity or xaxis_label
+    incremental_query_object.filter = [
+        flt for flt in query_object.filter if flt.get("col") != xaxis_label
+    ]
+    incremental_query_object.time_offsets = []
+    incremental_query_object.post_processing = []
+    return incremental_query_object
+
+
+def get_time_window_query_object(
+    query_object: QueryObject, window: tuple[datetime, datetime]
+) -> QueryObject:
+    """
+    Returns a copy of a query object over another time window.
+    """
+    window_query_object = copy.copy(query_object)
+    window_query_object.from_dttm, window_query_object.to_dttm = window
+    return window_query_object
+
+
+def splice_time_window_results(
+    query_object: QueryObject,
+    covered_df: pd.DataFrame | None,
+    results: list[QueryResult],
+    normalize_df: Callable[[pd.DataFrame, QueryObject], pd.DataFrame],
+) -> pd.DataFrame | None:
+    """
+    Returns the result of a query spliced from the cached rows and the results over
+    the uncovered parts of its time window.
+
+    :param query_object: the query
+    :param covered_df: the cached rows within the time window of the query
+    :param results: the results over the uncovered parts of the time window
+    :param normalize_df: the function normalizing the results of the query
+    :returns: the normalized result, or `None` when it may be truncated by the
+        row limit of the query
+    """
+    dfs = [
+        normalize_df(result.df, query_object)
+        for result in results
+        if not result.df.empty
+    ]
+    if covered_df is None and len(results) == 1:
+        return dfs[0] if dfs else results[0].df
+
+    if covered_df is not None and not covered_df.empty:
+        dfs.insert(0, covered_df)
+    df = pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
+    if is_truncated(query_object, df) or any(
+        is_truncated(query_object, result.df) for result in results
+    ):
+        return None
+    return df
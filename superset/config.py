@@ -676,11 +676,93 @@ IMG_UPLOAD_URL = "/static/uploads/"
 CACHE_DEFAULT_TIMEOUT = int(timedelta(days=1).total_seconds())
 
 # Default cache for Superset objects
+#
+# Setting `CACHE_LOCAL_MAX_SIZE` to a number of bytes in the config of a cache, e.g.
+# `CACHE_CONFIG` or `DATA_CACHE_CONFIG`, enables an in-process LRU cache of that size
+# in front of it, so each worker can serve the values it recently read or wrote
+# without fetching them. Values are checked against a version stamp stored in the
+# shared cache before being served, so changes made by other workers are seen. Values
+# are kept locally when read, not when written.
 CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# How long, in seconds, chart data stays in the data cache after its cache timeout has
+# elapsed. Within that window the expired data is still served, flagged as stale, while
+# a Celery task refreshes it in the background, so viewers don't wait for the query.
+# It can be set per chart or per dataset with the `stale_while_revalidate` key of the
+# chart params or of the dataset extra. 0 disables it.
+DATA_CACHE_STALE_WHILE_REVALIDATE = 0
+
+# Time series chart queries on a rolling time range (e.g. "Last 7 days") can be updated
+# incrementally: their previous result is kept in the data cache, and only the time
+# buckets that are more recent than this many seconds, or not covered by the previous
+# result, are queried again and merged with it. This only applies to queries grouped
+# by a time grain of a day or less, without series limit, and assumes the rows of
+# older buckets don't change anymore. It can be set per chart or per dataset with the
+# `incremental_settled_after` key of the chart params or of the dataset extra.
+# 0 disables it.
+DATA_CACHE_INCREMENTAL_SETTLED_AFTER = 0
+
+# How long, in seconds, the results of the queries updated incrementally are kept.
+DATA_CACHE_INCREMENTAL_TIMEOUT = int(timedelta(days=1).total_seconds())
+
+# The format of the DataFrames stored in the data cache. "arrow" stores them as Arrow
+# IPC buffers, which are smaller and faster to load than pickled DataFrames and don't
+# depend on the pandas version. DataFrames that can't be converted to Arrow, and all
+# DataFrames when set to "pickle", are stored as is and pickled by the cache backend.
+DATA_CACHE_DATAFRAME_FORMAT: Literal["arrow", "pickle"] = "arrow"
+
+# The codec used to compress the Arrow buffers stored in the data cache, one of "zstd",
+# "lz4" or None.
+DATA_CACHE_ARROW_COMPRESSION: Literal["zstd", "lz4"] | None = "lz4"
+
+# Also cache the results of chart queries before their post processing (pivots, rolling
+# windows, ...), so that charts running the same query with different post processing
+# only post process the cached result rather than running the query again.
+DATA_CACHE_RAW_QUERY_RESULTS = True
+
+# The maximum number of time comparison queries of a chart query that run concurrently,
+# each in its own thread and with its own database connection. Defaults to 1, running
+# them one after the other. Raising it is safer combined with `DATABASE_ENGINE_POOLING`,
+# so that the threads don't open a new database connection each.
+TIME_OFFSET_QUERIES_MAX_WORKERS = 1
+
+# The maximum number of queries of a chart data request missing from the cache, e.g.
+# the queries of a mixed chart or the totals of a table, that run concurrently, each
+# in its own thread and with its own database connection. Defaults to 1, running them
+# one after the other. Raising it is safer combined with `DATABASE_ENGINE_POOLING`, so
+# that the threads don't open a new database connection each.
+QUERY_CONTEXT_MAX_WORKERS = 1
+
+# When several chart data requests miss the cache on the same query, only the first
+# one runs it, while the others wait up to this many seconds for its result to be
+# cached. This relies on the atomic `add` of the cache backend, so the lock is only
+# shared across workers when the cache is too (e.g. Redis). Set to 0 to disable.
+CACHE_LOCK_TIMEOUT = 30
+# The lock held by the request running the query expires after this many seconds,
+# so that a request dying while holding it doesn't block the others. It should
+# outlast the queries, and defaults to `SUPERSET_WEBSERVER_TIMEOUT`, past which the
+# request running the query is gone anyway.
+CACHE_LOCK_TTL: int | None = None
+
+# The row level security filters of a table for a set of roles are kept for this many
+# seconds in the cache defined by `CACHE_CONFIG`, on top of being memoized for the
+# duration of each request. They are invalidated whenever a filter changes, the
+# timeout bounding how long a change committed concurrently can go unnoticed. Set to 0
+# to only memoize them per request.
+RLS_FILTERS_CACHE_TIMEOUT = 60
+
+# Admission policy of the data cache, so that large one-off results don't evict the
+# smaller ones read by dashboards. Results larger than `DATA_CACHE_MAX_ENTRY_SIZE`
+# bytes are not cached. Results larger than `DATA_CACHE_MAX_SIZE_PER_SECOND` bytes per
+# second their query took, i.e. that are cheap to compute again for their size, are
+# only cached for `DATA_CACHE_DOWNTIER_TIMEOUT` seconds. None disables a limit.
+DATA_CACHE_MAX_ENTRY_SIZE: int | None = None
+DATA_CACHE_MAX_SIZE_PER_SECOND: int | None = None
+DATA_CACHE_DOWNTIER_TIMEOUT = int(timedelta(minutes=1).total_seconds())
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -712,6 +794,11 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
+# Fold a generation counter kept in the data cache for each datasource into the cache
+# keys of its data, so that invalidating the data of a datasource is a single
+# increment of its counter, without storing its cache keys in the metadata database.
+DATA_CACHE_DATASOURCE_GENERATIONS = True
+
 # CORS Options
 ENABLE_CORS = False
 CORS_OPTIONS: dict[Any, Any] = {}
@@ -764,6 +851,14 @@ CSV_EXPORT = {"encoding": "utf-8"}
 # note: index option should not be overridden
 EXCEL_EXPORT: dict[str, Any] = {}
 
+# Parquet Options: key/value pairs that will be passed as argument to the
+# superset.utils.arrow.iter_parquet function, e.g. row_group_size or compression.
+PARQUET_EXPORT: dict[str, Any] = {}
+
+# Maximum number of rows per record batch when chart data is returned as an
+# Arrow IPC stream (`result_format=arrow`). `None` writes the table as is.
+ARROW_RESULT_BATCH_SIZE: int | None = 64 * 1024
+
 # ---------------------------------------------------
 # Time grain configurations
 # ---------------------------------------------------
@@ -946,6 +1041,16 @@ HTTP_HEADERS: dict[str, Any] = {}
 # The db id here results in selecting this one as a default in SQL Lab
 DEFAULT_DB_ID = None
 
+# The number of rows fetched at once from the cursors of chart queries, which are
+# converted to Arrow one batch after the other, so that only the rows of a single batch
+# are held as Python objects at a time.
+SQL_QUERY_FETCH_BATCH_SIZE = 10000
+
+# Abort the chart and SQL Lab queries whose rows, as fetched from the database, are
+# estimated to take more than this number of bytes, before they exhaust the memory of
+# the workers. None disables the limit.
+SQL_QUERY_MAX_RESULT_BYTES: int | None = None
+
 # Timeout duration for SQL Lab synchronous queries
 SQLLAB_TIMEOUT = int(timedelta(seconds=30).total_seconds())
 
@@ -1028,6 +1133,26 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# The codec used to compress the payloads stored in the results backend, one of
+# "legacy", "zstd", "lz4", "zlib" or "none". Payloads are self-describing, so
+# changing the codec does not invalidate the results already stored. Only "legacy",
+# the headerless zlib format, can be read by the workers of previous releases, so
+# switch to another codec once all of them are upgraded.
+RESULTS_BACKEND_COMPRESSION: Literal["legacy", "zstd", "lz4", "zlib", "none"] = "legacy"
+
+# The codec used to compress the Arrow buffers of the results stored in the results
+# backend when RESULTS_BACKEND_USE_MSGPACK is enabled, one of "zstd", "lz4" or None.
+# When enabled, consider setting RESULTS_BACKEND_COMPRESSION to "none" so the data
+# isn't compressed twice.
+RESULTS_BACKEND_ARROW_COMPRESSION: Literal["zstd", "lz4"] | None = None
+
+# When set, asynchronous SQL Lab queries fetch their results in batches of this many
+# rows, and store each batch as its own Arrow chunk in the results backend as soon as
+# it is fetched, instead of holding the whole result in the worker's memory. Reading
+# the results then only loads the chunks needed for the rows being displayed.
+# Requires RESULTS_BACKEND_USE_MSGPACK.
+SQLLAB_RESULTS_BACKEND_CHUNK_SIZE: int | None = None
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1155,6 +1280,13 @@ TRACKING_URL_TRANSFORMER = lambda url: url
 # customize the polling time of each engine
 DB_POLL_INTERVAL_SECONDS: dict[str, int] = {}
 
+# Running queries are first polled after DB_POLL_MIN_INTERVAL_SECONDS, and the interval
+# between polls is then multiplied by DB_POLL_BACKOFF_FACTOR, with some jitter, after
+# each poll without progress, up to the polling time of the engine above, or
+# PRESTO_POLL_INTERVAL. Set the factor to 1 to poll at the minimum interval.
+DB_POLL_MIN_INTERVAL_SECONDS = 0.1
+DB_POLL_BACKOFF_FACTOR = 2
+
 # Interval between consecutive polls when using Presto Engine
 # See here: https://github.com/dropbox/PyHive/blob/8eb0aeab8ca300f3024655419b93dad926c1a351/pyhive/presto.py#L93  # pylint: disable=line-too-long,useless-suppression
 PRESTO_POLL_INTERVAL = int(timedelta(seconds=1).total_seconds())
@@ -1192,6 +1324,41 @@ DASHBOARD_TEMPLATE_ID = None
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# Keep the SQLAlchemy engines of the databases in a registry of each process, so that
+# queries check out pooled connections instead of creating an engine and opening a
+# connection each. Engines are keyed on the URL, the connection arguments and the
+# impersonated user, and are disposed of when the connection settings of their
+# database change. Their pools are configured by the `pool_size`, `max_overflow`,
+# `pool_recycle` and `pool_pre_ping` engine parameters in the extra of each database,
+# defaulting to `DATABASE_ENGINE_POOL_DEFAULTS`. At most
+# `DATABASE_ENGINE_REGISTRY_MAX_SIZE` engines are kept, e.g. when impersonating many
+# users. Databases reached through SSH tunnels are not pooled.
+DATABASE_ENGINE_POOLING = False
+DATABASE_ENGINE_POOL_DEFAULTS: dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+DATABASE_ENGINE_REGISTRY_MAX_SIZE = 100
+
+# Limit the number of queries running at once on each database, across the web and
+# Celery workers, with slots held in the cache of `CACHE_CONFIG`, which should be
+# shared by all of them (e.g. Redis). The limits are keyed on the name of the database,
+# defaulting to `DATABASE_QUERY_CONCURRENCY_DEFAULT_LIMIT`, and each user can
+# additionally be limited to `DATABASE_QUERY_CONCURRENCY_USER_LIMIT` queries on each
+# database. Queries waiting for a slot are queued for up to
+# `DATABASE_QUERY_QUEUE_TIMEOUT` seconds, those of dashboards, charts and SQL Lab
+# being admitted before background ones, e.g. of reports and cache warm-ups. Slots are
+# released after `DATABASE_QUERY_SLOT_TIMEOUT` seconds should their worker die.
+# Example:
+#   DATABASE_QUERY_CONCURRENCY_LIMITS = {"examples": 10}
+DATABASE_QUERY_CONCURRENCY_LIMITS: dict[str, int] = {}
+DATABASE_QUERY_CONCURRENCY_DEFAULT_LIMIT: int | None = None
+DATABASE_QUERY_CONCURRENCY_USER_LIMIT: int | None = None
+DATABASE_QUERY_QUEUE_TIMEOUT = int(timedelta(minutes=1).total_seconds())
+DATABASE_QUERY_SLOT_TIMEOUT = int(timedelta(hours=1).total_seconds())
+
 
 # A function that intercepts the SQL to be executed and can alter it.
 # The use case is can be around adding some sort of comment header
@@ -2120,3 +2120,21 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(Text, nullable=False)
+
+
+sa.event.listen(
+    RowLevelSecurityFilter, "after_insert", security_manager.rls_filters_after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_update", security_manager.rls_filters_after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_delete", security_manager.rls_filters_after_change
+)
+# deleting a role or a table deletes the rows of the association tables
+sa.event.listen(
+    security_manager.role_model,
+    "after_delete",
+    security_manager.rls_filters_after_change,
+)
+sa.event.listen(SqlaTable, "after_delete", security_manager.rls_filters_after_change)
@@ -19,12 +19,22 @@
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import (
+    infer_dtype,
+    is_bool_dtype,
+    is_integer_dtype,
+    is_object_dtype,
+)
 
 from superset.utils.core import JS_MAX_INTEGER
 
 logger = logging.getLogger(__name__)
 
+# inferred types of object columns that may hold Python integers
+_INTEGER_INFERRED_TYPES = {"integer", "mixed-integer", "mixed-integer-float", "mixed"}
+
 
 def _convert_big_integers(val: Any) -> Any:
     """
@@ -37,6 +47,34 @@ def _convert_big_integers(val: Any) -> Any:
     return str(val) if isinstance(val, int) and abs(val) > JS_MAX_INTEGER else val
 
 
+def _column_to_list(column: pd.Series) -> list[Any]:
+    """
+    Convert a column to a list of Python objects, casting integers larger than
+    ``JS_MAX_INTEGER`` to strings.
+
+    Integer columns are checked with a vectorized comparison; only object and
+    categorical columns, which may hold arbitrary Python integers, are checked
+    value by value.
+
+    :param column: the column to convert
+    :returns: the values of the column
+    """
+    values = column.tolist()
+    dtype = column.dtype
+
+    if is_integer_dtype(dtype) and not is_bool_dtype(dtype):
+        is_big = (column > JS_MAX_INTEGER) | (column < -JS_MAX_INTEGER)
+        for idx in np.flatnonzero(is_big.to_numpy(dtype=bool, na_value=False)):
+            values[idx] = str(values[idx])
+    elif (
+        is_object_dtype(dtype)
+        and infer_dtype(values, skipna=True) in _INTEGER_INFERRED_TYPES
+    ) or isinstance(dtype, pd.CategoricalDtype):
+        values = [_convert_big_integers(val) for val in values]
+
+    return values
+
+
 def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
     """
     Convert a DataFrame to a set of records.
@@ -48,8 +86,26 @@ def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
         logger.warning(
             "DataFrame columns are not unique, some columns will be omitted."
         )
-    columns = dframe.columns
-    return list(
-        dict(zip(columns, map(_convert_big_integers, row)))
-        for row in zip(*[dframe[col] for col in columns])
-    )
+    columns = list(dframe.columns)
+    values = [_column_to_list(dframe.iloc[:, idx]) for idx in range(len(columns))]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def df_to_columns(dframe: pd.DataFrame) -> dict[str, list[Any]]:
+    """
+    Convert a DataFrame to a columnar mapping of column name to values.
+
+    Unlike `df_to_records` no dictionary is allocated per row, which makes this
+    shape considerably cheaper to build and to serialize for large results.
+
+    :param dframe: the DataFrame to convert
+    :returns: a dictionary holding the list of values of each column
+    """
+    if not dframe.columns.is_unique:
+        logger.warning(
+            "DataFrame columns are not unique, some columns will be omitted."
+        )
+    return {
+        column: _column_to_list(dframe.iloc[:, idx])
+        for idx, column in enumerate(dframe.columns)
+    }
@@ -20,8 +20,13 @@ from __future__ import annotations
 
 import json
 import logging
+import random
 import re
+import sys
+import time
+from collections.abc import Iterator, Sequence
 from datetime import datetime
+from operator import itemgetter
 from re import Match, Pattern
 from typing import (
     Any,
@@ -59,6 +64,7 @@ from superset import security_manager, sql_parse
 from superset.constants import TimeGrain as TimeGrainConstants
 from superset.databases.utils import make_url_safe
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
+from superset.exceptions import SupersetResultTooLargeException
 from superset.sql_parse import ParsedQuery, Table
 from superset.superset_typing import ResultSetColumnType, SQLAColumnType
 from superset.utils import core as utils
@@ -146,6 +152,52 @@ def compile_timegrain_expression(
     return element.name.replace("{col}", compiler.process(element.col, **kwargs))
 
 
+class QueryPoller:  # pylint: disable=too-few-public-methods
+    """
+    Wait between the polls of a running query, for intervals growing exponentially
+    from the minimum interval up to the maximum one, so that short queries are seen
+    finished quickly while long ones don't overload the database with polls. The
+    interval stops growing while the query reports progress, and is jittered so that
+    concurrent queries don't poll in lockstep.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        engine: str,
+        min_interval: float,
+        max_interval: float,
+        factor: float = 2,
+        jitter: float = 0.1,
+    ) -> None:
+        self.engine = engine
+        self.max_interval = max_interval
+        self.interval = min(min_interval, max_interval)
+        self.factor = factor
+        self.jitter = jitter
+        self.progress: float | None = None
+
+    def sleep(self, progress: float | None = None) -> float:
+        """
+        Wait before the next poll.
+
+        :param progress: The progress reported by the query, if any
+        :return: The time waited, in seconds
+        """
+        interval = min(
+            self.interval * random.uniform(1 - self.jitter, 1 + self.jitter),
+            self.max_interval,
+        )
+        current_app.config["STATS_LOGGER"].timing(
+            f"{self.engine}.poll_interval", interval * 1000
+        )
+        time.sleep(interval)
+
+        if progress is None or progress <= (self.progress or 0):
+            self.interval = min(self.interval * self.factor, self.max_interval)
+        self.progress = progress
+        return interval
+
+
 class LimitMethod:  # pylint: disable=too-few-public-methods
     """Enum the ways that limits can be applied"""
 
@@ -756,35 +808,165 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         """
         if cls.arraysize:
             cursor.arraysize = cls.arraysize
-        try:
-            if cls.limit_method == LimitMethod.FETCH_MANY and limit:
+        if cls.limit_method == LimitMethod.FETCH_MANY and limit:
+            try:
                 return cursor.fetchmany(limit)
-            data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
+            except Exception as ex:
+                raise cls.get_dbapi_mapped_exception(ex) from ex
+
+        if max_bytes := current_app.config["SQL_QUERY_MAX_RESULT_BYTES"]:
+            # fetch in batches, so that large results are aborted early
+            data = [
+                row
+                for batch in cls._fetch_batches(
+                    cursor,
+                    current_app.config["SQL_QUERY_FETCH_BATCH_SIZE"],
+                    max_bytes=max_bytes,
+                )
+                for row in batch
+            ]
+        else:
+            try:
+                data = cursor.fetchall()
+            except Exception as ex:
+                raise cls.get_dbapi_mapped_exception(ex) from ex
+        return cls._mutate_column_types(data, cursor.description or [])
+
+    @classmethod
+    def fetch_data_batches(
+        cls,
+        cursor: Any,
+        batch_size: int,
+        limit: int | None = None,
+        max_bytes: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Fetch the results of the cursor in batches, using `fetchmany`.
+
+        Engine specs that post-process the rows in `fetch_data` need to do the same
+        for each batch here.
+
+        :param cursor: Cursor instance
+        :param batch_size: Maximum number of rows in each batch
+        :param limit: Maximum number of rows to be returned by the cursor
+        :param max_bytes: Maximum estimated size of the rows to be returned
+        :return: Iterator over the batches of the result
+        :raises SupersetResultTooLargeException: If the rows exceed `max_bytes`
+        """
+        if cls.arraysize:
+            cursor.arraysize = cls.arraysize
+        description = cursor.description
+        if not description:
+            return
+
+        for data in cls._fetch_batches(cursor, batch_size, limit, max_bytes):
+            yield cls._mutate_column_types(data, description)
+
+    @classmethod
+    def _fetch_batches(
+        cls,
+        cursor: Any,
+        batch_size: int,
+        limit: int | None = None,
+        max_bytes: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Fetch the rows of the cursor in batches, as returned by the cursor.
+
+        :param cursor: Cursor instance
+        :param batch_size: Maximum number of rows in each batch
+        :param limit: Maximum number of rows to be returned by the cursor
+        :param max_bytes: Maximum estimated size of the rows to be returned
+        :return: Iterator over the batches of the result
+        :raises SupersetResultTooLargeException: If the rows exceed `max_bytes`
+        """
+        remaining = limit
+        size = 0
+        while remaining is None or remaining > 0:
+            try:
+                data = cursor.fetchmany(
+                    batch_size if remaining is None else min(batch_size, remaining)
+                )
+            except Exception as ex:
+                raise cls.get_dbapi_mapped_exception(ex) from ex
+            if not data:
+                return
+
+            if max_bytes:
+                size += cls._estimate_size(data)
+                if size > max_bytes:
+                    raise SupersetResultTooLargeException(
+                        __(
+                            "The query returned more than %(max_bytes)s bytes of "
+                            "data. Please add filters or lower the row limit.",
+                            max_bytes=max_bytes,
+                        )
                     )
+            yield data
+            if remaining is not None:
+                remaining -= len(data)
+
+    @staticmethod
+    def _estimate_size(data: Sequence[Sequence[Any]]) -> int:
+        """
+        Estimate the memory used by rows, from the size of a sample of them.
+
+        :param data: The rows
+        :return: The estimated size, in bytes
+        """
+        sample = data[:100]
+        if not sample:
+            return 0
+        size = sum(
+            sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+            for row in sample
+        )
+        return size * len(data) // len(sample)
+
+    @classmethod
+    def _mutate_column_types(
+        cls, data: list[tuple[Any, ...]], description: Sequence[Any]
+    ) -> list[tuple[Any, ...]]:
+        """
+        Normalize the values of the columns with a type in `column_type_mutators`.
+
+        :param data: The rows to normalize, updated in place
+        :param description: The cursor description
+        :return: The normalized rows
+        """
+        # Create a mapping between column index and a mutator function to normalize
+        # values with. The first two items in the description row are
+        # the column name and type.
+        column_mutators = {
+            idx: func
+            for idx, row in enumerate(description)
+            if (
+                func := cls.column_type_mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
                 )
-            }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
-                for row_idx, row in enumerate(data):
-                    new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
-                        new_row[col_idx] = func(row[col_idx])
-                    data[row_idx] = tuple(new_row)
-
-            return data
-        except Exception as ex:
-            raise cls.get_dbapi_mapped_exception(ex) from ex
+            )
+        }
+        if column_mutators and data:
+            # mutate whole columns, and rebuild the rows once from them
+            columns = [
+                list(map(func, map(itemgetter(idx), data)))
+                if (func := column_mutators.get(idx))
+                else map(itemgetter(idx), data)
+                for idx in range(len(description))
+            ]
+            data[:] = zip(*columns)
+
+        return data
+
+    @classmethod
+    def expands_data(cls) -> bool:
+        """
+        Whether `expand_data` changes the rows of the results, in which case they are
+        expanded as a whole before being paged.
+
+        :return: whether the results are expanded
+        """
+        return False
 
     @classmethod
     def expand_data(
@@ -1069,6 +1251,22 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         """
         return None
 
+    @classmethod
+    def get_query_poller(cls, max_interval: float) -> QueryPoller:
+        """
+        Get the poller waiting between the polls of a running query in
+        `handle_cursor`, starting at `DB_POLL_MIN_INTERVAL_SECONDS`.
+
+        :param max_interval: The maximum interval between polls, in seconds
+        :return: The poller
+        """
+        return QueryPoller(
+            engine=cls.engine,
+            min_interval=current_app.config["DB_POLL_MIN_INTERVAL_SECONDS"],
+            max_interval=max_interval,
+            factor=current_app.config["DB_POLL_BACKOFF_FACTOR"],
+        )
+
     @classmethod
     def handle_cursor(cls, cursor: Any, query: Query) -> None:
         """Handle a live cursor between the execute and fetchall calls
@@ -18,6 +18,7 @@ import contextlib
 import json
 import re
 import urllib
+from collections.abc import Iterator
 from datetime import datetime
 from re import Pattern
 from typing import Any, Optional, TYPE_CHECKING, TypedDict
@@ -244,6 +245,20 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
             data = [r.values() for r in data]  # type: ignore
         return data
 
+    @classmethod
+    def fetch_data_batches(
+        cls,
+        cursor: Any,
+        batch_size: int,
+        limit: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        for data in super().fetch_data_batches(cursor, batch_size, limit, max_bytes):
+            # Support type BigQuery Row, see `fetch_data`
+            if type(data[0]).__name__ == "Row":
+                data = [r.values() for r in data]  # type: ignore
+            yield data
+
     @staticmethod
     def _mutate_label(label: str) -> str:
         """
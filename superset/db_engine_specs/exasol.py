@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from collections.abc import Iterator
 from typing import Any, Optional
 
 from superset.constants import TimeGrain
@@ -47,3 +48,14 @@ class ExasolEngineSpec(BaseEngineSpec):  # pylint: disable=abstract-method
         data = super().fetch_data(cursor, limit)
         # Lists of `pyodbc.Row` need to be unpacked further
         return cls.pyodbc_rows_to_tuples(data)
+
+    @classmethod
+    def fetch_data_batches(
+        cls,
+        cursor: Any,
+        batch_size: int,
+        limit: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        for data in super().fetch_data_batches(cursor, batch_size, limit, max_bytes):
+            yield cls.pyodbc_rows_to_tuples(data)
@@ -20,7 +20,6 @@ import logging
 import os
 import re
 import tempfile
-import time
 from datetime import datetime
 from typing import Any, TYPE_CHECKING
 from urllib import parse
@@ -344,6 +343,15 @@ class HiveEngineSpec(PrestoEngineSpec):
             hive.ttypes.TOperationState.INITIALIZED_STATE,
             hive.ttypes.TOperationState.RUNNING_STATE,
         )
+        if sleep_interval := current_app.config.get("HIVE_POLL_INTERVAL"):
+            logger.warning(
+                "HIVE_POLL_INTERVAL is deprecated and will be removed in 3.0. Please use DB_POLL_INTERVAL_SECONDS instead"
+            )
+        else:
+            sleep_interval = current_app.config["DB_POLL_INTERVAL_SECONDS"].get(
+                cls.engine, 5
+            )
+        poller = cls.get_query_poller(sleep_interval)
         polled = cursor.poll()
         last_log_line = 0
         tracking_url = None
@@ -397,15 +405,7 @@ class HiveEngineSpec(PrestoEngineSpec):
                     last_log_line = len(log_lines)
                 if needs_commit:
                     db.session.commit()
-            if sleep_interval := current_app.config.get("HIVE_POLL_INTERVAL"):
-                logger.warning(
-                    "HIVE_POLL_INTERVAL is deprecated and will be removed in 3.0. Please use DB_POLL_INTERVAL_SECONDS instead"
-                )
-            else:
-                sleep_interval = current_app.config["DB_POLL_INTERVAL_SECONDS"].get(
-                    cls.engine, 5
-                )
-            time.sleep(sleep_interval)
+            poller.sleep(query.progress)
             polled = cursor.poll()
 
     @classmethod
@@ -16,7 +16,6 @@
 # under the License.
 import logging
 import re
-import time
 from datetime import datetime
 from typing import Any, Optional
 
@@ -110,6 +109,9 @@ class ImpalaEngineSpec(BaseEngineSpec):
             "RUNNING_STATE",
         )
 
+        poller = cls.get_query_poller(
+            current_app.config["DB_POLL_INTERVAL_SECONDS"].get(cls.engine, 5)
+        )
         try:
             status = cursor.status()
             while status in unfinished_states:
@@ -146,10 +148,7 @@ class ImpalaEngineSpec(BaseEngineSpec):
 
                     if needs_commit:
                         db.session.commit()
-                sleep_interval = current_app.config["DB_POLL_INTERVAL_SECONDS"].get(
-                    cls.engine, 5
-                )
-                time.sleep(sleep_interval)
+                poller.sleep(query.progress)
                 status = cursor.status()
         except Exception:  # pylint: disable=broad-except
             logger.debug("Call to status() failed ")
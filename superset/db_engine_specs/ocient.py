@@ -18,6 +18,7 @@
 import contextlib
 import re
 import threading
+from collections.abc import Iterator
 from re import Pattern
 from typing import Any, Callable, List, NamedTuple, Optional
 
@@ -356,6 +357,20 @@ class OcientEngineSpec(BaseEngineSpec):
                 ]
         return rows
 
+    @classmethod
+    def fetch_data_batches(
+        cls,
+        cursor: Any,
+        batch_size: int,
+        limit: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        # the rows are sanitized and the query id mapping cleaned up in
+        # `fetch_data`, so fetch everything as a single batch, whose size is limited
+        # by `SQL_QUERY_MAX_RESULT_BYTES`
+        if rows := cls.fetch_data(cursor, limit):
+            yield rows
+
     @classmethod
     def epoch_to_dttm(cls) -> str:
         return "DATEADD(S, {col}, '1970-01-01')"
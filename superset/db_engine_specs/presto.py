@@ -20,7 +20,6 @@ from __future__ import annotations
 import contextlib
 import logging
 import re
-import time
 from abc import ABCMeta
 from collections import defaultdict, deque
 from datetime import datetime
@@ -1109,6 +1108,10 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
             presto_cols,
         )
 
+    @classmethod
+    def expands_data(cls) -> bool:
+        return is_feature_enabled("PRESTO_EXPAND_DATA")
+
     @classmethod
     def expand_data(  # pylint: disable=too-many-locals
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1136,7 +1139,7 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
         :return: list of all columns(selected columns and their nested fields),
                  expanded data set, listed of nested fields
         """
-        if not is_feature_enabled("PRESTO_EXPAND_DATA"):
+        if not cls.expands_data():
             return columns, data, []
 
         # process each column, unnesting ARRAY types and
@@ -1297,6 +1300,7 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
         poll_interval = query.database.connect_args.get(
             "poll_interval", current_app.config["PRESTO_POLL_INTERVAL"]
         )
+        poller = cls.get_query_poller(poll_interval)
         logger.info("Query %i: Polling the cursor for progress", query_id)
         polled = cursor.poll()
         # poll returns dict -- JSON status information or ``None``
@@ -1332,7 +1336,7 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
                     if progress > query.progress:
                         query.progress = progress
                     db.session.commit()
-            time.sleep(poll_interval)
+            poller.sleep(query.progress)
             logger.info("Query %i: Polling the cursor for progress", query_id)
             polled = cursor.poll()
 
@@ -19,7 +19,6 @@ from __future__ import annotations
 import contextlib
 import logging
 import threading
-import time
 from typing import Any, TYPE_CHECKING
 
 import simplejson as json
@@ -224,8 +223,11 @@ class TrinoEngineSpec(PrestoBaseEngineSpec):
 
         # Wait for a query ID to be available before handling the cursor, as
         # it's required by that method; it may never become available on error.
+        poller = cls.get_query_poller(
+            current_app.config["DB_POLL_INTERVAL_SECONDS"].get(cls.engine, 1)
+        )
         while not cursor.query_id and not execute_event.is_set():
-            time.sleep(0.1)
+            poller.sleep()
 
         logger.debug("Query %d: Handling cursor", query_id)
         cls.handle_cursor(cursor, query)
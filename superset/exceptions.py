@@ -208,6 +208,14 @@ class QueryObjectValidationError(SupersetException):
     status = 400
 
 
+class SupersetResultTooLargeException(SupersetException):
+    status = 400
+
+
+class QueryQueueTimeoutException(SupersetException):
+    status = 429
+
+
 class AdvancedDataTypeResponseError(SupersetException):
     status = 400
 
@@ -53,7 +53,7 @@ from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapper, relationship
 from sqlalchemy.pool import NullPool
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import ColumnElement, expression, Select
@@ -75,6 +75,8 @@ from superset.superset_typing import ResultSetColumnType
 from superset.utils import cache as cache_util, core as utils
 from superset.utils.backports import StrEnum
 from superset.utils.core import get_username
+from superset.utils.engine_registry import CheckoutTimedQueuePool, engine_registry
+from superset.utils.query_admission import admit_query, QueryPriority
 
 config = app.config
 custom_password_store = config["SQLALCHEMY_CUSTOM_PASSWORD_STORE"]
@@ -89,6 +91,16 @@ if TYPE_CHECKING:
 
 DB_CONNECTION_MUTATOR = config["DB_CONNECTION_MUTATOR"]
 
+# the attributes of databases which change the engines connecting to them
+DATABASE_CONNECTION_SETTINGS = (
+    "sqlalchemy_uri",
+    "password",
+    "extra",
+    "encrypted_extra",
+    "impersonate_user",
+    "server_cert",
+)
+
 
 class KeyValue(Model):  # pylint: disable=too-few-public-methods
 
@@ -417,14 +429,17 @@ class Database(
                 nullpool=nullpool,
                 source=source,
                 sqlalchemy_uri=sqlalchemy_uri,
+                # the local ports of SSH tunnels change with each of them
+                pooled=not ssh_tunnel,
             )
 
-    def _get_sqla_engine(
+    def _get_sqla_engine(  # pylint: disable=too-many-arguments
         self,
         schema: str | None = None,
         nullpool: bool = True,
         source: utils.QuerySource | None = None,
         sqlalchemy_uri: str | None = None,
+        pooled: bool = False,
     ) -> Engine:
         sqlalchemy_url = make_url_safe(
             sqlalchemy_uri if sqlalchemy_uri else self.sqlalchemy_uri_decrypted
@@ -433,8 +448,18 @@ class Database(
 
         extra = self.get_extra()
         params = extra.get("engine_params", {})
-        if nullpool:
+        pooled = pooled and config["DATABASE_ENGINE_POOLING"]
+        if pooled:
+            params = {
+                **config["DATABASE_ENGINE_POOL_DEFAULTS"],
+                **params,
+                "poolclass": CheckoutTimedQueuePool,
+            }
+        elif nullpool:
             params["poolclass"] = NullPool
+            # the sizing parameters of pooled engines don't apply to NullPool
+            for key in ("pool_size", "max_overflow", "pool_timeout"):
+                params.pop(key, None)
         connect_args = params.get("connect_args", {})
 
         # The ``adjust_database_uri`` method was renamed to ``adjust_engine_params`` and
@@ -486,26 +511,43 @@ class Database(
         self.update_params_from_encrypted_extra(params)
 
         if DB_CONNECTION_MUTATOR:
-            if not source and request and request.referrer:
-                if "/superset/dashboard/" in request.referrer:
-                    source = utils.QuerySource.DASHBOARD
-                elif "/explore/" in request.referrer:
-                    source = utils.QuerySource.CHART
-                elif "/sqllab/" in request.referrer:
-                    source = utils.QuerySource.SQL_LAB
-
             sqlalchemy_url, params = DB_CONNECTION_MUTATOR(
                 sqlalchemy_url,
                 params,
                 effective_username,
                 security_manager,
-                source,
+                self.get_query_source(source),
             )
         try:
+            if pooled:
+                return engine_registry.get_engine(
+                    self.id,
+                    sqlalchemy_url,
+                    params,
+                    create_engine,
+                    config["DATABASE_ENGINE_REGISTRY_MAX_SIZE"],
+                )
             return create_engine(sqlalchemy_url, **params)
         except Exception as ex:
             raise self.db_engine_spec.get_dbapi_mapped_exception(ex)
 
+    @staticmethod
+    def get_query_source(
+        source: utils.QuerySource | None = None,
+    ) -> utils.QuerySource | None:
+        """
+        Return the source of a query, inferring it from the referrer of the request
+        when it isn't given.
+        """
+        if not source and request and request.referrer:
+            if "/superset/dashboard/" in request.referrer:
+                source = utils.QuerySource.DASHBOARD
+            elif "/explore/" in request.referrer:
+                source = utils.QuerySource.CHART
+            elif "/sqllab/" in request.referrer:
+                source = utils.QuerySource.SQL_LAB
+        return source
+
     @contextmanager
     def get_raw_connection(
         self,
@@ -513,17 +555,25 @@ class Database(
         nullpool: bool = True,
         source: utils.QuerySource | None = None,
     ) -> Connection:
-        with self.get_sqla_engine_with_context(
-            schema=schema, nullpool=nullpool, source=source
-        ) as engine:
-            with closing(engine.raw_connection()) as conn:
-                # pre-session queries are used to set the selected schema and, in the
-                # future, the selected catalog
-                for prequery in self.db_engine_spec.get_prequeries(schema=schema):
-                    cursor = conn.cursor()
-                    cursor.execute(prequery)
-
-                yield conn
+        # queries of dashboards, charts and SQL Lab are admitted before the others,
+        # e.g. of reports and cache warm-ups
+        priority = (
+            QueryPriority.INTERACTIVE
+            if self.get_query_source(source)
+            else QueryPriority.BACKGROUND
+        )
+        with admit_query(self, get_username(), priority):
+            with self.get_sqla_engine_with_context(
+                schema=schema, nullpool=nullpool, source=source
+            ) as engine:
+                with closing(engine.raw_connection()) as conn:
+                    # pre-session queries are used to set the selected schema and, in
+                    # the future, the selected catalog
+                    for prequery in self.db_engine_spec.get_prequeries(schema=schema):
+                        cursor = conn.cursor()
+                        cursor.execute(prequery)
+
+                    yield conn
 
     def get_default_schema_for_query(self, query: Query) -> str | None:
         """
@@ -549,18 +599,12 @@ class Database(
     def get_reserved_words(self) -> set[str]:
         return self.get_dialect().preparer.reserved_words
 
-    def get_df(  # pylint: disable=too-many-locals
+    def get_df(
         self,
         sql: str,
         schema: str | None = None,
         mutator: Callable[[pd.DataFrame], None] | None = None,
     ) -> pd.DataFrame:
-        sqls = self.db_engine_spec.parse_sql(sql)
-        with self.get_sqla_engine_with_context(schema) as engine:
-            engine_url = engine.url
-        mutate_after_split = config["MUTATE_AFTER_SPLIT"]
-        sql_query_mutator = config["SQL_QUERY_MUTATOR"]
-
         def needs_conversion(df_series: pd.Series) -> bool:
             return (
                 not df_series.empty
@@ -568,6 +612,26 @@ class Database(
                 and isinstance(df_series[0], (list, dict))
             )
 
+        df = self.get_result_set(sql, schema).to_pandas_df()
+        if mutator:
+            df = mutator(df)
+
+        for col, coltype in df.dtypes.to_dict().items():
+            if coltype == numpy.object_ and needs_conversion(df[col]):
+                df[col] = df[col].apply(utils.json_dumps_w_dates)
+
+        return df
+
+    def get_result_set(self, sql: str, schema: str | None = None) -> SupersetResultSet:
+        """
+        Run the statements of the SQL and return the result set of the last one.
+        """
+        sqls = self.db_engine_spec.parse_sql(sql)
+        with self.get_sqla_engine_with_context(schema) as engine:
+            engine_url = engine.url
+        mutate_after_split = config["MUTATE_AFTER_SPLIT"]
+        sql_query_mutator = config["SQL_QUERY_MUTATOR"]
+
         def _log_query(sql: str) -> None:
             if log_query:
                 log_query(
@@ -603,19 +667,16 @@ class Database(
                 _log_query(sqls[-1])
                 self.db_engine_spec.execute(cursor, sqls[-1])
 
-            data = self.db_engine_spec.fetch_data(cursor)
-            result_set = SupersetResultSet(
-                data, cursor.description, self.db_engine_spec
+            # the rows are converted to Arrow one batch after the other
+            return SupersetResultSet.from_batches(
+                self.db_engine_spec.fetch_data_batches(
+                    cursor,
+                    config["SQL_QUERY_FETCH_BATCH_SIZE"],
+                    max_bytes=config["SQL_QUERY_MAX_RESULT_BYTES"],
+                ),
+                cursor.description,
+                self.db_engine_spec,
             )
-            df = result_set.to_pandas_df()
-            if mutator:
-                df = mutator(df)
-
-            for col, coltype in df.dtypes.to_dict().items():
-                if coltype == numpy.object_ and needs_conversion(df[col]):
-                    df[col] = df[col].apply(utils.json_dumps_w_dates)
-
-            return df
 
     def compile_sqla_query(self, qry: Select, schema: str | None = None) -> str:
         with self.get_sqla_engine_with_context(schema) as engine:
@@ -973,9 +1034,30 @@ class Database(
         return sqla_col
 
 
+def dispose_engines_after_update(  # pylint: disable=unused-argument
+    mapper: Mapper, connection: Connection, target: Database
+) -> None:
+    """
+    Dispose of the pooled engines of a database when its connection settings change.
+    """
+    state = sqla.inspect(target)
+    if any(
+        state.attrs[attr].history.has_changes() for attr in DATABASE_CONNECTION_SETTINGS
+    ):
+        engine_registry.dispose(target.id)
+
+
+def dispose_engines_after_delete(  # pylint: disable=unused-argument
+    mapper: Mapper, connection: Connection, target: Database
+) -> None:
+    engine_registry.dispose(target.id)
+
+
 sqla.event.listen(Database, "after_insert", security_manager.database_after_insert)
 sqla.event.listen(Database, "after_update", security_manager.database_after_update)
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
+sqla.event.listen(Database, "after_update", dispose_engines_after_update)
+sqla.event.listen(Database, "after_delete", dispose_engines_after_delete)
 
 
 class Log(Model):  # pylint: disable=too-few-public-methods
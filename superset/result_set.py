@@ -19,6 +19,8 @@
 import datetime
 import json
 import logging
+from collections.abc import Iterable, Sequence
+from operator import itemgetter
 from typing import Any, Optional
 
 import numpy as np
@@ -101,19 +103,15 @@ def convert_to_string(value: Any) -> str:
 
 
 class SupersetResultSet:
-    def __init__(  # pylint: disable=too-many-locals
+    def __init__(
         self,
         data: DbapiResult,
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
     ):
         self.db_engine_spec = db_engine_spec
-        data = data or []
         column_names: list[str] = []
-        pa_data: list[pa.Array] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
-        stringified_arr: NDArray[Any]
 
         if cursor_description:
             # get deduped list of column names
@@ -127,60 +125,8 @@ class SupersetResultSet:
                 for column_name, description in zip(column_names, cursor_description)
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-        if array.size > 0:
-            for column in column_names:
-                try:
-                    pa_data.append(pa.array(array[column].tolist()))
-                except (
-                    pa.lib.ArrowInvalid,
-                    pa.lib.ArrowTypeError,
-                    pa.lib.ArrowNotImplementedError,
-                    ValueError,
-                    TypeError,  # this is super hackey,
-                    # https://issues.apache.org/jira/browse/ARROW-7855
-                ):
-                    # attempt serialization of values as strings
-                    stringified_arr = stringify_values(array[column])
-                    pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Superset
-                    #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(array[column])
-                                series = pd.to_datetime(series)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series,
-                                    type=pa.timestamp("ns", tz=tz),
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
-
-        if not pa_data:
-            column_names = []
-
-        self.table = pa.Table.from_arrays(pa_data, names=column_names)
+        self._column_names = column_names
+        self.table = self.to_table(data or [], column_names)
         self._type_dict: dict[str, Any] = {}
         try:
             # The driver may not be passing a cursor.description
@@ -192,6 +138,133 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    @classmethod
+    def from_batches(
+        cls,
+        batches: Iterable[DbapiResult],
+        cursor_description: DbapiDescription,
+        db_engine_spec: type[BaseEngineSpec],
+    ) -> "SupersetResultSet":
+        """
+        Build a result set from batches of rows, e.g. as returned by
+        `BaseEngineSpec.fetch_data_batches`, converting each batch to Arrow as soon
+        as it is fetched, so that the rows of a single batch are held at a time.
+
+        :param batches: the batches of rows
+        :param cursor_description: the cursor description
+        :param db_engine_spec: the engine spec of the database
+        :returns: the result set
+        """
+        result_set = cls([], cursor_description, db_engine_spec)
+        tables = [
+            table
+            for batch in batches
+            if (table := cls.to_table(batch, result_set._column_names)).num_columns
+        ]
+        if tables:
+            result_set.table = cls.concat_tables(tables)
+        return result_set
+
+    @classmethod
+    def to_table(cls, data: DbapiResult, column_names: list[str]) -> pa.Table:
+        """
+        Convert DB-API rows to an Arrow table.
+        """
+        pa_data: list[pa.Array] = []
+        stringified_arr: NDArray[Any]
+
+        # transpose the rows straight into columns, without materializing an
+        # intermediate object array for the whole result set
+        columns = cls.transpose(data, len(column_names)) if column_names else []
+        for i, values in enumerate(columns):
+            try:
+                pa_data.append(pa.array(values))
+            except (
+                pa.lib.ArrowInvalid,
+                pa.lib.ArrowTypeError,
+                pa.lib.ArrowNotImplementedError,
+                ValueError,
+                TypeError,  # this is super hackey,
+                # https://issues.apache.org/jira/browse/ARROW-7855
+            ):
+                # attempt serialization of values as strings
+                stringified_arr = stringify_values(cls.to_object_array(values))
+                pa_data.append(pa.array(stringified_arr.tolist()))
+
+            if pa.types.is_nested(pa_data[i].type):
+                # TODO: revisit nested column serialization once nested types
+                #  are added as a natively supported column type in Superset
+                #  (superset.utils.core.GenericDataType).
+                stringified_arr = stringify_values(cls.to_object_array(values))
+                pa_data[i] = pa.array(stringified_arr.tolist())
+
+            elif pa.types.is_temporal(pa_data[i].type):
+                # workaround for bug converting
+                # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+                # related: https://issues.apache.org/jira/browse/ARROW-5248
+                sample = cls.first_nonempty(values)
+                if sample and isinstance(sample, datetime.datetime):
+                    try:
+                        if sample.tzinfo:
+                            tz = sample.tzinfo
+                            series = pd.Series(values, dtype=object)
+                            series = pd.to_datetime(series)
+                            pa_data[i] = pa.Array.from_pandas(
+                                series,
+                                type=pa.timestamp("ns", tz=tz),
+                            )
+                    except Exception as ex:  # pylint: disable=broad-except
+                        logger.exception(ex)
+
+            # release the Python objects of the column as soon as it is converted
+            columns[i] = []
+
+        if not pa_data:
+            column_names = []
+
+        return pa.Table.from_arrays(pa_data, names=column_names)
+
+    @staticmethod
+    def concat_tables(tables: list[pa.Table]) -> pa.Table:
+        """
+        Concatenate the tables of batches of rows whose types were inferred
+        independently, promoting the types of the columns whose values were all null
+        in some batches, and serializing as strings the columns whose values have
+        different types across batches, like the values of different types within a
+        batch.
+        """
+        if not tables:
+            return pa.table({})
+        if len(tables) == 1:
+            return tables[0]
+        try:
+            return pa.concat_tables(tables, promote_options="default")
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass
+
+        types: dict[str, set[pa.DataType]] = {}
+        for table in tables:
+            for field in table.schema:
+                if not pa.types.is_null(field.type):
+                    types.setdefault(field.name, set()).add(field.type)
+        conflicting = {name for name, types_ in types.items() if len(types_) > 1}
+        logger.warning(
+            "Casting columns with conflicting types to strings: %s", conflicting
+        )
+
+        tables = [
+            table.cast(
+                pa.schema(
+                    pa.field(field.name, pa.string())
+                    if field.name in conflicting
+                    else field
+                    for field in table.schema
+                )
+            )
+            for table in tables
+        ]
+        return pa.concat_tables(tables, promote_options="default")
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
@@ -214,7 +287,26 @@ class SupersetResultSet:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
     @staticmethod
-    def first_nonempty(items: NDArray[Any]) -> Any:
+    def transpose(data: DbapiResult, num_columns: int) -> list[list[Any]]:
+        """
+        Transpose the DB-API rows into one list of values per column.
+        """
+        if not data:
+            return []
+        if not isinstance(data, (list, tuple)):
+            data = list(data)
+        return [list(map(itemgetter(i), data)) for i in range(num_columns)]
+
+    @staticmethod
+    def to_object_array(values: list[Any]) -> NDArray[Any]:
+        """
+        Build a one dimensional object array from a column of values, keeping
+        nested values (lists, tuples) as single elements.
+        """
+        return np.fromiter(values, dtype=object, count=len(values))
+
+    @staticmethod
+    def first_nonempty(items: Sequence[Any]) -> Any:
         return next((i for i in items if i), None)
 
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
@@ -20,10 +20,11 @@ import json
 import logging
 import re
 import time
+import uuid
 from collections import defaultdict
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING, Union
 
-from flask import current_app, Flask, g, Request
+from flask import current_app, Flask, g, has_app_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.security.sqla.manager import SecurityManager
 from flask_appbuilder.security.sqla.models import (
@@ -50,7 +51,6 @@ from sqlalchemy import and_, inspect, or_
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm import eagerload
 from sqlalchemy.orm.mapper import Mapper
-from sqlalchemy.orm.query import Query as SqlaQuery
 
 from superset import sql_parse
 from superset.constants import RouteMethod
@@ -78,11 +78,7 @@ from superset.utils.urls import get_url_host
 
 if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
-    from superset.connectors.sqla.models import (
-        BaseDatasource,
-        RowLevelSecurityFilter,
-        SqlaTable,
-    )
+    from superset.connectors.sqla.models import BaseDatasource, SqlaTable
     from superset.models.core import Database
     from superset.models.dashboard import Dashboard
     from superset.models.sql_lab import Query
@@ -93,12 +89,21 @@ logger = logging.getLogger(__name__)
 
 DATABASE_PERM_REGEX = re.compile(r"^\[.+\]\.\(id\:(?P<id>\d+)\)$")
 
+# cache key of the version stamp of the cached row level security filters
+RLS_FILTERS_GENERATION_KEY = "rls_filters__generation"
+
 
 class DatabaseAndSchema(NamedTuple):
     database: str
     schema: str
 
 
+class RowLevelSecurityFilterClause(NamedTuple):
+    id: int
+    group_key: Optional[str]
+    clause: str
+
+
 class SupersetSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -2060,11 +2065,17 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             ]
         return []
 
-    def get_rls_filters(self, table: "BaseDatasource") -> list[SqlaQuery]:
+    def get_rls_filters(
+        self, table: "BaseDatasource"
+    ) -> list[RowLevelSecurityFilterClause]:
         """
         Retrieves the appropriate row level security filters for the current user and
         the passed table.
 
+        The filters are memoized for the duration of the request, and for
+        `RLS_FILTERS_CACHE_TIMEOUT` seconds in the shared cache, as they are needed
+        both to compute the cache key and to build the query of every chart.
+
         :param table: The table to check against
         :returns: A list of filters
         """
@@ -2072,6 +2083,64 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        user_roles = sorted(role.id for role in self.get_user_roles(g.user))
+        key = f"rls_filters__{table.id}__{'_'.join(str(id_) for id_ in user_roles)}"
+        rls_filters = g.setdefault("rls_filters", {})
+        if key not in rls_filters:
+            rls_filters[key] = self._get_cached_rls_filters(key, user_roles, table)
+        return list(rls_filters[key])
+
+    def _get_cached_rls_filters(
+        self, key: str, user_roles: list[int], table: "BaseDatasource"
+    ) -> list[RowLevelSecurityFilterClause]:
+        """
+        Retrieves the row level security filters of the roles for the passed table from
+        the shared cache, querying and caching them when they are missing or were
+        cached before the filters last changed.
+
+        :param key: The cache key of the filters
+        :param user_roles: The ids of the roles to get the filters of
+        :param table: The table to check against
+        :returns: A list of filters
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        timeout = current_app.config["RLS_FILTERS_CACHE_TIMEOUT"]
+        if not timeout:
+            return self._query_rls_filters(user_roles, table)
+
+        cache = cache_manager.cache
+        try:
+            generation, cached = cache.get_many(RLS_FILTERS_GENERATION_KEY, key)
+            if generation is None:
+                # the stamp never expires, it is only replaced when the filters change
+                cache.add(RLS_FILTERS_GENERATION_KEY, str(uuid.uuid4()), timeout=0)
+                generation = cache.get(RLS_FILTERS_GENERATION_KEY)
+            elif cached is not None and cached[0] == generation:
+                return cached[1]
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not read the cached RLS filters", exc_info=True)
+            generation = None
+
+        rls_filters = self._query_rls_filters(user_roles, table)
+        if generation is not None:
+            try:
+                cache.set(key, (generation, rls_filters), timeout=timeout)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Could not cache the RLS filters", exc_info=True)
+        return rls_filters
+
+    def _query_rls_filters(
+        self, user_roles: list[int], table: "BaseDatasource"
+    ) -> list[RowLevelSecurityFilterClause]:
+        """
+        Queries the row level security filters of the roles for the passed table.
+
+        :param user_roles: The ids of the roles to get the filters of
+        :param table: The table to check against
+        :returns: A list of filters
+        """
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2079,7 +2148,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.get_session()
             .query(RLSFilterRoles.c.rls_filter_id)
@@ -2126,9 +2194,44 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 )
             )
         )
-        return query.all()
+        return [
+            RowLevelSecurityFilterClause(id_, group_key, clause)
+            for id_, group_key, clause in query.all()
+        ]
+
+    def rls_filters_after_change(  # pylint: disable=unused-argument
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: Model,
+    ) -> None:
+        """
+        Invalidates the cached row level security filters when a filter, or one of the
+        roles or tables they are attached to, changes.
+        Triggered by SQLAlchemy after_insert, after_update and after_delete events.
+
+        :param mapper: The SQLA mapper
+        :param connection: The SQLA connection
+        :param target: The changed object
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        if has_app_context():
+            g.pop("rls_filters", None)
+            try:
+                cache_manager.cache.set(
+                    RLS_FILTERS_GENERATION_KEY, str(uuid.uuid4()), timeout=0
+                )
+            except Exception:  # pylint: disable=broad-except
+                # the cached filters expire after RLS_FILTERS_CACHE_TIMEOUT anyway
+                logger.warning(
+                    "Could not invalidate the cached RLS filters", exc_info=True
+                )
 
-    def get_rls_sorted(self, table: "BaseDatasource") -> list["RowLevelSecurityFilter"]:
+    def get_rls_sorted(
+        self, table: "BaseDatasource"
+    ) -> list[RowLevelSecurityFilterClause]:
         """
         Retrieves a list RLS filters sorted by ID for
         the current user and the passed table.
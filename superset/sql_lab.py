@@ -38,7 +38,7 @@ from superset import (
 )
 from superset.common.db_query_status import QueryStatus
 from superset.constants import QUERY_CANCEL_KEY, QUERY_EARLY_CANCEL_KEY
-from superset.dataframe import df_to_records
+from superset.dataframe import df_to_columns, df_to_records
 from superset.db_engine_specs import BaseEngineSpec
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetErrorsException
@@ -52,14 +52,11 @@ from superset.sql_parse import (
     insert_rls_in_predicate,
     ParsedQuery,
 )
+from superset.sqllab.chunked_results import ChunkedResultsWriter
 from superset.sqllab.limiting_factor import LimitingFactor
 from superset.sqllab.utils import write_ipc_buffer
-from superset.utils.core import (
-    json_iso_dttm_ser,
-    override_user,
-    QuerySource,
-    zlib_compress,
-)
+from superset.utils.compression import compress
+from superset.utils.core import json_iso_dttm_ser, override_user, QuerySource
 from superset.utils.dates import now_as_float
 from superset.utils.decorators import stats_timing
 
@@ -70,6 +67,7 @@ SQLLAB_HARD_TIMEOUT = SQLLAB_TIMEOUT + 60
 SQL_MAX_ROW = config["SQL_MAX_ROW"]
 SQLLAB_CTAS_NO_LIMIT = config["SQLLAB_CTAS_NO_LIMIT"]
 SQL_QUERY_MUTATOR = config["SQL_QUERY_MUTATOR"]
+SQLLAB_RESULTS_BACKEND_CHUNK_SIZE = config["SQLLAB_RESULTS_BACKEND_CHUNK_SIZE"]
 log_query = config["QUERY_LOGGER"]
 logger = logging.getLogger(__name__)
 
@@ -168,6 +166,7 @@ def get_sql_results(  # pylint: disable=too-many-arguments
     start_time: Optional[float] = None,
     expand_data: bool = False,
     log_params: Optional[dict[str, Any]] = None,
+    columnar: bool = False,
 ) -> Optional[dict[str, Any]]:
     """Executes the sql query returns the results."""
     with override_user(security_manager.find_user(username)):
@@ -180,6 +179,7 @@ def get_sql_results(  # pylint: disable=too-many-arguments
                 start_time=start_time,
                 expand_data=expand_data,
                 log_params=log_params,
+                columnar=columnar,
             )
         except Exception as ex:  # pylint: disable=broad-except
             logger.debug("Query %d: %s", query_id, ex)
@@ -188,14 +188,20 @@ def get_sql_results(  # pylint: disable=too-many-arguments
             return handle_query_error(ex, query)
 
 
-def execute_sql_statement(
+def execute_sql_statement(  # pylint: disable=too-many-arguments
     sql_statement: str,
     query: Query,
     cursor: Any,
     log_params: Optional[dict[str, Any]],
     apply_ctas: bool = False,
+    results_writer: Optional[ChunkedResultsWriter] = None,
 ) -> SupersetResultSet:
-    """Executes a single SQL statement"""
+    """
+    Executes a single SQL statement
+
+    When a `results_writer` is given the data is fetched in batches that are written
+    to the results backend as they come, and the returned result set is empty.
+    """
     database: Database = query.database
     db_engine_spec = database.db_engine_spec
 
@@ -286,12 +292,7 @@ def execute_sql_statement(
                 query.id,
                 str(query.to_dict()),
             )
-            data = db_engine_spec.fetch_data(cursor, increased_limit)
-            if query.limit is None or len(data) <= query.limit:
-                query.limiting_factor = LimitingFactor.NOT_LIMITED
-            else:
-                # return 1 row less than increased_query
-                data = data[:-1]
+            data = _fetch_data(cursor, query, increased_limit, results_writer)
     except SoftTimeLimitExceeded as ex:
         query.status = QueryStatus.TIMED_OUT
 
@@ -319,8 +320,53 @@ def execute_sql_statement(
         raise SqlLabException(db_engine_spec.extract_error_message(ex)) from ex
 
     logger.debug("Query %d: Fetching cursor description", query.id)
-    cursor_description = cursor.description
-    return SupersetResultSet(data, cursor_description, db_engine_spec)
+    return SupersetResultSet(data, cursor.description, db_engine_spec)
+
+
+def _fetch_data(
+    cursor: Any,
+    query: Query,
+    increased_limit: Optional[int],
+    results_writer: Optional[ChunkedResultsWriter],
+) -> list[Any]:
+    """Fetches the data of the query, or writes it in chunks with a results writer"""
+    if results_writer:
+        _write_data_in_chunks(cursor, query, increased_limit, results_writer)
+        return []
+
+    data = query.database.db_engine_spec.fetch_data(cursor, increased_limit)
+    if query.limit is None or len(data) <= query.limit:
+        query.limiting_factor = LimitingFactor.NOT_LIMITED
+    else:
+        # return 1 row less than increased_query
+        data = data[:-1]
+    return data
+
+
+def _write_data_in_chunks(
+    cursor: Any,
+    query: Query,
+    increased_limit: Optional[int],
+    results_writer: ChunkedResultsWriter,
+) -> None:
+    """Fetches the data in batches and writes each one to the results backend"""
+    db_engine_spec = query.database.db_engine_spec
+    rows = 0
+    limited = False
+    for data in db_engine_spec.fetch_data_batches(
+        cursor, SQLLAB_RESULTS_BACKEND_CHUNK_SIZE, increased_limit
+    ):
+        if query.limit is not None and rows + len(data) > query.limit:
+            # drop the extra row fetched to test whether there are more rows
+            data = data[: query.limit - rows]
+            limited = True
+        rows += len(data)
+        results_writer.write(
+            SupersetResultSet(data, cursor.description, db_engine_spec)
+        )
+
+    if not limited:
+        query.limiting_factor = LimitingFactor.NOT_LIMITED
 
 
 def apply_limit_if_exists(
@@ -351,7 +397,16 @@ def _serialize_and_expand_data(
     db_engine_spec: BaseEngineSpec,
     use_msgpack: Optional[bool] = False,
     expand_data: bool = False,
+    columnar: bool = False,
 ) -> tuple[Union[bytes, str], list[Any], list[Any], list[Any]]:
+    """
+    Serialize the result set data for the results payload.
+
+    With `use_msgpack` the data is an Arrow IPC buffer that gets expanded when
+    loaded from the results backend. Otherwise it is a list of records, or, with
+    `columnar`, a mapping of column name to values. Columnar data is never
+    expanded, since complex type expansion operates on records.
+    """
     selected_columns = result_set.columns
     all_columns: list[Any]
     expanded_columns: list[Any]
@@ -360,19 +415,26 @@ def _serialize_and_expand_data(
         with stats_timing(
             "sqllab.query.results_backend_pa_serialization", stats_logger
         ):
-            data = write_ipc_buffer(result_set.pa_table).to_pybytes()
+            data = write_ipc_buffer(
+                result_set.pa_table, config["RESULTS_BACKEND_ARROW_COMPRESSION"]
+            ).to_pybytes()
 
         # expand when loading data from results backend
         all_columns, expanded_columns = (selected_columns, [])
     else:
         df = result_set.to_pandas_df()
-        data = df_to_records(df) or []
 
-        if expand_data:
+        if columnar:
+            data = df_to_columns(df)
+            all_columns = selected_columns
+            expanded_columns = []
+        elif expand_data:
+            data = df_to_records(df) or []
             all_columns, data, expanded_columns = db_engine_spec.expand_data(
                 selected_columns, data
             )
         else:
+            data = df_to_records(df) or []
             all_columns = selected_columns
             expanded_columns = []
 
@@ -388,6 +450,7 @@ def execute_sql_statements(
     start_time: Optional[float],
     expand_data: bool,
     log_params: Optional[dict[str, Any]],
+    columnar: bool = False,
 ) -> Optional[dict[str, Any]]:
     """Executes the sql query returns the results."""
     if store_results and start_time:
@@ -464,6 +527,21 @@ def execute_sql_statements(
             )
         )
 
+    cache_timeout = database.cache_timeout
+    if cache_timeout is None:
+        cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
+
+    # Large asynchronous results are streamed to the results backend in chunks
+    results_writer = (
+        ChunkedResultsWriter(str(uuid.uuid4()), cache_timeout)
+        if SQLLAB_RESULTS_BACKEND_CHUNK_SIZE
+        and store_results
+        and not return_results
+        and results_backend
+        and results_backend_use_msgpack
+        else None
+    )
+
     with database.get_raw_connection(query.schema, source=QuerySource.SQL_LAB) as conn:
         # Sharing a single connection and cursor across the
         # execution of all statements (if many)
@@ -500,6 +578,8 @@ def execute_sql_statements(
                     cursor,
                     log_params,
                     apply_ctas,
+                    # only the results of the last statement are kept
+                    results_writer if i == statement_count - 1 else None,
                 )
             except SqlLabQueryStoppedException:
                 payload.update({"status": QueryStatus.STOPPED})
@@ -527,10 +607,12 @@ def execute_sql_statements(
             conn.commit()
 
     # Success, updating the query entry in database
-    query.rows = result_set.size
+    query.rows = results_writer.rows if results_writer else result_set.size
     query.progress = 100
     query.set_extra_json_key("progress", None)
-    query.set_extra_json_key("columns", result_set.columns)
+    query.set_extra_json_key(
+        "columns", results_writer.columns if results_writer else result_set.columns
+    )
     if query.select_as_cta:
         query.select_sql = database.select_star(
             query.tmp_table_name,
@@ -542,9 +624,21 @@ def execute_sql_statements(
     query.end_time = now_as_float()
 
     use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
-    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
-    )
+    if results_writer:
+        # the data is stored in chunks, expanded when loading from results backend
+        data = None
+        selected_columns = all_columns = results_writer.columns
+        expanded_columns: list[Any] = []
+        payload["chunks"] = results_writer.manifest
+    else:
+        (
+            data,
+            selected_columns,
+            all_columns,
+            expanded_columns,
+        ) = _serialize_and_expand_data(
+            result_set, db_engine_spec, use_arrow_data, expand_data, columnar
+        )
 
     # TODO: data should be saved separately from metadata (likely in Parquet)
     payload.update(
@@ -560,7 +654,7 @@ def execute_sql_statements(
     payload["query"]["state"] = QueryStatus.SUCCESS
 
     if store_results and results_backend:
-        key = str(uuid.uuid4())
+        key = results_writer.key if results_writer else str(uuid.uuid4())
         payload["query"]["resultsKey"] = key
         logger.info(
             "Query %s: Storing results in results backend, key: %s", str(query_id), key
@@ -572,11 +666,11 @@ def execute_sql_statements(
                 serialized_payload = _serialize_payload(
                     payload, cast(bool, results_backend_use_msgpack)
                 )
-            cache_timeout = database.cache_timeout
-            if cache_timeout is None:
-                cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
 
-            compressed = zlib_compress(serialized_payload)
+            with stats_timing("sqllab.query.results_backend_compress", stats_logger):
+                compressed = compress(
+                    serialized_payload, config["RESULTS_BACKEND_COMPRESSION"]
+                )
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
             )
@@ -596,7 +690,7 @@ def execute_sql_statements(
                 all_columns,
                 expanded_columns,
             ) = _serialize_and_expand_data(
-                result_set, db_engine_spec, False, expand_data
+                result_set, db_engine_spec, False, expand_data, columnar
             )
             payload.update(
                 {
@@ -29,7 +29,7 @@ from marshmallow import ValidationError
 from superset import app, is_feature_enabled
 from superset.commands.sql_lab.estimate import QueryEstimationCommand
 from superset.commands.sql_lab.execute import CommandResult, ExecuteSqlCommand
-from superset.commands.sql_lab.export import SqlResultExportCommand
+from superset.commands.sql_lab.export import SqlExportFormat, SqlResultExportCommand
 from superset.commands.sql_lab.results import SqlExecutionResultsCommand
 from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP
 from superset.daos.database import DatabaseDAO
@@ -63,8 +63,14 @@ from superset.sqllab.utils import bootstrap_sqllab_data
 from superset.sqllab.validators import CanAccessQueryValidatorImpl
 from superset.superset_typing import FlaskResponse
 from superset.utils import core as utils
-from superset.views.base import CsvResponse, generate_download_headers, json_success
+from superset.views.base import (
+    CsvResponse,
+    generate_download_headers,
+    json_success,
+    ParquetResponse,
+)
 from superset.views.base_api import BaseSupersetApi, requires_json, statsd_metrics
+from superset.views.utils import ResultsOptions
 
 config = app.config
 logger = logging.getLogger(__name__)
@@ -243,7 +249,7 @@ class SqlLabRestApi(BaseSupersetApi):
         f".export_csv",
         log_to_statsd=False,
     )
-    def export_csv(self, client_id: str) -> CsvResponse:
+    def export_csv(self, client_id: str) -> Response:
         """Export the SQL query results to a CSV.
         ---
         get:
@@ -254,6 +260,13 @@ class SqlLabRestApi(BaseSupersetApi):
               type: integer
             name: client_id
             description: The SQL query result identifier
+          - in: query
+            schema:
+              type: string
+              enum: [csv, parquet]
+              default: csv
+            name: format
+            description: The format of the exported file
           responses:
             200:
               description: SQL query results
@@ -261,6 +274,10 @@ class SqlLabRestApi(BaseSupersetApi):
                 text/csv:
                   schema:
                     type: string
+                application/vnd.apache.parquet:
+                  schema:
+                    type: string
+                    format: binary
             400:
               $ref: '#/components/responses/400'
             401:
@@ -272,13 +289,23 @@ class SqlLabRestApi(BaseSupersetApi):
             500:
               $ref: '#/components/responses/500'
         """
-        result = SqlResultExportCommand(client_id=client_id).run()
+        try:
+            export_format = SqlExportFormat(request.args.get("format", "csv"))
+        except ValueError:
+            return self.response_400(message="Unsupported export format")
+
+        result = SqlResultExportCommand(
+            client_id=client_id, export_format=export_format
+        ).run()
 
         query, data, row_count = result["query"], result["data"], result["count"]
 
-        quoted_csv_name = parse.quote(query.name)
-        response = CsvResponse(
-            data, headers=generate_download_headers("csv", quoted_csv_name)
+        quoted_name = parse.quote(query.name)
+        response_class = (
+            ParquetResponse if export_format == SqlExportFormat.PARQUET else CsvResponse
+        )
+        response = response_class(
+            data, headers=generate_download_headers(export_format, quoted_name)
         )
         event_info = {
             "event_type": "data_export",
@@ -287,11 +314,14 @@ class SqlLabRestApi(BaseSupersetApi):
             "database": query.database.name,
             "schema": query.schema,
             "sql": query.sql,
-            "exported_format": "csv",
+            "exported_format": export_format.value,
         }
         event_rep = repr(event_info)
         logger.debug(
-            "CSV exported: %s", event_rep, extra={"superset_event": event_info}
+            "%s exported: %s",
+            export_format.upper(),
+            event_rep,
+            extra={"superset_event": event_info},
         )
         return response
 
@@ -339,7 +369,12 @@ class SqlLabRestApi(BaseSupersetApi):
         params = kwargs["rison"]
         key = params.get("key")
         rows = params.get("rows")
-        result = SqlExecutionResultsCommand(key=key, rows=rows).run()
+        options = ResultsOptions(
+            columnar=params.get("columnar", False),
+            offset=params.get("offset", 0),
+            limit=params.get("limit"),
+        )
+        result = SqlExecutionResultsCommand(key=key, rows=rows, options=options).run()
         # return the result without special encoding
         return json_success(
             json.dumps(
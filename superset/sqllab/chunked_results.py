@@ -0,0 +1,139 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Storage of SQL Lab results in the results backend as a sequence of chunks.
+
+Each chunk holds a batch of rows fetched from the cursor, serialized as its own
+Arrow IPC stream under a separate key. The payload stored under the results key
+carries a manifest listing the chunk keys and their row counts, so readers only
+fetch the chunks they need.
+"""
+from __future__ import annotations
+
+from typing import TypedDict
+
+import pyarrow as pa
+
+from superset import app, results_backend
+from superset.exceptions import SerializationError
+from superset.result_set import SupersetResultSet
+from superset.sqllab.utils import write_ipc_buffer
+from superset.superset_typing import ResultSetColumnType
+from superset.utils.compression import compress, decompress
+from superset.utils.decorators import stats_timing
+
+config = app.config
+stats_logger = config["STATS_LOGGER"]
+
+
+class ResultsManifest(TypedDict):
+    keys: list[str]
+    rows: list[int]
+
+
+def get_chunk_key(key: str, index: int) -> str:
+    return f"{key}-chunk-{index}"
+
+
+class ChunkedResultsWriter:
+    """
+    Write the batches of a result set to the results backend as they are fetched.
+    """
+
+    def __init__(self, key: str, timeout: int) -> None:
+        self.key = key
+        self.timeout = timeout
+        self.columns: list[ResultSetColumnType] = []
+        self._keys: list[str] = []
+        self._rows: list[int] = []
+
+    @property
+    def rows(self) -> int:
+        return sum(self._rows)
+
+    @property
+    def manifest(self) -> ResultsManifest:
+        return {"keys": list(self._keys), "rows": list(self._rows)}
+
+    def write(self, result_set: SupersetResultSet) -> None:
+        """
+        Store a batch of the result set under its own chunk key.
+
+        :param result_set: the batch to store
+        """
+        if not self.columns:
+            self.columns = result_set.columns
+        if not result_set.size:
+            return
+
+        key = get_chunk_key(self.key, len(self._keys))
+        buffer = write_ipc_buffer(
+            result_set.pa_table, config["RESULTS_BACKEND_ARROW_COMPRESSION"]
+        ).to_pybytes()
+        with stats_timing("sqllab.query.results_backend_compress", stats_logger):
+            blob = compress(buffer, config["RESULTS_BACKEND_COMPRESSION"])
+        if not results_backend.set(key, blob, self.timeout):
+            raise SerializationError(f"Unable to store results chunk {key}")
+
+        self._keys.append(key)
+        self._rows.append(result_set.size)
+
+
+def read_chunked_results(
+    manifest: ResultsManifest,
+    offset: int = 0,
+    limit: int | None = None,
+) -> pa.Table:
+    """
+    Read rows of a chunked result set from the results backend.
+
+    Only the chunks holding the requested rows are read.
+
+    :param manifest: the manifest of the stored result set
+    :param offset: the index of the first row to read
+    :param limit: the maximum number of rows to read, all when `None`
+    :returns: the rows read, as a single table
+    :raises SerializationError: if a chunk has expired or cannot be deserialized
+    """
+    end = None if limit is None else offset + limit
+    tables: list[pa.Table] = []
+    # index of the first row of the first chunk read
+    first_row = 0
+    chunk_end = 0
+    for key, count in zip(manifest["keys"], manifest["rows"]):
+        chunk_start, chunk_end = chunk_end, chunk_end + count
+        if end is not None and chunk_start >= end:
+            break
+        if chunk_end <= offset:
+            continue
+        if not tables:
+            first_row = chunk_start
+
+        blob = results_backend.get(key)
+        if not blob:
+            raise SerializationError(f"Results chunk {key} is missing")
+        try:
+            with stats_timing("sqllab.query.results_backend_decompress", stats_logger):
+                reader = pa.BufferReader(decompress(blob, decode=False))
+            tables.append(pa.ipc.open_stream(reader).read_all())
+        except pa.ArrowException as ex:
+            raise SerializationError("Unable to deserialize table") from ex
+
+    if not tables:
+        return pa.table({})
+
+    return SupersetResultSet.concat_tables(tables).slice(offset - first_row, limit)
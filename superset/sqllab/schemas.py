@@ -22,6 +22,19 @@ sql_lab_get_results_schema = {
     "type": "object",
     "properties": {
         "key": {"type": "string"},
+        "columnar": {"type": "boolean"},
+        "offset": {
+            "type": "integer",
+            "minimum": 0,
+            "description": "The index of the first row of the page to return",
+        },
+        "limit": {
+            "type": "integer",
+            "minimum": 0,
+            "description": "The maximum number of rows of the page to return. Only "
+            "the results stored in chunks are read partially, the others are read "
+            "as a whole before being paged.",
+        },
     },
     "required": ["key"],
 }
@@ -61,6 +74,7 @@ class ExecutePayloadSchema(Schema):
     json = fields.Boolean(allow_none=True)
     runAsync = fields.Boolean(allow_none=True)
     expand_data = fields.Boolean(allow_none=True)
+    columnar = fields.Boolean(allow_none=True)
 
 
 class QueryResultSchema(Schema):
@@ -100,6 +114,7 @@ class QueryExecutionResponseSchema(Schema):
     selected_columns = fields.List(fields.Dict())
     expanded_columns = fields.List(fields.Dict())
     query = fields.Nested(QueryResultSchema)
+    offset = fields.Integer()
     query_id = fields.Integer()
 
 
@@ -141,6 +141,7 @@ class SynchronousSqlJsonExecutor(SqlJsonExecutorBase):
             store_results=self._is_store_results(execution_context),
             username=get_username(),
             expand_data=execution_context.expand_data,
+            columnar=execution_context.columnar,
             log_params=log_params,
         )
 
@@ -175,6 +176,7 @@ class ASynchronousSqlJsonExecutor(SqlJsonExecutorBase):
                 username=get_username(),
                 start_time=now_as_float(),
                 expand_data=execution_context.expand_data,
+                columnar=execution_context.columnar,
                 log_params=log_params,
             )
             try:
@@ -56,6 +56,7 @@ class SqlJsonExecutionContext:  # pylint: disable=too-many-instance-attributes
     tab_name: str
     user_id: int | None
     expand_data: bool
+    columnar: bool
     create_table_as_select: CreateTableAsSelect | None
     database: Database | None
     query: Query
@@ -89,6 +90,7 @@ class SqlJsonExecutionContext:  # pylint: disable=too-many-instance-attributes
             is_feature_enabled("PRESTO_EXPAND_DATA")
             and query_params.get("expand_data"),
         )
+        self.columnar = bool(query_params.get("columnar"))
 
     @staticmethod
     def _get_template_params(query_params: dict[str, Any]) -> dict[str, Any]:
@@ -64,15 +64,23 @@ def apply_display_max_row_configuration_if_require(  # pylint: disable=invalid-n
         )
 
     if is_require_to_apply():
-        sql_results["data"] = sql_results["data"][:max_rows_in_result]
+        data = sql_results["data"]
+        if isinstance(data, dict):
+            # columnar data
+            sql_results["data"] = {
+                column: values[:max_rows_in_result] for column, values in data.items()
+            }
+        else:
+            sql_results["data"] = data[:max_rows_in_result]
         sql_results["displayLimitReached"] = True
     return sql_results
 
 
-def write_ipc_buffer(table: pa.Table) -> pa.Buffer:
+def write_ipc_buffer(table: pa.Table, compression: str | None = None) -> pa.Buffer:
     sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
 
-    with pa.ipc.new_stream(sink, table.schema) as writer:
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
         writer.write_table(table)
 
     return sink.getvalue()
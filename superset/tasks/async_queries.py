@@ -26,6 +26,8 @@ from flask_appbuilder.security.sqla.models import User
 from marshmallow import ValidationError
 
 from superset.charts.schemas import ChartDataQueryContextSchema
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
 from superset.exceptions import SupersetVizException
 from superset.extensions import (
     async_query_manager,
@@ -107,6 +109,33 @@ def load_chart_data_into_cache(
             raise ex
 
 
+@celery_app.task(name="refresh_chart_data_cache", soft_time_limit=query_timeout)
+def refresh_chart_data_cache(
+    job_metadata: dict[str, Any],
+    form_data: dict[str, Any],
+    refresh_key: str | None = None,
+) -> None:
+    """
+    Reload the data of a query context into the cache, replacing stale data.
+
+    :param job_metadata: the metadata of the job, holding the user
+    :param form_data: the query context to reload
+    :param refresh_key: the key guarding against concurrent refreshes, deleted once
+        the data is reloaded
+    """
+    try:
+        with override_user(_load_user_from_job_metadata(job_metadata), force=False):
+            set_form_data(form_data)
+            query_context = _create_query_context_from_form(
+                {**form_data, "force": True}
+            )
+            for query_obj in query_context.queries:
+                query_context.get_df_payload(query_obj)
+    finally:
+        if refresh_key:
+            QueryCacheManager.delete(refresh_key, region=CacheRegion.DATA)
+
+
 @celery_app.task(name="load_explore_json_into_cache", soft_time_limit=query_timeout)
 def load_explore_json_into_cache(  # pylint: disable=too-many-locals
     job_metadata: dict[str, Any],
@@ -0,0 +1,204 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import io
+from collections.abc import Iterator
+from typing import Any, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import simplejson
+
+from superset.result_set import stringify_values
+from superset.utils.core import json_int_dttm_ser, StreamingBuffer
+
+ARROW_STREAM_MIMETYPE = "application/vnd.apache.arrow.stream"
+
+PARQUET_MIMETYPE = "application/vnd.apache.parquet"
+
+# default maximum number of rows per row group of Parquet files
+PARQUET_ROW_GROUP_SIZE = 128 * 1024
+
+# key of the schema metadata entry holding the JSON encoded query payload
+ARROW_METADATA_KEY = b"superset"
+
+# key of the schema metadata entry listing the object columns of a DataFrame
+ARROW_OBJECT_COLUMNS_KEY = b"superset_object_columns"
+
+
+def df_to_arrow_table(df: pd.DataFrame, index: bool = False) -> pa.Table:
+    """
+    Convert a DataFrame into an Arrow table, column by column.
+
+    Columns that Arrow cannot convert natively (e.g. object columns with mixed
+    types) are serialized as strings, the same way SQL Lab result sets are.
+
+    :param df: the DataFrame to convert
+    :param index: whether to include a non-default index as leading columns
+    :returns: the Arrow table
+    """
+    if index and not isinstance(df.index, pd.RangeIndex):
+        df = df.reset_index()
+
+    arrays: list[pa.Array] = []
+    for _, series in df.items():
+        try:
+            arrays.append(pa.Array.from_pandas(series))
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+            ValueError,
+            TypeError,
+        ):
+            stringified = stringify_values(series.to_numpy(dtype=object))
+            arrays.append(pa.array(stringified.tolist(), type=pa.string()))
+
+    return pa.Table.from_arrays(arrays, names=[str(column) for column in df.columns])
+
+
+def iter_arrow_stream(
+    table: pa.Table,
+    metadata: Optional[dict[str, Any]] = None,
+    max_chunksize: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Serialize an Arrow table as an Arrow IPC stream, one record batch at a time.
+
+    :param table: the Arrow table to serialize
+    :param metadata: JSON serializable payload stored in the schema metadata
+    :param max_chunksize: maximum number of rows per record batch
+    :returns: an iterator over the chunks of the IPC stream
+    """
+    schema = table.schema
+    if metadata is not None:
+        schema = schema.with_metadata(
+            {
+                **(schema.metadata or {}),
+                ARROW_METADATA_KEY: simplejson.dumps(
+                    metadata,
+                    default=json_int_dttm_ser,
+                    ignore_nan=True,
+                ),
+            }
+        )
+
+    sink = io.BytesIO()
+
+    def drain() -> bytes:
+        chunk = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return chunk
+
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for batch in table.to_batches(max_chunksize=max_chunksize):
+            writer.write_batch(batch)
+            yield drain()
+    yield drain()
+
+
+def iter_parquet(
+    table: pa.Table,
+    row_group_size: Optional[int] = PARQUET_ROW_GROUP_SIZE,
+    **kwargs: Any,
+) -> Iterator[bytes]:
+    """
+    Write an Arrow table as a Parquet file, one row group at a time.
+
+    :param table: the Arrow table to write
+    :param row_group_size: maximum number of rows per row group
+    :param kwargs: other arguments passed to `pyarrow.parquet.ParquetWriter`
+    :returns: an iterator over the chunks of the Parquet file
+    """
+    sink = StreamingBuffer()
+    with pq.ParquetWriter(sink, table.schema, **kwargs) as writer:
+        for batch in table.to_batches(max_chunksize=row_group_size):
+            writer.write_batch(batch)
+            yield sink.drain()
+    yield sink.drain()
+
+
+def read_arrow_stream(data: bytes) -> tuple[pa.Table, Optional[dict[str, Any]]]:
+    """
+    Deserialize an Arrow IPC stream written by `iter_arrow_stream`.
+
+    :param data: the IPC stream
+    :returns: the Arrow table and the payload stored in its schema metadata
+    """
+    table = pa.ipc.open_stream(data).read_all()
+    metadata = (table.schema.metadata or {}).get(ARROW_METADATA_KEY)
+    return table, simplejson.loads(metadata) if metadata is not None else None
+
+
+def df_to_ipc(df: pd.DataFrame, compression: Optional[str] = None) -> bytes:
+    """
+    Serialize a DataFrame, including its index and dtypes, as an Arrow IPC stream.
+
+    Unlike `df_to_arrow_table`, no value is stringified, so that the DataFrame
+    read back by `ipc_to_df` is the same as the original one.
+
+    :param df: the DataFrame to serialize
+    :param compression: the codec used to compress the buffers, "zstd" or "lz4"
+    :returns: the IPC stream
+    :raises ValueError: if the DataFrame cannot be converted losslessly
+    :raises pa.ArrowException: if a column cannot be converted
+    """
+    if not df.columns.is_unique or not all(
+        isinstance(column, str) for column in df.columns
+    ):
+        raise ValueError("Only DataFrames with unique string columns are supported")
+
+    table = pa.Table.from_pandas(df)
+    object_columns = [
+        i for i, dtype in enumerate(df.dtypes) if pd.api.types.is_object_dtype(dtype)
+    ]
+    table = table.replace_schema_metadata(
+        {
+            **(table.schema.metadata or {}),
+            ARROW_OBJECT_COLUMNS_KEY: simplejson.dumps(object_columns),
+        }
+    )
+
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+
+    return sink.getvalue().to_pybytes()
+
+
+def ipc_to_df(data: bytes) -> pd.DataFrame:
+    """
+    Deserialize a DataFrame serialized by `df_to_ipc`.
+
+    :param data: the IPC stream
+    :returns: the DataFrame
+    """
+    table = pa.ipc.open_stream(data).read_all()
+    df = table.to_pandas()
+
+    # object columns holding e.g. integers and nulls are read back as floats, and
+    # lists as NumPy arrays, so those are rebuilt from the Python values
+    metadata = table.schema.metadata or {}
+    for i in simplejson.loads(metadata.get(ARROW_OBJECT_COLUMNS_KEY, b"[]")):
+        column = table.column(i)
+        dtype = df.dtypes.iloc[i]
+        if pa.types.is_nested(column.type) or not pd.api.types.is_object_dtype(dtype):
+            df.isetitem(i, pd.Series(column.to_pylist(), index=df.index, dtype=object))
+
+    return df
@@ -18,11 +18,12 @@ from __future__ import annotations
 
 import inspect
 import logging
+import random
 from datetime import datetime, timedelta
 from functools import wraps
 from typing import Any, Callable, TYPE_CHECKING
 
-from flask import current_app as app, request
+from flask import current_app as app, g, has_app_context, request
 from flask_caching import Cache
 from flask_caching.backends import NullCache
 from werkzeug.wrappers import Response
@@ -30,6 +31,7 @@ from werkzeug.wrappers import Response
 from superset import db
 from superset.extensions import cache_manager
 from superset.models.cache import CacheKey
+from superset.utils.cache_manager import get_size
 from superset.utils.core import json_int_dttm_ser
 from superset.utils.hashing import md5_sha_from_dict
 
@@ -46,12 +48,103 @@ def generate_cache_key(values_dict: dict[str, Any], key_prefix: str = "") -> str
     return f"{key_prefix}{hash_str}"
 
 
-def set_and_log_cache(
+def get_datasource_generation_key(datasource_uid: str) -> str:
+    return f"{datasource_uid}__generation"
+
+
+def get_datasource_generation(datasource_uid: str) -> int | None:
+    """
+    Return the generation of the data cached for a datasource, which is folded into
+    the cache keys of its data so that invalidating them only takes incrementing it.
+    The generation is memoized for the duration of the request.
+
+    :param datasource_uid: the uid of the datasource
+    :returns: the generation, or `None` if generations are disabled or not cached
+    """
+    if not app.config["DATA_CACHE_DATASOURCE_GENERATIONS"]:
+        return None
+
+    generations = (
+        g.setdefault("datasource_generations", {}) if has_app_context() else {}
+    )
+    if datasource_uid not in generations:
+        key = get_datasource_generation_key(datasource_uid)
+        generation = cache_manager.data_cache.get(key)
+        if generation is None:
+            # a random first generation keeps the data cached before the generation
+            # was evicted from being read again
+            cache_manager.data_cache.add(key, random.getrandbits(31), timeout=0)
+            generation = cache_manager.data_cache.get(key)
+        generations[datasource_uid] = generation
+    return generations[datasource_uid]
+
+
+def bump_datasource_generations(datasource_uids: set[str]) -> None:
+    """
+    Invalidate the data cached for datasources by incrementing their generations,
+    which is atomic on backends that support it.
+
+    :param datasource_uids: the uids of the datasources
+    """
+    if not app.config["DATA_CACHE_DATASOURCE_GENERATIONS"]:
+        return
+
+    for datasource_uid in datasource_uids:
+        key = get_datasource_generation_key(datasource_uid)
+        try:
+            cache_manager.data_cache.cache.inc(key)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Could not invalidate the generation %s", key)
+            logger.exception(ex)
+    if has_app_context():
+        g.pop("datasource_generations", None)
+    stats_logger.incr("invalidated_datasource_generations")
+
+
+def get_data_cache_timeout(
+    cache_value: dict[str, Any],
+    timeout: int,
+    cost: float | None = None,
+) -> int | None:
+    """
+    Apply the admission policy of the data cache to a value, so that large results
+    that are cheap to compute don't evict the small ones that are read often.
+
+    :param cache_value: the value to cache
+    :param timeout: the timeout to cache the value with
+    :param cost: the time it took to compute the value, in seconds, if known
+    :returns: the timeout to cache the value with, or `None` if it must not be cached
+    """
+    max_size = app.config["DATA_CACHE_MAX_ENTRY_SIZE"]
+    max_size_per_second = app.config["DATA_CACHE_MAX_SIZE_PER_SECOND"]
+    if not max_size and not max_size_per_second:
+        return timeout
+
+    size = get_size(cache_value)
+    stats_logger.gauge("cache_entry_size", size)
+    if cost:
+        stats_logger.timing("cache_entry_cost", cost)
+
+    if max_size and size > max_size:
+        stats_logger.incr("cache_reject_size")
+        return None
+
+    if max_size_per_second and cost and size > max_size_per_second * cost:
+        stats_logger.incr("cache_downtier")
+        downtier_timeout = app.config["DATA_CACHE_DOWNTIER_TIMEOUT"]
+        timeout = min(timeout, downtier_timeout) if timeout else downtier_timeout
+
+    stats_logger.incr("cache_admit")
+    return timeout
+
+
+def set_and_log_cache(  # pylint: disable=too-many-arguments
     cache_instance: Cache,
     cache_key: str,
     cache_value: dict[str, Any],
     cache_timeout: int | None = None,
     datasource_uid: str | None = None,
+    cost: float | None = None,
 ) -> None:
     if isinstance(cache_instance.cache, NullCache):
         return
@@ -61,6 +154,12 @@ def set_and_log_cache(
         if cache_timeout is not None
         else app.config["CACHE_DEFAULT_TIMEOUT"]
     )
+    if cache_instance is cache_manager.data_cache:
+        admitted_timeout = get_data_cache_timeout(cache_value, timeout, cost)
+        if admitted_timeout is None:
+            return
+        timeout = admitted_timeout
+
     try:
         dttm = datetime.utcnow().isoformat().split(".")[0]
         value = {**cache_value, "dttm": dttm}
@@ -15,9 +15,16 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from typing import Any, Optional, Union
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional, Union
+from uuid import uuid4
 
-from flask import Flask
+import pandas as pd
+from cachelib import BaseCache
+from flask import current_app, Flask
 from flask_caching import Cache
 from markupsafe import Markup
 
@@ -27,6 +34,217 @@ logger = logging.getLogger(__name__)
 
 CACHE_IMPORT_PATH = "superset.extensions.metastore_cache.SupersetMetastoreCache"
 
+# suffix of the keys holding the version stamps of the values in the shared cache
+VERSION_KEY_SUFFIX = "__version"
+# key of the version stamp stored along with each value in the shared cache
+VERSION_STAMP_KEY = "__local_tier_version"
+
+
+def get_size(value: Any) -> int:
+    """
+    Estimate the memory used by a cached value, in bytes.
+
+    :param value: the value
+    :returns: the estimated size
+    """
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, dict):
+        return sum(get_size(key) + get_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sum(get_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def copy_value(value: Any) -> Any:
+    """
+    Copy a cached value, so that callers modifying it in place, e.g. renaming the
+    columns of a DataFrame, don't alter the value held by the local cache.
+
+    :param value: the value
+    :returns: a shallow copy of the value
+    """
+    if isinstance(value, pd.DataFrame):
+        return value.copy(deep=False)
+    if isinstance(value, dict):
+        return {key: copy_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_value(item) for item in value]
+    return value
+
+
+class LocalCacheEntry(NamedTuple):
+    value: Any
+    version: str
+    size: int
+    expires_at: Optional[float]
+
+
+class LocalCache:
+    """
+    A thread safe, in-process LRU cache bounded by the size of its values in bytes.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.size = 0
+        self._entries: OrderedDict[str, LocalCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[LocalCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: Any, version: str, timeout: int) -> None:
+        size = get_size(value)
+        expires_at = time.monotonic() + timeout if timeout > 0 else None
+        with self._lock:
+            self._pop(key)
+            if size > self.max_size:
+                return
+            self._entries[key] = LocalCacheEntry(value, version, size, expires_at)
+            self.size += size
+            while self.size > self.max_size:
+                self._pop(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _pop(self, key: str) -> None:
+        if entry := self._entries.pop(key, None):
+            self.size -= entry.size
+
+
+class LocalTierCache(BaseCache):
+    """
+    A cache backend keeping the values it recently read or wrote in a per process LRU
+    tier, in front of the shared cache backend.
+
+    Each value written through it gets a random version stamp, stored both with the
+    value and under a key of its own in the shared backend, with the same timeout.
+    Values are only kept locally when read back from the backend along with the
+    current version, i.e. when the stamp stored with them matches it, which isn't
+    the case while concurrent writes of the same key are interleaved. A value held by
+    the local tier is then only served while its version is still the current one, so
+    values written or deleted by other processes, or expired, are never served.
+    """
+
+    def __init__(self, backend: BaseCache, max_size: int) -> None:
+        super().__init__(default_timeout=backend.default_timeout)
+        self.backend = backend
+        self.local = LocalCache(max_size)
+
+    @staticmethod
+    def _get_version_key(key: str) -> str:
+        return f"{key}{VERSION_KEY_SUFFIX}"
+
+    @staticmethod
+    def _unwrap(stored: Any) -> tuple[Any, Optional[str]]:
+        """
+        Return a value stored in the backend and its version stamp, if it was
+        written through the local tier.
+        """
+        if isinstance(stored, dict) and stored.keys() == {VERSION_STAMP_KEY, "value"}:
+            return stored["value"], stored[VERSION_STAMP_KEY]
+        return stored, None
+
+    @staticmethod
+    def _incr(key: str, count: int) -> None:
+        stats_logger = current_app.config["STATS_LOGGER"]
+        for _ in range(count):
+            stats_logger.incr(key)
+
+    def get(self, key: str) -> Any:
+        return self.get_many(key)[0]
+
+    def get_many(self, *keys: str) -> list[Any]:
+        values: dict[str, Any] = {}
+        if entries := {key: entry for key in keys if (entry := self.local.get(key))}:
+            versions = self.backend.get_many(*map(self._get_version_key, entries))
+            for (key, entry), version in zip(entries.items(), versions):
+                if version == entry.version:
+                    values[key] = copy_value(entry.value)
+                else:
+                    self.local.delete(key)
+
+        if misses := [key for key in keys if key not in values]:
+            version_keys = list(map(self._get_version_key, misses))
+            fetched = self.backend.get_many(*misses, *version_keys)
+            for key, stored, version in zip(
+                misses, fetched[: len(misses)], fetched[len(misses) :]
+            ):
+                value, stamp = self._unwrap(stored)
+                if value is not None and stamp is not None and stamp == version:
+                    self.local.set(key, value, version, self._normalize_timeout(None))
+                    value = copy_value(value)
+                values[key] = value
+
+        self._incr("local_cache_hit", len(keys) - len(misses))
+        self._incr("local_cache_miss", len(misses))
+        return [values[key] for key in keys]
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        self.local.delete(key)
+        version = uuid4().hex
+        version_key = self._get_version_key(key)
+        # the local values of the previous version are stale once the value is written
+        self.backend.delete(version_key)
+        stored = {VERSION_STAMP_KEY: version, "value": value}
+        if not self.backend.set(key, stored, timeout):
+            return False
+        self.backend.set(version_key, version, timeout)
+        return True
+
+    def set_many(
+        self, mapping: dict[str, Any], timeout: Optional[int] = None
+    ) -> list[Any]:
+        return [key for key, value in mapping.items() if self.set(key, value, timeout)]
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        self.local.delete(key)
+        return self.backend.add(key, value, timeout)
+
+    def delete(self, key: str) -> bool:
+        self.local.delete(key)
+        self.backend.delete(self._get_version_key(key))
+        return self.backend.delete(key)
+
+    def delete_many(self, *keys: str) -> list[Any]:
+        for key in keys:
+            self.local.delete(key)
+        self.backend.delete_many(*map(self._get_version_key, keys))
+        return self.backend.delete_many(*keys)
+
+    def has(self, key: str) -> bool:
+        return self.backend.has(key)
+
+    def clear(self) -> bool:
+        self.local.clear()
+        return self.backend.clear()
+
+    def inc(self, key: str, delta: int = 1) -> Optional[int]:
+        self.local.delete(key)
+        return self.backend.inc(key, delta)
+
+    def dec(self, key: str, delta: int = 1) -> Optional[int]:
+        self.local.delete(key)
+        return self.backend.dec(key, delta)
+
 
 class ExploreFormDataCache(Cache):
     def get(self, *args: Any, **kwargs: Any) -> Optional[Union[str, Markup]]:
@@ -86,6 +304,11 @@ class CacheManager:
 
         cache.init_app(app, cache_config)
 
+        if local_max_size := cache_config.get("CACHE_LOCAL_MAX_SIZE"):
+            app.extensions["cache"][cache] = LocalTierCache(
+                app.extensions["cache"][cache], local_max_size
+            )
+
     def init_app(self, app: Flask) -> None:
         self._init_cache(app, self._cache, "CACHE_CONFIG")
         self._init_cache(app, self._data_cache, "DATA_CACHE_CONFIG")
@@ -0,0 +1,130 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compression of payloads stored in the results backend.
+
+Compressed blobs start with a small header holding the codec and the size of the
+uncompressed data, so they can be read back whatever the configured codec is.
+Blobs without the header are legacy zlib blobs, which are still written with the
+"legacy" codec so that workers of previous releases can read them.
+"""
+import logging
+import struct
+import zlib
+from typing import Optional, Union
+
+import pyarrow as pa
+
+from superset.utils.backports import StrEnum
+
+logger = logging.getLogger(__name__)
+
+
+class CompressionCodec(StrEnum):
+    LEGACY = "legacy"
+    NONE = "none"
+    ZLIB = "zlib"
+    LZ4 = "lz4"
+    ZSTD = "zstd"
+
+
+MAGIC = b"SPRC"
+
+# magic, codec id, uncompressed size
+HEADER = struct.Struct("<4sBQ")
+
+CODEC_IDS = {
+    CompressionCodec.NONE: 0,
+    CompressionCodec.ZLIB: 1,
+    CompressionCodec.LZ4: 2,
+    CompressionCodec.ZSTD: 3,
+}
+CODECS = {codec_id: codec for codec, codec_id in CODEC_IDS.items()}
+
+# codecs provided by pyarrow, which may be built without some of them
+ARROW_CODECS = {CompressionCodec.LZ4, CompressionCodec.ZSTD}
+
+
+def get_codec(name: Optional[str]) -> CompressionCodec:
+    """
+    Return the codec with the given name, falling back to zlib when it is not
+    available in this environment.
+
+    :param name: the name of the codec, `None` meaning no compression
+    :returns: the codec
+    :raises ValueError: if the codec is unknown
+    """
+    codec = CompressionCodec(name or CompressionCodec.NONE)
+    if codec in ARROW_CODECS and not pa.Codec.is_available(codec.value):
+        logger.warning("Compression codec %s is not available, using zlib", codec)
+        return CompressionCodec.ZLIB
+    return codec
+
+
+def compress(data: Union[bytes, str], codec: Optional[str]) -> bytes:
+    """
+    Compress data, prefixing it with a header describing how to decompress it, unless
+    the legacy codec is used.
+
+    :param data: the data to compress, strings are encoded as UTF-8
+    :param codec: the name of the codec to use
+    :returns: the compressed blob
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    codec = get_codec(codec)
+    if codec == CompressionCodec.LEGACY:
+        return zlib.compress(data)
+    if codec == CompressionCodec.NONE:
+        compressed = data
+    elif codec == CompressionCodec.ZLIB:
+        compressed = zlib.compress(data)
+    else:
+        compressed = pa.compress(data, codec=codec.value, asbytes=True)
+
+    return HEADER.pack(MAGIC, CODEC_IDS[codec], len(data)) + compressed
+
+
+def decompress(blob: bytes, decode: Optional[bool] = True) -> Union[bytes, str]:
+    """
+    Decompress a blob created by `compress` or by `zlib_compress`.
+
+    :param blob: the compressed blob
+    :param decode: whether to decode the data as a UTF-8 string
+    :returns: the decompressed data
+    :raises ValueError: if the blob was compressed with an unknown codec
+    """
+    if not blob.startswith(MAGIC):
+        decompressed = zlib.decompress(blob)
+    else:
+        _, codec_id, size = HEADER.unpack_from(blob)
+        if codec_id not in CODECS:
+            raise ValueError(f"Unknown compression codec: {codec_id}")
+
+        codec = CODECS[codec_id]
+        data = memoryview(blob)[HEADER.size :]
+        if codec == CompressionCodec.NONE:
+            decompressed = bytes(data)
+        elif codec == CompressionCodec.ZLIB:
+            decompressed = zlib.decompress(data)
+        else:
+            decompressed = pa.decompress(
+                data, decompressed_size=size, codec=codec.value, asbytes=True
+            )
+
+    return decompressed.decode("utf-8") if decode else decompressed
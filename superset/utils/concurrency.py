@@ -0,0 +1,69 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from typing import Any, Callable, TypeVar
+
+from flask import current_app, g, has_request_context
+from flask.globals import request_ctx
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_in_app_context(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+) -> list[R]:
+    """
+    Apply a function to items concurrently, in a bounded pool of threads.
+
+    Each call runs in a copy of the request context, or in a new application
+    context outside of requests, holding the same `g` values (e.g. the user) as the
+    caller. Each thread has its own SQLAlchemy session and database connections, but
+    ORM objects shared with the calls should be fully loaded beforehand, as lazy
+    loading them would use the session of the caller.
+
+    :param func: the function to apply
+    :param items: the items to apply the function to
+    :param max_workers: the maximum number of concurrent calls, the function being
+        applied serially in the current thread when it is lower than 2
+    :returns: the results, in the order of the items
+    :raises Exception: the first exception raised by a call, once all of them are done
+    """
+    items = list(items)
+    if max_workers < 2 or len(items) < 2:
+        return [func(item) for item in items]
+
+    # the contexts are created in the current thread, bound to the current app
+    values = dict(vars(g))
+    contexts: list[AbstractContextManager[Any]]
+    if has_request_context():
+        contexts = [request_ctx.copy() for _ in items]
+    else:
+        contexts = [current_app.app_context() for _ in items]
+
+    def run(context: AbstractContextManager[Any], item: T) -> R:
+        with context:
+            vars(g).update(values)
+            return func(item)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(run, *args) for args in zip(contexts, items)]
+    return [future.result() for future in futures]
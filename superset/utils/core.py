@@ -46,7 +46,7 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formatdate
 from enum import Enum, IntEnum
-from io import BytesIO
+from io import BytesIO, RawIOBase
 from timeit import default_timer
 from types import TracebackType
 from typing import Any, Callable, cast, NamedTuple, TYPE_CHECKING, TypedDict, TypeVar
@@ -1844,6 +1844,54 @@ def create_zip(files: dict[str, Any]) -> BytesIO:
     return buf
 
 
+class StreamingBuffer(RawIOBase):
+    """
+    Unseekable file object buffering what is written to it until it is drained,
+    for writers streaming files as they are written.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip(files: dict[str, Iterable[bytes]]) -> Iterator[bytes]:
+    """
+    Create a zip file incrementally, yielding its content as it is written.
+
+    :param files: the chunks of the content of each file, by file name
+    :returns: an iterator over the chunks of the zip file
+    """
+    stream = StreamingBuffer()
+    with ZipFile(stream, "w") as bundle:
+        for filename, chunks in files.items():
+            # the size of the files isn't known beforehand
+            with bundle.open(filename, "w", force_zip64=True) as fp:
+                for chunk in chunks:
+                    fp.write(chunk)
+                    if data := stream.drain():
+                        yield data
+    yield stream.drain()
+
+
 def check_is_safe_zip(zip_file: ZipFile) -> None:
     """
     Checks whether a ZIP file is safe, raises SupersetException if not.
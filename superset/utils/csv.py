@@ -17,6 +17,7 @@
 import logging
 import re
 import urllib.request
+from collections.abc import Iterator
 from typing import Any, Optional, Union
 from urllib.error import URLError
 
@@ -37,6 +38,10 @@ negative_number_re = re.compile(r"^-[0-9.]+$")
 #     3. one or more spaces immediately followed by one of -, @, +, |, =, %
 #
 problematic_chars_re = re.compile(r'^(?:"{2}|\s{1,})(?=[\-@+|=%])|^[\-@+|=%]')
+PROBLEMATIC_FIRST_CHARS = ["-", "@", "+", "|", "=", "%", '"']
+
+# number of rows written at once when streaming CSV files
+CSV_CHUNK_SIZE = 10000
 
 
 def escape_value(value: str) -> str:
@@ -64,21 +69,94 @@ def escape_value(value: str) -> str:
     return value
 
 
-def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+def escape_column(column: pd.Series) -> pd.Series:
+    """
+    Escapes the string values of a column, the same way as `escape_value`.
+
+    The values needing to be escaped are found with vectorized string matching,
+    and only those are rewritten.
+    """
+    values = column.to_numpy()
+    if pd.api.types.infer_dtype(values, skipna=False) == "string":
+        strings = pd.Series(values, dtype=object)
+    else:
+        # strings indexed by their position in the column
+        is_string = np.fromiter(
+            (isinstance(value, str) for value in values),
+            dtype=bool,
+            count=len(values),
+        )
+        if not is_string.any():
+            return column
+        positions = np.flatnonzero(is_string)
+        strings = pd.Series(values[positions], index=positions, dtype=object)
+
+    # only values starting with one of the prefixes of `problematic_chars_re` can
+    # need escaping, the regular expressions are matched against those only
+    first_chars = strings.str[:1]
+    strings = strings[
+        first_chars.isin(PROBLEMATIC_FIRST_CHARS) | first_chars.str.isspace()
+    ]
+    strings = strings[
+        strings.str.match(problematic_chars_re.pattern)
+        & ~strings.str.match(negative_number_re.pattern)
+    ]
+    if strings.empty:
+        return column
+
+    escaped = "'" + strings.str.replace("|", "\\|", regex=False)
+    values = values.copy()
+    values[escaped.index] = escaped.to_numpy()
+    return pd.Series(values, index=column.index, name=column.name)
+
+
+def escape_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Escapes the headers and the string values of a DataFrame for CSV exports.
+
+    The DataFrame is not modified, the escaped columns are set on a shallow copy.
+    """
+
     def escape_values(v: Any) -> Union[str, Any]:
         return escape_value(v) if isinstance(v, str) else v
 
     # Escape csv headers
-    df = df.rename(columns=escape_values)
+    df = df.rename(columns=escape_values, copy=False)
 
     # Escape csv values
-    for name, column in df.items():
+    for i, (_, column) in enumerate(df.items()):
         if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+            escaped = escape_column(column)
+            if escaped is not column:
+                df.isetitem(i, escaped)
 
-    return df.to_csv(**kwargs)
+    return df
+
+
+def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+    return escape_dataframe(df).to_csv(**kwargs)
+
+
+def df_to_escaped_csv_chunks(
+    df: pd.DataFrame,
+    chunk_size: int = CSV_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """
+    Write an escaped CSV file in chunks of rows, without building the whole file.
+
+    :param df: the DataFrame to export
+    :param chunk_size: the number of rows written in each chunk
+    :param kwargs: the arguments passed to `DataFrame.to_csv`
+    :returns: an iterator over the chunks of the CSV file
+    """
+    header = kwargs.pop("header", True)
+    for start in range(0, max(len(df), 1), chunk_size):
+        yield df_to_escaped_csv(
+            df.iloc[start : start + chunk_size],
+            header=header if start == 0 else False,
+            **kwargs,
+        )
 
 
 def get_chart_csv_data(
@@ -0,0 +1,131 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.pool import QueuePool
+
+from superset.extensions import stats_logger_manager
+from superset.utils.dates import now_as_float
+from superset.utils.hashing import md5_sha_from_str
+
+logger = logging.getLogger(__name__)
+
+
+class CheckoutTimedQueuePool(QueuePool):
+    """
+    A queue pool reporting how long checking out connections takes, i.e. waiting for
+    a connection to be returned to the pool or opening a new one.
+    """
+
+    def _do_get(self) -> Any:
+        start = now_as_float()
+        try:
+            return super()._do_get()
+        finally:
+            stats_logger = stats_logger_manager.instance
+            stats_logger.timing("database_pool_checkout_wait", now_as_float() - start)
+            stats_logger.gauge("database_pool_checkedout", self.checkedout())
+
+
+class EngineRegistry:
+    """
+    A registry of the SQLAlchemy engines of the databases of a process, so that
+    their pooled connections are reused across queries.
+
+    Engines are keyed on their database, their URL, which holds the impersonated
+    user, and their parameters, which hold the connection arguments. The least
+    recently used engines are disposed of when there are too many of them.
+    """
+
+    def __init__(self) -> None:
+        self._engines: OrderedDict[tuple[int | None, str], Engine] = OrderedDict()
+        self._lock = threading.Lock()
+        # connections can't be shared with forked processes, e.g. Celery workers
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._engines.clear)
+
+    @staticmethod
+    def get_key(
+        database_id: int | None,
+        url: URL,
+        params: dict[str, Any],
+    ) -> tuple[int | None, str]:
+        value = json.dumps(
+            {"url": url.render_as_string(hide_password=False), "params": params},
+            sort_keys=True,
+            default=str,
+        )
+        return database_id, md5_sha_from_str(value)
+
+    def get_engine(  # pylint: disable=too-many-arguments
+        self,
+        database_id: int | None,
+        url: URL,
+        params: dict[str, Any],
+        create_engine: Callable[..., Engine],
+        max_size: int,
+    ) -> Engine:
+        """
+        Get the engine of a database, creating it if it isn't registered yet.
+
+        :param database_id: the id of the database
+        :param url: the URL of the engine
+        :param params: the parameters of the engine
+        :param create_engine: the function creating the engine
+        :param max_size: the maximum number of engines to keep
+        :returns: the engine
+        """
+        key = self.get_key(database_id, url, params)
+        with self._lock:
+            if engine := self._engines.get(key):
+                self._engines.move_to_end(key)
+                return engine
+
+            engine = create_engine(url, **params)
+            self._engines[key] = engine
+            stats_logger_manager.instance.incr("database_engine_created")
+            while len(self._engines) > max_size:
+                _, evicted = self._engines.popitem(last=False)
+                evicted.dispose()
+            return engine
+
+    def dispose(self, database_id: int | None) -> None:
+        """
+        Dispose of the engines of a database, e.g. when its settings change.
+
+        :param database_id: the id of the database
+        """
+        with self._lock:
+            keys = [key for key in self._engines if key[0] == database_id]
+            for key in keys:
+                self._engines.pop(key).dispose()
+        if keys:
+            logger.info(
+                "Disposed of %s engines of the database %s", len(keys), database_id
+            )
+
+
+engine_registry = EngineRegistry()
@@ -15,9 +15,23 @@
 # specific language governing permissions and limitations
 # under the License.
 import io
+import tempfile
+from collections.abc import Iterator
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 from typing import Any
 
 import pandas as pd
+import xlsxwriter
+
+# number of rows converted at once when streaming Excel files
+EXCEL_CHUNK_SIZE = 10000
+
+# size of the chunks of the Excel file yielded when streaming
+EXCEL_READ_SIZE = 1024 * 1024
+
+# types written natively by xlsxwriter, other values are written as strings
+EXCEL_TYPES = (str, bool, int, float, Decimal, datetime, date, time, timedelta)
 
 
 def df_to_excel(df: pd.DataFrame, **kwargs: Any) -> Any:
@@ -32,3 +46,81 @@ def df_to_excel(df: pd.DataFrame, **kwargs: Any) -> Any:
         df.to_excel(writer, **kwargs)
 
     return output.getvalue()
+
+
+def df_to_excel_chunks(
+    df: pd.DataFrame,
+    index: bool = True,
+    sheet_name: str = "Sheet1",
+    **kwargs: Any,
+) -> Iterator[bytes]:
+    """
+    Write an Excel file in constant memory, yielding it in chunks of bytes.
+
+    The rows are written one by one with the `constant_memory` mode of xlsxwriter
+    into a temporary file, which is then read back in chunks. DataFrames with
+    hierarchical columns or index, or other arguments than the ones of this
+    function, are written with `df_to_excel` instead.
+
+    :param df: the DataFrame to export
+    :param index: whether to write the index
+    :param sheet_name: the name of the worksheet
+    :param kwargs: other arguments passed to `DataFrame.to_excel`
+    :returns: an iterator over the chunks of the Excel file
+    """
+    if (
+        kwargs
+        or isinstance(df.columns, pd.MultiIndex)
+        or isinstance(df.index, pd.MultiIndex)
+    ):
+        yield df_to_excel(df, index=index, sheet_name=sheet_name, **kwargs)
+        return
+
+    # timezones are not supported
+    df = df.copy(deep=False)
+    for column in df.select_dtypes(include=["datetimetz"]).columns:
+        df[column] = df[column].astype(str)
+
+    header = list(df.columns)
+    if index:
+        header.insert(0, df.index.name)
+
+    with tempfile.TemporaryFile() as output:
+        workbook = xlsxwriter.Workbook(
+            output,
+            {
+                "constant_memory": True,
+                "default_date_format": "yyyy-mm-dd hh:mm:ss",
+                "nan_inf_to_errors": True,
+            },
+        )
+        worksheet = workbook.add_worksheet(sheet_name)
+        header_format = workbook.add_format({"bold": True, "border": 1})
+        worksheet.write_row(
+            0,
+            0,
+            ["" if name is None else _to_excel_value(name) for name in header],
+            header_format,
+        )
+
+        # rows must be written in order in constant memory mode
+        for start in range(0, len(df), EXCEL_CHUNK_SIZE):
+            chunk = df.iloc[start : start + EXCEL_CHUNK_SIZE].astype(object)
+            chunk = chunk.where(chunk.notna(), None)
+            for row_number, row in enumerate(
+                chunk.itertuples(index=index, name=None), start=start + 1
+            ):
+                worksheet.write_row(
+                    row_number, 0, [_to_excel_value(value) for value in row]
+                )
+        workbook.close()
+
+        output.seek(0)
+        while data := output.read(EXCEL_READ_SIZE):
+            yield data
+
+
+def _to_excel_value(value: Any) -> Any:
+    if value is None or isinstance(value, EXCEL_TYPES):
+        return value
+    return str(value)
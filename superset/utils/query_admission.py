@@ -0,0 +1,214 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, TYPE_CHECKING
+from uuid import uuid4
+
+from flask import current_app as app
+from flask_babel import gettext as __
+
+from superset.exceptions import QueryQueueTimeoutException
+from superset.extensions import cache_manager, stats_logger_manager
+from superset.utils.backports import StrEnum
+from superset.utils.dates import now_as_float
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+QUERY_SLOTS_KEY_PREFIX = "database_query_slots"
+QUERY_QUEUE_POLL_INTERVAL = 0.1  # seconds
+# how long queued interactive queries hold back background ones after their last poll
+QUERY_QUEUE_PRIORITY_TIMEOUT = 2  # seconds
+
+# the databases whose slots are held by the current thread, so that nested
+# connections to the same database don't wait for themselves
+_held = threading.local()
+
+
+class QueryPriority(StrEnum):
+    """
+    The priority of queries waiting for a slot.
+    """
+
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+def get_query_limits(database: Database, username: str | None) -> list[tuple[str, int]]:
+    """
+    Return the concurrency limits applying to the queries of a user on a database.
+
+    :param database: the database being queried
+    :param username: the user running the queries, if any
+    :returns: the prefixes of the slot keys and the number of slots of each limit
+    """
+    limits = []
+    limit = app.config["DATABASE_QUERY_CONCURRENCY_LIMITS"].get(
+        database.database_name,
+        app.config["DATABASE_QUERY_CONCURRENCY_DEFAULT_LIMIT"],
+    )
+    if limit:
+        limits.append((f"{QUERY_SLOTS_KEY_PREFIX}__{database.id}", limit))
+    user_limit = app.config["DATABASE_QUERY_CONCURRENCY_USER_LIMIT"]
+    if user_limit and username:
+        limits.append(
+            (f"{QUERY_SLOTS_KEY_PREFIX}__{database.id}__{username}", user_limit)
+        )
+    return limits
+
+
+def _acquire_slots(
+    cache: Any,
+    limits: list[tuple[str, int]],
+    token: str,
+    timeout: int,
+) -> list[str] | None:
+    slots: list[str] = []
+    for prefix, limit in limits:
+        slot = next(
+            (
+                f"{prefix}__{i}"
+                for i in range(limit)
+                if cache.add(f"{prefix}__{i}", token, timeout=timeout)
+            ),
+            None,
+        )
+        if slot is None:
+            _release_slots(cache, slots, token)
+            return None
+        slots.append(slot)
+    return slots
+
+
+def _release_slots(cache: Any, slots: list[str], token: str) -> None:
+    for slot in slots:
+        # the slot may have expired and been acquired by another query
+        if cache.get(slot) == token:
+            cache.delete(slot)
+
+
+def _update_queue_depth(cache: Any, database_id: int, delta: int) -> None:
+    try:
+        depth = cache.cache.inc(
+            f"{QUERY_SLOTS_KEY_PREFIX}__{database_id}__queued", delta
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to update the query queue depth", exc_info=True)
+        return
+    if depth is not None:
+        stats_logger_manager.instance.gauge("database_query_queue_depth", depth)
+
+
+def _wait_for_slots(
+    cache: Any,
+    database: Database,
+    limits: list[tuple[str, int]],
+    token: str,
+    priority: QueryPriority,
+) -> list[str]:
+    priority_key = (
+        f"{QUERY_SLOTS_KEY_PREFIX}__{database.id}__{QueryPriority.INTERACTIVE}"
+    )
+    lease = app.config["DATABASE_QUERY_SLOT_TIMEOUT"]
+    deadline = time.monotonic() + app.config["DATABASE_QUERY_QUEUE_TIMEOUT"]
+    queued = False
+    try:
+        while True:
+            # background queries let queued interactive ones go first
+            if priority == QueryPriority.INTERACTIVE or not cache.has(priority_key):
+                if slots := _acquire_slots(cache, limits, token, lease):
+                    return slots
+            if time.monotonic() >= deadline:
+                break
+            if not queued:
+                queued = True
+                _update_queue_depth(cache, database.id, 1)
+            if priority == QueryPriority.INTERACTIVE:
+                cache.set(priority_key, True, timeout=QUERY_QUEUE_PRIORITY_TIMEOUT)
+            time.sleep(QUERY_QUEUE_POLL_INTERVAL)
+    finally:
+        if queued:
+            _update_queue_depth(cache, database.id, -1)
+
+    stats_logger_manager.instance.incr("database_query_queue_timeout")
+    raise QueryQueueTimeoutException(
+        __(
+            "The database %(database)s is running too many queries. Please try "
+            "again later.",
+            database=database.database_name,
+        )
+    )
+
+
+@contextmanager
+def admit_query(
+    database: Database,
+    username: str | None,
+    priority: QueryPriority,
+) -> Iterator[None]:
+    """
+    Hold a slot of each concurrency limit of a database while querying it.
+
+    Slots are keys stored in the cache with its atomic `add`, so that the limits are
+    shared by all the web and Celery workers. When no slot is free the query is
+    queued, polling for a slot for up to `DATABASE_QUERY_QUEUE_TIMEOUT` seconds, with
+    interactive queries taking precedence over background ones. Queries are admitted
+    unthrottled when the cache fails.
+
+    :param database: the database being queried
+    :param username: the user running the query, if any
+    :param priority: the priority of the query
+    :returns: a context manager holding the slots
+    :raises QueryQueueTimeoutException: if no slot was freed in time
+    """
+    held: set[int] = vars(_held).setdefault("databases", set())
+    limits = get_query_limits(database, username)
+    if not limits or database.id in held:
+        yield
+        return
+
+    cache = cache_manager.cache
+    token = uuid4().hex
+    start = now_as_float()
+    try:
+        slots = _wait_for_slots(cache, database, limits, token, priority)
+    except QueryQueueTimeoutException:
+        raise
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to acquire a query slot", exc_info=True)
+        slots = []
+    stats_logger_manager.instance.timing(
+        f"database_query_queue_wait.{priority}", now_as_float() - start
+    )
+
+    held.add(database.id)
+    try:
+        yield
+    finally:
+        held.discard(database.id)
+        try:
+            _release_slots(cache, slots, token)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Unable to release the query slots", exc_info=True)
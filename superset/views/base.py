@@ -79,6 +79,7 @@ from superset.reports.models import ReportRecipientType
 from superset.superset_typing import FlaskResponse
 from superset.translations.utils import get_language_pack
 from superset.utils import core as utils
+from superset.utils.arrow import ARROW_STREAM_MIMETYPE, PARQUET_MIMETYPE
 from superset.utils.filters import get_dataset_access_filters
 
 from .utils import bootstrap_user_data
@@ -681,6 +682,22 @@ class CsvResponse(Response):
     default_mimetype = "text/csv"
 
 
+class ArrowResponse(Response):
+    """
+    Override Response to use the Arrow IPC stream mimetype
+    """
+
+    default_mimetype = ARROW_STREAM_MIMETYPE
+
+
+class ParquetResponse(Response):
+    """
+    Override Response to use the Parquet mimetype
+    """
+
+    default_mimetype = PARQUET_MIMETYPE
+
+
 class XlsxResponse(Response):
     """
     Override Response to use xlsx mimetype
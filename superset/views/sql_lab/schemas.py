@@ -33,3 +33,4 @@ class SqlJsonPayloadSchema(Schema):
     json = fields.Boolean(allow_none=True)
     runAsync = fields.Boolean(allow_none=True)
     expand_data = fields.Boolean(allow_none=True)
+    columnar = fields.Boolean(allow_none=True)
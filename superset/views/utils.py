@@ -18,9 +18,10 @@ import contextlib
 import logging
 from collections import defaultdict
 from functools import wraps
-from typing import Any, Callable, DefaultDict, Optional, Union
+from typing import Any, Callable, DefaultDict, NamedTuple, Optional, Union
 
 import msgpack
+import pandas as pd
 import pyarrow as pa
 import simplejson as json
 from flask import flash, g, has_request_context, redirect, request
@@ -46,7 +47,9 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.chunked_results import read_chunked_results
 from superset.superset_typing import FormData
+from superset.utils.arrow import df_to_arrow_table
 from superset.utils.core import DatasourceType
 from superset.utils.decorators import stats_timing
 from superset.viz import BaseViz
@@ -59,6 +62,20 @@ if not feature_flag_manager.is_feature_enabled("ENABLE_JAVASCRIPT_CONTROLS"):
     REJECTED_FORM_DATA_KEYS = ["js_tooltip", "js_onclick_href", "js_data_mutator"]
 
 
+class ResultsOptions(NamedTuple):
+    """
+    The shape and the page of the data of SQL Lab results.
+
+    :param columnar: return the data as a mapping of column name to values
+    :param offset: the index of the first row to return
+    :param limit: the maximum number of rows to return, all when `None`
+    """
+
+    columnar: bool = False
+    offset: int = 0
+    limit: Optional[int] = None
+
+
 def sanitize_datasource_data(datasource_data: dict[str, Any]) -> dict[str, Any]:
     if datasource_data:
         datasource_database = datasource_data.get("database")
@@ -496,42 +513,148 @@ def check_datasource_perms(
     viz_obj.raise_for_access()
 
 
+def _read_results_table(
+    ds_payload: dict[str, Any],
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> pa.Table:
+    """
+    Read the Arrow table of a msgpack results payload, stored in chunks or not.
+    """
+    with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
+        if chunks := ds_payload.pop("chunks", None):
+            # only the chunks holding the requested rows are read
+            return read_chunked_results(chunks, offset, limit)
+
+        try:
+            reader = pa.BufferReader(ds_payload["data"])
+            pa_table = pa.ipc.open_stream(reader).read_all()
+        except pa.ArrowSerializationError as ex:
+            raise SerializationError("Unable to deserialize table") from ex
+        if offset or limit is not None:
+            pa_table = pa_table.slice(offset, limit)
+        return pa_table
+
+
+def _deserialize_results_table(
+    payload: Union[bytes, str],
+    use_msgpack: Optional[bool] = False,
+) -> pa.Table:
+    """
+    Deserialize the data of a SQL Lab results payload as an Arrow table.
+
+    With msgpack the stored Arrow data is returned as is, without complex type
+    expansion nor conversion to pandas.
+    """
+    if use_msgpack:
+        with stats_timing(
+            "sqllab.query.results_backend_msgpack_deserialize", stats_logger
+        ):
+            ds_payload = msgpack.loads(payload, raw=False)
+        return _read_results_table(ds_payload)
+
+    with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
+        ds_payload = json.loads(payload)
+    return df_to_arrow_table(pd.DataFrame(ds_payload["data"]))
+
+
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    options: Optional[ResultsOptions] = None,
 ) -> dict[str, Any]:
+    """
+    Deserialize a SQL Lab results payload read from the results backend.
+
+    :param payload: the decompressed payload
+    :param query: the query the results belong to
+    :param use_msgpack: whether the payload was serialized with msgpack and Arrow
+    :param options: the shape and the page of the data to return, all its rows
+        as records by default
+    :returns: the deserialized payload
+    """
+    options = options or ResultsOptions()
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
         with stats_timing(
             "sqllab.query.results_backend_msgpack_deserialize", stats_logger
         ):
             ds_payload = msgpack.loads(payload, raw=False)
+        return _read_msgpack_results(ds_payload, query, options)
 
-        with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
-            try:
-                reader = pa.BufferReader(ds_payload["data"])
-                pa_table = pa.ipc.open_stream(reader).read_all()
-            except pa.ArrowSerializationError as ex:
-                raise SerializationError("Unable to deserialize table") from ex
+    with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
+        ds_payload = json.loads(payload)
+
+    # the data is stored in the shape requested when executing the query
+    data = ds_payload["data"]
+    if options.columnar and not isinstance(data, dict):
+        data = {
+            column["column_name"]: [
+                record.get(column["column_name"]) for record in data
+            ]
+            for column in ds_payload["columns"]
+        }
+    elif not options.columnar and isinstance(data, dict):
+        data = [dict(zip(data, row)) for row in zip(*data.values())]
+    ds_payload["data"] = _page_results_data(data, options)
 
-        df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
-        ds_payload["data"] = dataframe.df_to_records(df) or []
+    return ds_payload
 
-        for column in ds_payload["selected_columns"]:
-            if "name" in column:
-                column["column_name"] = column.get("name")
 
-        db_engine_spec = query.database.db_engine_spec
-        all_columns, data, expanded_columns = db_engine_spec.expand_data(
-            ds_payload["selected_columns"], ds_payload["data"]
-        )
-        ds_payload.update(
-            {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
-        )
+def _read_msgpack_results(
+    ds_payload: dict[str, Any],
+    query: Query,
+    options: ResultsOptions,
+) -> dict[str, Any]:
+    """
+    Read the data of a msgpack results payload, expanding its complex types.
+    """
+    # expanding complex types changes the rows, which are then paged afterwards
+    db_engine_spec = query.database.db_engine_spec
+    expands_data = not options.columnar and db_engine_spec.expands_data()
+    if expands_data:
+        pa_table = _read_results_table(ds_payload)
+    else:
+        pa_table = _read_results_table(ds_payload, options.offset, options.limit)
+    df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
 
+    for column in ds_payload["selected_columns"]:
+        if "name" in column:
+            column["column_name"] = column.get("name")
+
+    if options.columnar:
+        # complex type expansion operates on records
+        ds_payload["data"] = dataframe.df_to_columns(df)
         return ds_payload
 
-    with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+    ds_payload["data"] = dataframe.df_to_records(df) or []
+    all_columns, data, expanded_columns = db_engine_spec.expand_data(
+        ds_payload["selected_columns"], ds_payload["data"]
+    )
+    if expands_data:
+        data = _page_results_data(data, options)
+    ds_payload.update(
+        {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
+    )
+
+    return ds_payload
+
+
+def _page_results_data(
+    data: Union[list[Any], dict[str, list[Any]]],
+    options: ResultsOptions,
+) -> Union[list[Any], dict[str, list[Any]]]:
+    """
+    Return the rows of the requested page of results data, as records or columnar.
+    """
+    if not options.offset and options.limit is None:
+        return data
+
+    end = None if options.limit is None else options.offset + options.limit
+    if isinstance(data, dict):
+        return {column: values[options.offset : end] for column, values in data.items()}
+    return data[options.offset : end]
 
 
 def get_cta_schema_name(
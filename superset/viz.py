@@ -66,7 +66,7 @@ from superset.superset_typing import (
     VizPayload,
 )
 from superset.utils import core as utils, csv
-from superset.utils.cache import set_and_log_cache
+from superset.utils.cache import get_datasource_generation, set_and_log_cache
 from superset.utils.core import (
     apply_max_row_limit,
     DateColumn,
@@ -469,6 +469,8 @@ class BaseViz:  # pylint: disable=too-many-public-methods
         cache_dict["extra_cache_keys"] = self.datasource.get_extra_cache_keys(query_obj)
         cache_dict["rls"] = security_manager.get_rls_cache_key(self.datasource)
         cache_dict["changed_on"] = self.datasource.changed_on
+        if (generation := get_datasource_generation(self.datasource.uid)) is not None:
+            cache_dict["generation"] = generation
         json_data = self.json_dumps(cache_dict, sort_keys=True)
         return md5_sha_from_str(json_data)
 
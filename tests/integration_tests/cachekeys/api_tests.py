@@ -22,6 +22,7 @@ import pytest
 
 from superset.extensions import cache_manager, db
 from superset.models.cache import CacheKey
+from superset.utils.cache import get_datasource_generation
 from superset.utils.core import get_example_default_schema
 from tests.integration_tests.base_tests import (
     SupersetTestCase,
@@ -62,6 +63,17 @@ def test_invalidate_existing_cache(invalidate):
     )
 
 
+def test_invalidate_cache_generation(invalidate):
+    generation = get_datasource_generation("3__table")
+    assert generation is not None
+    assert get_datasource_generation("3__table") == generation
+
+    rv = invalidate({"datasource_uids": ["3__table"]})
+
+    assert rv.status_code == 201
+    assert get_datasource_generation("3__table") == generation + 1
+
+
 def test_invalidate_cache_empty_input(invalidate):
     rv = invalidate({"datasource_uids": []})
     assert rv.status_code == 201
@@ -25,6 +25,9 @@ from typing import Any, Optional
 from unittest import mock
 from zipfile import ZipFile
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from flask import Response
 from tests.integration_tests.conftest import with_feature_flags
 from superset.models.sql_lab import Query
@@ -56,6 +59,7 @@ from superset.utils.core import (
     AdhocMetricExpressionType,
     ExtraFiltersReasonType,
 )
+from superset.utils.arrow import read_arrow_stream
 from superset.utils.database import get_example_database, get_main_database
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 
@@ -304,6 +308,21 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         assert rv.mimetype == "application/zip"
         zipfile = ZipFile(BytesIO(rv.data), "r")
         assert zipfile.namelist() == ["query_1.csv", "query_2.csv"]
+        assert zipfile.read("query_1.csv") == zipfile.read("query_2.csv")
+        assert zipfile.read("query_1.csv").startswith(b"name,sum__num\n")
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_csv_result_format_streamed(self):
+        """
+        Chart data API: Test chart data with CSV result format is streamed
+        """
+        self.query_context_payload["result_format"] = "csv"
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.is_streamed
+        df = pd.read_csv(BytesIO(rv.data))
+        assert list(df.columns) == ["name", "sum__num"]
+        assert len(df) == self.query_context_payload["queries"][0]["row_limit"]
 
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_with_multi_query_excel_result_format(self):
@@ -319,6 +338,90 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         assert rv.mimetype == "application/zip"
         zipfile = ZipFile(BytesIO(rv.data), "r")
         assert zipfile.namelist() == ["query_1.xlsx", "query_2.xlsx"]
+        df = pd.read_excel(BytesIO(zipfile.read("query_1.xlsx")), index_col=0)
+        assert list(df.columns) == ["name", "sum__num"]
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_columnar_result_shape(self):
+        """
+        Chart data API: Test chart data with columnar JSON result shape
+        """
+        self.query_context_payload["result_shape"] = "columnar"
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        result = rv.json["result"][0]
+        assert list(result["data"]) == result["colnames"]
+        assert all(
+            len(values) == result["rowcount"] for values in result["data"].values()
+        )
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_arrow_result_format(self):
+        """
+        Chart data API: Test chart data with Arrow result format
+        """
+        self.query_context_payload["result_format"] = "arrow"
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "application/vnd.apache.arrow.stream"
+        table, metadata = read_arrow_stream(rv.data)
+        assert table.column_names == metadata["colnames"]
+        assert table.num_rows == metadata["rowcount"]
+        assert "coltypes" in metadata
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_multi_query_arrow_result_format(self):
+        """
+        Chart data API: Test chart data with multi-query Arrow result format
+        """
+        self.query_context_payload["result_format"] = "arrow"
+        self.query_context_payload["queries"].append(
+            self.query_context_payload["queries"][0]
+        )
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "application/zip"
+        zipfile = ZipFile(BytesIO(rv.data), "r")
+        assert zipfile.namelist() == ["query_1.arrow", "query_2.arrow"]
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_empty_request_with_parquet_result_format(self):
+        """
+        Chart data API: Test empty chart data with Parquet result format
+        """
+        self.query_context_payload["result_format"] = "parquet"
+        self.query_context_payload["queries"] = []
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 400
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_parquet_result_format(self):
+        """
+        Chart data API: Test chart data with Parquet result format
+        """
+        self.query_context_payload["result_format"] = "parquet"
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "application/vnd.apache.parquet"
+        table = pq.read_table(pa.BufferReader(rv.data))
+        assert table.column_names == ["name", "sum__num"]
+        assert table.num_rows == self.query_context_payload["queries"][0]["row_limit"]
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_multi_query_parquet_result_format(self):
+        """
+        Chart data API: Test chart data with multi-query Parquet result format
+        """
+        self.query_context_payload["result_format"] = "parquet"
+        self.query_context_payload["queries"].append(
+            self.query_context_payload["queries"][0]
+        )
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        assert rv.mimetype == "application/zip"
+        zipfile = ZipFile(BytesIO(rv.data), "r")
+        assert zipfile.namelist() == ["query_1.parquet", "query_2.parquet"]
+        assert zipfile.read("query_1.parquet") == zipfile.read("query_2.parquet")
 
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_with_csv_result_format_when_actor_not_permitted_for_csv__403(self):
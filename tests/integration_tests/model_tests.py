@@ -41,6 +41,7 @@ from superset.common.db_query_status import QueryStatus
 from superset.models.core import Database
 from superset.models.slice import Slice
 from superset.utils.database import get_example_database
+from superset.utils.engine_registry import CheckoutTimedQueuePool
 
 from .base_tests import SupersetTestCase
 from .fixtures.energy_dashboard import (
@@ -408,6 +409,36 @@ class TestDatabaseModel(SupersetTestCase):
         with self.assertRaises(SupersetException):
             model._get_sqla_engine()
 
+    def test_get_sqla_engine_pooled(self):
+        model = Database(
+            database_name="test_pooled_database",
+            sqlalchemy_uri=get_example_database().sqlalchemy_uri_decrypted,
+        )
+        metadata_db.session.add(model)
+        metadata_db.session.commit()
+
+        with mock.patch.dict(app.config, {"DATABASE_ENGINE_POOLING": True}):
+            with model.get_sqla_engine_with_context() as engine:
+                assert isinstance(engine.pool, CheckoutTimedQueuePool)
+                with engine.connect() as conn:
+                    assert conn.execute("SELECT 1").scalar() == 1
+            with model.get_sqla_engine_with_context() as other_engine:
+                assert other_engine is engine
+            with model.get_sqla_engine_with_context(nullpool=False) as other_engine:
+                assert other_engine is engine
+
+            model.extra = json.dumps({"engine_params": {"pool_size": 1}})
+            metadata_db.session.commit()
+            with model.get_sqla_engine_with_context() as other_engine:
+                assert other_engine is not engine
+                assert other_engine.pool.size() == 1
+
+        with model.get_sqla_engine_with_context() as other_engine:
+            assert not isinstance(other_engine.pool, CheckoutTimedQueuePool)
+
+        metadata_db.session.delete(model)
+        metadata_db.session.commit()
+
 
 class TestSqlaTableModel(SupersetTestCase):
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
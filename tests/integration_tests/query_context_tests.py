@@ -14,9 +14,12 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import copy
 import re
 import time
+from datetime import datetime, timedelta
 from typing import Any
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -28,11 +31,17 @@ from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context import QueryContext
 from superset.common.query_context_factory import QueryContextFactory
+from superset.common.query_context_processor import (
+    CachedTimeOffset,
+    QueryContextProcessor,
+)
 from superset.common.query_object import QueryObject
 from superset.connectors.sqla.models import SqlMetric
 from superset.daos.datasource import DatasourceDAO
 from superset.extensions import cache_manager
+from superset.models.helpers import QueryResult
 from superset.superset_typing import AdhocColumn
+from superset.utils.concurrency import map_in_app_context
 from superset.utils.core import (
     AdhocMetricExpressionType,
     backend,
@@ -47,6 +56,7 @@ from tests.integration_tests.fixtures.birth_names_dashboard import (
     load_birth_names_data,
 )
 from tests.integration_tests.fixtures.query_context import get_query_context
+from tests.integration_tests.test_app import app
 
 
 def get_sql_text(payload: dict[str, Any]) -> str:
@@ -134,6 +144,162 @@ class TestQueryContext(SupersetTestCase):
         self.assertEqual(rehydrated_qc.result_format, query_context.result_format)
         self.assertFalse(rehydrated_qc.force)
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @mock.patch.dict(app.config, {"DATA_CACHE_STALE_WHILE_REVALIDATE": 120})
+    @mock.patch("superset.tasks.async_queries.refresh_chart_data_cache.delay")
+    def test_stale_while_revalidate(self, refresh_delay):
+        """
+        Ensure that expired data is served while being refreshed in the background.
+        """
+        from superset.tasks.async_queries import refresh_chart_data_cache
+
+        payload = get_query_context("birth_names")
+        payload["custom_cache_timeout"] = 60
+
+        def get_df_payload() -> dict[str, Any]:
+            query_context = ChartDataQueryContextSchema().load(payload)
+            return query_context.get_df_payload(query_context.queries[0])
+
+        def set_cached_dttm(cache_key: str, age: int) -> None:
+            cached = cache_manager.data_cache.get(cache_key)
+            dttm = datetime.utcnow() - timedelta(seconds=age)
+            cached["dttm"] = dttm.isoformat().split(".")[0]
+            cache_manager.data_cache.set(cache_key, cached, timeout=180)
+
+        payload["force"] = True
+        cache_key = get_df_payload()["cache_key"]
+        cache_manager.data_cache.delete(f"{cache_key}__refresh")
+        payload["force"] = False
+
+        response = get_df_payload()
+        assert response["is_cached"]
+        assert not response["is_stale"]
+
+        # expired data is served, and refreshed only once
+        set_cached_dttm(cache_key, 90)
+        response = get_df_payload()
+        assert response["is_cached"]
+        assert response["is_stale"]
+        assert get_df_payload()["is_stale"]
+        refresh_delay.assert_called_once()
+        job_metadata, form_data, refresh_key = refresh_delay.call_args[0]
+        assert form_data["queries"] == payload["queries"]
+
+        refresh_chart_data_cache(job_metadata, form_data, refresh_key)
+        assert not cache_manager.data_cache.has(refresh_key)
+        response = get_df_payload()
+        assert response["is_cached"]
+        assert not response["is_stale"]
+
+        # refreshed data expiring again is refreshed again
+        set_cached_dttm(cache_key, 90)
+        assert get_df_payload()["is_stale"]
+        assert refresh_delay.call_count == 2
+        cache_manager.data_cache.delete(refresh_key)
+
+        # data older than the window is reloaded
+        set_cached_dttm(cache_key, 180)
+        response = get_df_payload()
+        assert not response["is_cached"]
+        assert not response["is_stale"]
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_get_payload_reads_cache_once(self):
+        """
+        Ensure that the cached payloads of all the queries are read at once.
+        """
+        payload = get_query_context("birth_names")
+        payload["queries"].append({**payload["queries"][0], "row_limit": 5})
+        payload["force"] = True
+        ChartDataQueryContextSchema().load(payload).get_payload()
+        payload["force"] = False
+
+        query_context = ChartDataQueryContextSchema().load(payload)
+        data_cache = cache_manager.data_cache.cache
+        with mock.patch.object(
+            data_cache, "get_many", wraps=data_cache.get_many
+        ) as get_many, mock.patch(
+            "superset.common.query_context_processor.stats_logger"
+        ) as stats_logger:
+            response = query_context.get_payload()
+
+        get_many.assert_called_once()
+        assert len(get_many.call_args[0]) == 2
+        assert [query["is_cached"] for query in response["queries"]] == [True, True]
+        assert len(response["queries"][1]["data"]) == 5
+        stats_logger.gauge.assert_any_call("query_context.cache_hits", 2)
+        stats_logger.gauge.assert_any_call("query_context.cache_misses", 0)
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_raw_query_result_cache(self):
+        """
+        Ensure that queries differing only by their post processing run once.
+        """
+        payload = get_query_context("birth_names")
+        payload["queries"][0]["post_processing"] = [
+            {"operation": "sort", "options": {"by": "name"}}
+        ]
+        payload["force"] = True
+        ChartDataQueryContextSchema().load(payload).get_payload()
+        payload["force"] = False
+
+        payload["queries"][0]["post_processing"] = [
+            {"operation": "sort", "options": {"by": "name", "ascending": False}}
+        ]
+        query_context = ChartDataQueryContextSchema().load(payload)
+        with mock.patch.object(
+            query_context.datasource, "query", side_effect=Exception
+        ) as query:
+            response = query_context.get_df_payload(query_context.queries[0])
+
+        query.assert_not_called()
+        assert not response["is_cached"]
+        names = response["df"]["name"].tolist()
+        assert names == sorted(names, reverse=True)
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @mock.patch.dict(app.config, {"QUERY_CONTEXT_MAX_WORKERS": 2})
+    def test_get_payload_concurrent_queries(self):
+        """
+        Ensure that the queries missing from the cache run concurrently, and that a
+        failing query doesn't prevent the other ones from running.
+        """
+        payload = get_query_context("birth_names")
+        payload["queries"].append(copy.deepcopy(payload["queries"][0]))
+        payload["queries"][0]["row_limit"] = 5
+        payload["force"] = True
+        get_query_result = QueryContextProcessor.get_query_result
+
+        def get_failing_query_result(
+            processor: QueryContextProcessor, query_object: QueryObject
+        ) -> QueryResult:
+            if query_object.row_limit == 5:
+                raise Exception("Error")
+            return get_query_result(processor, query_object)
+
+        with mock.patch(
+            "superset.common.query_context_processor.map_in_app_context",
+            wraps=map_in_app_context,
+        ) as map_in_app_context_:
+            query_context = ChartDataQueryContextSchema().load(payload)
+            responses = query_context.get_payload()
+            assert len(map_in_app_context_.call_args.args[1]) == 2
+            assert [response["rowcount"] for response in responses["queries"]] == [
+                5,
+                payload["queries"][1]["row_limit"],
+            ]
+
+            query_context = ChartDataQueryContextSchema().load(payload)
+            with mock.patch.object(
+                QueryContextProcessor, "get_query_result", get_failing_query_result
+            ):
+                with pytest.raises(Exception, match="Error"):
+                    query_context.get_payload()
+
+        payload["force"] = False
+        query_context = ChartDataQueryContextSchema().load(payload)
+        assert query_context.get_df_payload(query_context.queries[1])["is_cached"]
+
     def test_query_cache_key_changes_when_datasource_is_updated(self):
         self.login(username="admin")
         payload = get_query_context("birth_names")
@@ -595,6 +761,86 @@ class TestQueryContext(SupersetTestCase):
         self.assertEqual(rv["queries"], [])
         self.assertEqual(rv["cache_keys"], [])
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_processing_time_offsets_splice(self):
+        """
+        Ensure that cached time offset results are reused when the time range moves
+        """
+        payload = get_query_context("birth_names")
+        payload["queries"][0]["metrics"] = ["sum__num"]
+        payload["queries"][0]["groupby"] = ["state"]
+        payload["queries"][0]["is_timeseries"] = True
+        payload["queries"][0]["row_limit"] = 10000
+        payload["queries"][0]["granularity"] = "ds"
+        payload["queries"][0]["extras"]["time_grain_sqla"] = "P1D"
+
+        def processing_time_offsets(time_range: str, force: bool) -> CachedTimeOffset:
+            payload["queries"][0]["time_range"] = time_range
+            payload["queries"][0]["time_offsets"] = []
+            payload["force"] = force
+            query_context = ChartDataQueryContextSchema().load(payload)
+            df = query_context.get_query_result(query_context.queries[0]).df
+            payload["queries"][0]["time_offsets"] = ["1 year ago", "2 years ago"]
+            query_context = ChartDataQueryContextSchema().load(payload)
+            return query_context.processing_time_offsets(df, query_context.queries[0])
+
+        processing_time_offsets("1990-01-01 : 2000-01-01", force=False)
+        with mock.patch(
+            "superset.common.utils.time_windows.stats_logger"
+        ) as stats_logger:
+            rv = processing_time_offsets("1990-06-01 : 2000-06-01", force=False)
+
+        stats_logger.incr.assert_any_call("time_offset_cache_spliced")
+        assert rv["cache_keys"] == [None, None]
+        # only the uncovered part of the time window is queried
+        assert re.search(r"1999-01-01.+1999-06-01", rv["queries"][0], re.S)
+        assert "1989-06-01" not in rv["queries"][0]
+
+        expected = processing_time_offsets("1990-06-01 : 2000-06-01", force=True)
+        columns = ["__timestamp", "state"]
+        pd.testing.assert_frame_equal(
+            rv["df"].sort_values(columns).reset_index(drop=True),
+            expected["df"].sort_values(columns).reset_index(drop=True),
+        )
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @mock.patch.dict(app.config, {"DATA_CACHE_INCREMENTAL_SETTLED_AFTER": 3600})
+    def test_incremental_query_result(self):
+        """
+        Ensure that only the time buckets not covered by the previous result run
+        """
+        payload = get_query_context("birth_names")
+        payload["queries"][0]["metrics"] = ["sum__num"]
+        payload["queries"][0]["groupby"] = ["state"]
+        payload["queries"][0]["is_timeseries"] = True
+        payload["queries"][0]["row_limit"] = 10000
+        payload["queries"][0]["granularity"] = "ds"
+        payload["queries"][0]["extras"]["time_grain_sqla"] = "P1D"
+
+        def get_query_result(time_range: str, force: bool) -> QueryResult:
+            payload["queries"][0]["time_range"] = time_range
+            payload["force"] = force
+            query_context = ChartDataQueryContextSchema().load(payload)
+            return query_context.get_query_result(query_context.queries[0])
+
+        get_query_result("1990-01-01 : 2000-01-01", force=False)
+        with mock.patch(
+            "superset.common.utils.time_windows.stats_logger"
+        ) as stats_logger:
+            result = get_query_result("1990-06-01 : 2000-06-01", force=False)
+
+        stats_logger.incr.assert_any_call("incremental_cache_spliced")
+        assert re.search(r"2000-01-01.+2000-06-01", result.query, re.S)
+        assert "1990-06-01" not in result.query
+
+        expected = get_query_result("1990-06-01 : 2000-06-01", force=True)
+        assert "1990-06-01" in expected.query
+        columns = ["__timestamp", "state"]
+        pd.testing.assert_frame_equal(
+            result.df.sort_values(columns).reset_index(drop=True),
+            expected.df.sort_values(columns).reset_index(drop=True),
+        )
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_time_offsets_sql(self):
         payload = get_query_context("birth_names")
@@ -21,6 +21,8 @@ import json
 import random
 import csv
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import io
 
 import pytest
@@ -33,6 +35,7 @@ from tests.integration_tests.test_app import app
 from superset import db, sql_lab
 from superset.common.db_query_status import QueryStatus
 from superset.models.core import Database
+from superset.result_set import SupersetResultSet
 from superset.utils.database import get_example_database, get_main_database
 from superset.utils import core as utils
 from superset.models.sql_lab import Query
@@ -295,6 +298,30 @@ class TestSqlLabApi(SupersetTestCase):
         self.assertEqual(resp_data.get("status"), "success")
         self.assertEqual(rv.status_code, 200)
 
+    @mock.patch("superset.commands.sql_lab.results.results_backend_use_msgpack", False)
+    def test_execute_columnar_request(self) -> None:
+        from superset import sql_lab as core
+
+        core.results_backend = mock.Mock()
+        core.results_backend.get.return_value = {}
+
+        self.login()
+        client_id = f"{random.getrandbits(64)}"[:10]
+
+        data = {
+            "sql": "SELECT 1 AS a, 'b' AS b",
+            "database_id": 1,
+            "client_id": client_id,
+            "columnar": True,
+        }
+        rv = self.client.post(
+            "/api/v1/sqllab/execute/",
+            json=data,
+        )
+        resp_data = json.loads(rv.data.decode("utf-8"))
+        self.assertEqual(resp_data.get("status"), "success")
+        self.assertEqual(resp_data["data"], {"a": [1], "b": ["b"]})
+
     @mock.patch(
         "tests.integration_tests.superset_test_custom_template_processors.datetime"
     )
@@ -374,6 +401,53 @@ class TestSqlLabApi(SupersetTestCase):
 
         app.config["RESULTS_BACKEND_USE_MSGPACK"] = use_msgpack
 
+    @mock.patch("superset.commands.sql_lab.results.results_backend_use_msgpack", False)
+    def test_get_results_with_offset_and_limit(self):
+        from superset.commands.sql_lab import results as command
+
+        command.results_backend = mock.Mock()
+        self.login()
+
+        data = [{"col_0": i} for i in range(100)]
+        payload = {
+            "status": QueryStatus.SUCCESS,
+            "query": {"rows": 100},
+            "data": data,
+        }
+
+        query_mock = mock.Mock()
+        query_mock.sql = "SELECT *"
+        query_mock.database = 1
+        query_mock.schema = "superset"
+
+        # do not apply msgpack serialization
+        use_msgpack = app.config["RESULTS_BACKEND_USE_MSGPACK"]
+        app.config["RESULTS_BACKEND_USE_MSGPACK"] = False
+        serialized_payload = sql_lab._serialize_payload(payload, False)
+        compressed = utils.zlib_compress(serialized_payload)
+        command.results_backend.get.return_value = compressed
+
+        with mock.patch("superset.commands.sql_lab.results.db") as mock_superset_db:
+            mock_superset_db.session.query().filter_by().one_or_none.return_value = (
+                query_mock
+            )
+            arguments = {"key": "key", "offset": 10, "limit": 5}
+            result_page = json.loads(
+                self.get_resp(f"/api/v1/sqllab/results/?q={prison.dumps(arguments)}")
+            )
+            # pages are read within the displayed rows
+            arguments = {"key": "key", "offset": 45, "limit": 10, "rows": 50}
+            result_last_page = json.loads(
+                self.get_resp(f"/api/v1/sqllab/results/?q={prison.dumps(arguments)}")
+            )
+
+        self.assertEqual(result_page["data"], data[10:15])
+        self.assertEqual(result_page["offset"], 10)
+        self.assertEqual(result_last_page["data"], data[45:50])
+        self.assertTrue(result_last_page["displayLimitReached"])
+
+        app.config["RESULTS_BACKEND_USE_MSGPACK"] = use_msgpack
+
     @mock.patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
     @mock.patch("superset.models.core.Database.get_df")
     def test_export_results(self, get_df_mock: mock.Mock) -> None:
@@ -407,3 +481,44 @@ class TestSqlLabApi(SupersetTestCase):
         self.assertEqual(list(expected_data), list(data))
         db.session.delete(query_obj)
         db.session.commit()
+
+    @mock.patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
+    @mock.patch("superset.commands.sql_lab.export.results_backend", None)
+    @mock.patch("superset.models.core.Database.get_result_set")
+    def test_export_results_parquet(self, get_result_set_mock: mock.Mock) -> None:
+        self.login()
+
+        database = get_example_database()
+        query_obj = Query(
+            client_id="test",
+            database=database,
+            tab_name="test_tab",
+            sql_editor_id="test_editor_id",
+            sql="select * from bar",
+            select_sql=None,
+            executed_sql="select * from bar limit 2",
+            limit=100,
+            select_as_cta=False,
+            rows=104,
+            error_message="none",
+            results_key="test_abc",
+        )
+
+        db.session.add(query_obj)
+        db.session.commit()
+
+        get_result_set_mock.return_value = SupersetResultSet(
+            [(1,), (2,), (3,)], [("foo",)], database.db_engine_spec
+        )
+
+        rv = self.client.get("/api/v1/sqllab/export/test/?format=parquet")
+        self.assertEqual(rv.status_code, 200)
+        self.assertEqual(rv.mimetype, "application/vnd.apache.parquet")
+        table = pq.read_table(pa.BufferReader(rv.data))
+        self.assertEqual(table.to_pydict(), {"foo": [1, 2]})
+
+        rv = self.client.get("/api/v1/sqllab/export/test/?format=xml")
+        self.assertEqual(rv.status_code, 400)
+
+        db.session.delete(query_obj)
+        db.session.commit()
@@ -18,6 +18,8 @@ from unittest import mock
 from unittest.mock import Mock, patch
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from flask_babel import gettext as __
 
@@ -33,6 +35,7 @@ from superset.exceptions import (
 )
 from superset.models.core import Database
 from superset.models.sql_lab import Query
+from superset.result_set import SupersetResultSet
 from superset.sqllab.limiting_factor import LimitingFactor
 from superset.sqllab.schemas import EstimateQueryCostSchema
 from superset.utils import core as utils
@@ -244,6 +247,55 @@ class TestSqlResultExportCommand(SupersetTestCase):
         assert result["count"] == 5
         assert result["query"].client_id == "test"
 
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
+    @patch("superset.commands.sql_lab.export.results_backend", None)
+    @patch("superset.models.core.Database.get_result_set")
+    def test_run_parquet_no_results_backend(self, get_result_set_mock: Mock) -> None:
+        query_obj = db.session.query(Query).filter_by(client_id="test").one()
+        query_obj.executed_sql = "select * from bar limit 2"
+        query_obj.select_sql = None
+        db.session.commit()
+
+        command = export.SqlResultExportCommand(
+            "test", export_format=export.SqlExportFormat.PARQUET
+        )
+
+        get_result_set_mock.return_value = SupersetResultSet(
+            [(1,), (2,), (3,)], [("foo",)], get_example_database().db_engine_spec
+        )
+        result = command.run()
+
+        table = pq.read_table(pa.BufferReader(b"".join(result["data"])))
+        assert table.to_pydict() == {"foo": [1, 2]}
+        assert result["count"] == 2
+        assert result["query"].client_id == "test"
+
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
+    @patch("superset.commands.sql_lab.export.results_backend_use_msgpack", False)
+    def test_run_parquet_with_results_backend(self) -> None:
+        command = export.SqlResultExportCommand(
+            "test", export_format=export.SqlExportFormat.PARQUET
+        )
+
+        payload = {
+            "columns": [{"name": "foo"}],
+            "data": [{"foo": i} for i in range(5)],
+        }
+        serialized_payload = sql_lab._serialize_payload(payload, False)
+        compressed = utils.zlib_compress(serialized_payload)
+
+        export.results_backend = mock.Mock()
+        export.results_backend.get.return_value = compressed
+
+        result = command.run()
+
+        table = pq.read_table(pa.BufferReader(b"".join(result["data"])))
+        assert table.to_pydict() == {"foo": [0, 1, 2, 3, 4]}
+        assert result["count"] == 5
+        assert result["query"].client_id == "test"
+
 
 class TestSqlExecutionResultsCommand(SupersetTestCase):
     @pytest.fixture()
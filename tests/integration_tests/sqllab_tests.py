@@ -617,6 +617,7 @@ class TestSqlLab(SupersetTestCase):
                     mock_cursor,
                     None,
                     False,
+                    None,
                 ),
                 mock.call(
                     "SELECT @value AS foo",
@@ -624,6 +625,7 @@ class TestSqlLab(SupersetTestCase):
                     mock_cursor,
                     None,
                     False,
+                    None,
                 ),
             ]
         )
@@ -723,6 +725,7 @@ class TestSqlLab(SupersetTestCase):
                     mock_cursor,
                     None,
                     False,
+                    None,
                 ),
                 mock.call(
                     "SELECT @value AS foo",
@@ -730,6 +733,7 @@ class TestSqlLab(SupersetTestCase):
                     mock_cursor,
                     None,
                     True,  # apply_ctas
+                    None,
                 ),
             ]
         )
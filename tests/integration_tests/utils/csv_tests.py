@@ -81,3 +81,26 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_df_to_escaped_csv_mixed_types():
+    df = pd.DataFrame(
+        {"a": ["=a", 1, None, "-10", "|b"], "b": [1, 2, 3, 4, 5]},
+        index=[5, 5, 3, 2, 1],
+    )
+
+    escaped_csv_str = csv.df_to_escaped_csv(df, index=False)
+
+    assert escaped_csv_str == "a,b\n'=a,1\n1,2\n,3\n-10,4\n'\\|b,5\n"
+    # the DataFrame is not modified
+    assert df["a"].tolist() == ["=a", 1, None, "-10", "|b"]
+
+
+def test_df_to_escaped_csv_chunks():
+    df = pd.DataFrame({"=a": [f"={i}" for i in range(5)], "b": range(5)})
+
+    chunks = list(csv.df_to_escaped_csv_chunks(df, chunk_size=2, index=False))
+
+    assert len(chunks) == 3
+    assert "".join(chunks) == csv.df_to_escaped_csv(df, index=False)
+    assert list(csv.df_to_escaped_csv_chunks(df.iloc[:0], index=False)) == ["'=a,b\n"]
@@ -0,0 +1,204 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+import pandas as pd
+import pytest
+from flask import Flask
+from flask_caching import Cache
+from pytest_mock import MockFixture
+
+from superset.common.db_query_status import QueryStatus
+from superset.common.utils import query_cache_manager
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+from superset.exceptions import CacheLoadError
+from superset.models.helpers import QueryResult
+
+
+@pytest.fixture
+def cache(mocker: MockFixture, app: Flask) -> Cache:
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(query_cache_manager._cache, {CacheRegion.DATA: cache})
+    return cache
+
+
+def test_lock_acquired(mocker: MockFixture, cache: Cache) -> None:
+    """
+    Test that the first caller holds the lock while loading the value.
+    """
+    stats_logger = mocker.patch.object(query_cache_manager, "stats_logger")
+
+    with QueryCacheManager.lock("key", CacheRegion.DATA) as cached:
+        assert cached is None
+        assert cache.has("key__lock")
+
+    assert not cache.has("key__lock")
+    stats_logger.incr.assert_called_once_with("query_cache_lock_acquired")
+
+
+def test_lock_ttl(mocker: MockFixture, cache: Cache) -> None:
+    """
+    Test that the lock expires after the query timeout, not the wait timeout.
+    """
+    add = mocker.spy(cache, "add")
+    mocker.patch.dict(
+        query_cache_manager.config,
+        {
+            "CACHE_LOCK_TIMEOUT": 30,
+            "CACHE_LOCK_TTL": None,
+            "SUPERSET_WEBSERVER_TIMEOUT": 60,
+        },
+    )
+    with QueryCacheManager.lock("key", CacheRegion.DATA):
+        pass
+    add.assert_called_once_with("key__lock", True, timeout=60)
+
+    add.reset_mock()
+    mocker.patch.dict(query_cache_manager.config, {"CACHE_LOCK_TTL": 120})
+    with QueryCacheManager.lock("key", CacheRegion.DATA):
+        pass
+    add.assert_called_once_with("key__lock", True, timeout=120)
+
+
+def test_lock_force_query(cache: Cache) -> None:
+    """
+    Test that refreshing a value bypasses the lock.
+    """
+    cache.add("key__lock", True)
+
+    with QueryCacheManager.lock("key", CacheRegion.DATA, force_query=True) as cached:
+        assert cached is None
+
+
+def test_lock_coalesced(mocker: MockFixture, cache: Cache) -> None:
+    """
+    Test that other callers get the value cached by the first one.
+    """
+    stats_logger = mocker.patch.object(query_cache_manager, "stats_logger")
+    cache.add("key__lock", True)
+
+    def load(_: Any) -> None:
+        cache.set("key", {"df": pd.DataFrame({"a": [1]}), "query": "", "dttm": None})
+
+    mocker.patch.object(query_cache_manager.time, "sleep", side_effect=load)
+
+    with QueryCacheManager.lock("key", CacheRegion.DATA) as cached:
+        assert cached is not None
+        assert cached.is_loaded
+        assert cached.df.to_dict() == {"a": {0: 1}}
+
+    assert cache.has("key__lock")
+    stats_logger.incr.assert_any_call("query_cache_lock_wait")
+    stats_logger.incr.assert_any_call("query_cache_lock_coalesced")
+
+
+def test_lock_released_without_value(mocker: MockFixture, cache: Cache) -> None:
+    """
+    Test that other callers stop waiting when the lock is released without a value.
+    """
+    stats_logger = mocker.patch.object(query_cache_manager, "stats_logger")
+    cache.add("key__lock", True)
+    sleep = mocker.patch.object(
+        query_cache_manager.time,
+        "sleep",
+        side_effect=lambda _: cache.delete("key__lock"),
+    )
+
+    with QueryCacheManager.lock("key", CacheRegion.DATA) as cached:
+        assert cached is None
+
+    sleep.assert_called_once()
+    stats_logger.incr.assert_any_call("query_cache_lock_timeout")
+
+
+def test_set_query_result_arrow(mocker: MockFixture, cache: Cache) -> None:
+    """
+    Test that DataFrames are cached as Arrow buffers and deserialized lazily.
+    """
+    ipc_to_df = mocker.spy(query_cache_manager, "ipc_to_df")
+    df = pd.DataFrame({"a": [1, None], "b": ["x", "y"]})
+    query_result = QueryResult(df=df, query="SELECT 1", duration=None)
+
+    QueryCacheManager().set_query_result(
+        key="key", query_result=query_result, region=CacheRegion.DATA
+    )
+    assert "df" not in cache.get("key")
+    assert isinstance(cache.get("key")["df_arrow"], bytes)
+
+    query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+    assert query_cache.is_loaded
+    assert query_cache.query == "SELECT 1"
+    ipc_to_df.assert_not_called()
+    pd.testing.assert_frame_equal(query_cache.df, df)
+    pd.testing.assert_frame_equal(query_cache.df, df)
+    ipc_to_df.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"mixed": [1, "a"]}),
+        pd.DataFrame({"uint64": pd.Series([2**64 - 1, 1], dtype=object)}),
+    ],
+)
+def test_set_query_result_pickle(cache: Cache, df: pd.DataFrame) -> None:
+    """
+    Test that DataFrames that can't be converted to Arrow are cached as is.
+    """
+    query_result = QueryResult(df=df, query="SELECT 1", duration=None)
+
+    QueryCacheManager().set_query_result(
+        key="key", query_result=query_result, region=CacheRegion.DATA
+    )
+    assert "df_arrow" not in cache.get("key")
+
+    query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+    assert query_cache.status == QueryStatus.SUCCESS
+    pd.testing.assert_frame_equal(query_cache.df, df)
+
+
+def test_get_legacy_value(cache: Cache) -> None:
+    """
+    Test that values cached before DataFrames were serialized still load.
+    """
+    df = pd.DataFrame({"a": [1, 2]})
+    cache.set("key", {"df": df, "query": "SELECT 1", "dttm": None})
+
+    query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+    assert query_cache.is_loaded
+    pd.testing.assert_frame_equal(query_cache.df, df)
+
+
+def test_get_many(mocker: MockFixture, cache: Cache) -> None:
+    """
+    Test that several values are read with a single cache read.
+    """
+    get_many = mocker.spy(cache.cache, "get_many")
+    cache.set("a", {"df": pd.DataFrame({"a": [1]}), "query": "SELECT a", "dttm": None})
+
+    query_caches = QueryCacheManager.get_many(["a", None, "b"], CacheRegion.DATA)
+    get_many.assert_called_once_with("a", "b")
+    assert [query_cache.is_loaded for query_cache in query_caches] == [
+        True,
+        False,
+        False,
+    ]
+    assert query_caches[0].query == "SELECT a"
+
+    with pytest.raises(CacheLoadError):
+        QueryCacheManager.get_many(["a", "b"], CacheRegion.DATA, force_cached=True)
@@ -0,0 +1,65 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+from pytest_mock import MockFixture
+
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.query_context import QueryContext
+
+
+def make_query_context(
+    mocker: MockFixture, params: dict[str, Any], extra: dict[str, Any]
+) -> QueryContext:
+    return QueryContext(
+        datasource=mocker.MagicMock(extra_dict=extra),
+        queries=[],
+        result_type=ChartDataResultType.FULL,
+        form_data={},
+        slice_=mocker.MagicMock(params_dict=params),
+        result_format=ChartDataResultFormat.JSON,
+        cache_values={},
+    )
+
+
+def test_get_stale_while_revalidate(mocker: MockFixture) -> None:
+    """
+    Test that the chart setting takes precedence over the one of the dataset.
+    """
+    query_context = make_query_context(
+        mocker, {"stale_while_revalidate": "60"}, {"stale_while_revalidate": 120}
+    )
+    assert query_context.get_stale_while_revalidate() == 60
+
+    query_context = make_query_context(mocker, {}, {"stale_while_revalidate": 120})
+    assert query_context.get_stale_while_revalidate() == 120
+
+    query_context = make_query_context(mocker, {}, {})
+    assert query_context.get_stale_while_revalidate() is None
+
+
+def test_get_cache_setting_invalid(mocker: MockFixture) -> None:
+    """
+    Test that malformed cache settings are ignored.
+    """
+    query_context = make_query_context(
+        mocker,
+        {"stale_while_revalidate": "1 minute"},
+        {"incremental_settled_after": ["60"]},
+    )
+    assert query_context.get_stale_while_revalidate() is None
+    assert query_context.get_incremental_settled_after() is None
@@ -0,0 +1,178 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime, timedelta
+from unittest import mock
+
+import pandas as pd
+
+from superset.common.utils.time_windows import (
+    can_splice_time_windows,
+    get_incremental_query_object,
+    get_settled_coverage,
+    get_time_window_coverage,
+    is_time_grain_aligned,
+    splice_time_window_results,
+)
+from superset.constants import TimeGrain
+from superset.models.helpers import QueryResult
+from superset.utils.core import DTTM_ALIAS
+
+
+def _query_object(**kwargs):
+    return mock.Mock(
+        **{
+            "from_dttm": datetime(2020, 1, 3),
+            "to_dttm": datetime(2020, 1, 6),
+            "columns": [],
+            "row_limit": None,
+            "time_shift": None,
+            "series_limit": 0,
+            **kwargs,
+        }
+    )
+
+
+def _cache(from_dttm, to_dttm, days):
+    df = pd.DataFrame(
+        {
+            DTTM_ALIAS: pd.date_range("2020-01-01", periods=days, freq="D"),
+            "sum__num": range(days),
+        }
+    )
+    return mock.Mock(
+        is_loaded=True,
+        cache_value={"from_dttm": from_dttm, "to_dttm": to_dttm},
+        df=df,
+    )
+
+
+def test_is_time_grain_aligned():
+    assert is_time_grain_aligned(datetime(2020, 1, 1), TimeGrain.DAY)
+    assert not is_time_grain_aligned(datetime(2020, 1, 1, 12), TimeGrain.DAY)
+    assert is_time_grain_aligned(datetime(2020, 1, 1, 12), TimeGrain.HOUR)
+
+
+def test_can_splice_time_windows():
+    datasource = mock.Mock(offset=0)
+    assert can_splice_time_windows(datasource, _query_object(), TimeGrain.DAY)
+    assert not can_splice_time_windows(datasource, _query_object(), TimeGrain.MONTH)
+    assert not can_splice_time_windows(datasource, _query_object(), None)
+    assert not can_splice_time_windows(
+        datasource, _query_object(series_limit=10), TimeGrain.DAY
+    )
+    assert not can_splice_time_windows(
+        datasource, _query_object(time_shift="1 day ago"), TimeGrain.DAY
+    )
+
+
+def test_get_time_window_coverage():
+    datasource = mock.Mock(offset=0)
+    query_object = _query_object()
+    cache = _cache(datetime(2020, 1, 1), datetime(2020, 1, 5), 4)
+
+    coverage = get_time_window_coverage(datasource, query_object, cache, TimeGrain.DAY)
+    assert coverage["covered_df"]["sum__num"].tolist() == [2, 3]
+    assert coverage["windows"] == [(datetime(2020, 1, 5), datetime(2020, 1, 6))]
+
+    # the rows are not spliced without a time grain
+    coverage = get_time_window_coverage(datasource, query_object, cache)
+    assert coverage["covered_df"] is None
+    assert coverage["windows"] == [(datetime(2020, 1, 3), datetime(2020, 1, 6))]
+
+    # nor when the cached rows may be truncated
+    coverage = get_time_window_coverage(
+        datasource, _query_object(row_limit=4), cache, TimeGrain.DAY
+    )
+    assert coverage["covered_df"] is None
+
+    # nor when the windows don't overlap
+    cache = _cache(datetime(2020, 1, 1), datetime(2020, 1, 3), 2)
+    coverage = get_time_window_coverage(datasource, query_object, cache, TimeGrain.DAY)
+    assert coverage["covered_df"] is None
+
+    # the cached result is used as is over the same window
+    cache = _cache(datetime(2020, 1, 3), datetime(2020, 1, 6), 3)
+    coverage = get_time_window_coverage(datasource, query_object, cache)
+    assert coverage["covered_df"] is cache.df
+    assert coverage["windows"] == []
+
+
+def test_splice_time_window_results():
+    query_object = _query_object(row_limit=3)
+    covered_df = pd.DataFrame({"sum__num": [1]})
+    results = [QueryResult(pd.DataFrame({"sum__num": [2]}), "SELECT 1", timedelta(0))]
+
+    df = splice_time_window_results(query_object, covered_df, results, lambda df, _: df)
+    assert df["sum__num"].tolist() == [1, 2]
+
+    # the result may be truncated by the row limit
+    results.append(
+        QueryResult(pd.DataFrame({"sum__num": [3]}), "SELECT 1", timedelta(0))
+    )
+    assert (
+        splice_time_window_results(query_object, covered_df, results, lambda df, _: df)
+        is None
+    )
+
+
+def test_get_settled_coverage():
+    datasource = mock.Mock(offset=0)
+    query_object = _query_object()
+    cache = _cache(datetime(2020, 1, 1), datetime(2020, 1, 5), 4)
+    cache.cache_value["settled_dttm"] = datetime(2020, 1, 4)
+
+    coverage = get_settled_coverage(datasource, query_object, cache, TimeGrain.DAY)
+    assert coverage["covered_df"]["sum__num"].tolist() == [2]
+    assert coverage["windows"] == [(datetime(2020, 1, 4), datetime(2020, 1, 6))]
+
+    # the buckets of the previous result are queried again until settled
+    cache.cache_value["settled_dttm"] = datetime(2020, 1, 3)
+    coverage = get_settled_coverage(datasource, query_object, cache, TimeGrain.DAY)
+    assert coverage["covered_df"] is None
+    assert coverage["windows"] == [(datetime(2020, 1, 3), datetime(2020, 1, 6))]
+
+
+def test_get_incremental_query_object():
+    datasource = mock.Mock(offset=0)
+    query_object = _query_object(
+        from_dttm=None,
+        to_dttm=None,
+        time_range="2020-01-03 : 2020-01-06",
+        granularity="ds",
+        is_timeseries=True,
+        filter=[],
+        time_offsets=["1 year ago"],
+        post_processing=[{"operation": "pivot"}],
+    )
+    with mock.patch(
+        "superset.common.utils.time_windows.get_since_until_from_query_object",
+        return_value=(datetime(2020, 1, 3), datetime(2020, 1, 6)),
+    ):
+        incremental_query_object = get_incremental_query_object(
+            datasource, query_object, TimeGrain.DAY
+        )
+        assert incremental_query_object.from_dttm == datetime(2020, 1, 3)
+        assert incremental_query_object.to_dttm == datetime(2020, 1, 6)
+        assert incremental_query_object.time_offsets == []
+        assert incremental_query_object.post_processing == []
+
+        # the rows of the result must be partitioned by time buckets
+        query_object.is_timeseries = False
+        assert (
+            get_incremental_query_object(datasource, query_object, TimeGrain.DAY)
+            is None
+        )
@@ -203,3 +203,42 @@ def test_max_pandas_timestamp(input_, expected) -> None:
     df = results.to_pandas_df()
 
     assert df_to_records(df) == expected
+
+
+def test_js_max_int_nullable_column() -> None:
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {
+            "a": pd.array([1, None, 1239162456494753670], dtype="Int64"),
+            "b": pd.Series([1, None, -1239162456494753670], dtype=object),
+            "c": ["foo", None, "bar"],
+        }
+    )
+
+    assert df_to_records(df) == [
+        {"a": 1, "b": 1, "c": "foo"},
+        {"a": pd.NA, "b": None, "c": None},
+        {"a": "1239162456494753670", "b": "-1239162456494753670", "c": "bar"},
+    ]
+
+
+def test_df_to_columns() -> None:
+    from superset.dataframe import df_to_columns
+    from superset.db_engine_specs import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    data = [(1, 1239162456494753670, "c1"), (2, 100, "c2")]
+    cursor_descr: DbapiDescription = [
+        ("a", "int", None, None, None, None, False),
+        ("b", "int", None, None, None, None, False),
+        ("c", "string", None, None, None, None, False),
+    ]
+    results = SupersetResultSet(data, cursor_descr, BaseEngineSpec)
+    df = results.to_pandas_df()
+
+    assert df_to_columns(df) == {
+        "a": [1, 2],
+        "b": ["1239162456494753670", 100],
+        "c": ["c1", "c2"],
+    }
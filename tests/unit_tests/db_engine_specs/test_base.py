@@ -20,6 +20,7 @@ from textwrap import dedent
 from typing import Any, Optional
 
 import pytest
+from pytest_mock import MockerFixture
 from sqlalchemy import types
 
 from superset.superset_typing import ResultSetColumnType, SQLAColumnType
@@ -168,3 +169,80 @@ def test_convert_inspector_columns(
     from superset.db_engine_specs.base import convert_inspector_columns
 
     assert convert_inspector_columns(cols) == expected_result
+
+
+def test_fetch_data_batches(mocker: MockerFixture) -> None:
+    """
+    Test that `fetch_data_batches` yields batches up to the limit.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    rows = [(i,) for i in range(10)]
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "int")]
+    cursor.fetchmany.side_effect = lambda size: [rows.pop(0) for _ in range(size)]
+
+    batches = list(BaseEngineSpec.fetch_data_batches(cursor, 3, limit=7))
+    assert batches == [[(0,), (1,), (2,)], [(3,), (4,), (5,)], [(6,)]]
+
+    cursor.fetchmany.side_effect = [[(1,), (2,)], []]
+    batches = list(BaseEngineSpec.fetch_data_batches(cursor, 2))
+    assert batches == [[(1,), (2,)]]
+
+    cursor.description = None
+    assert list(BaseEngineSpec.fetch_data_batches(cursor, 2)) == []
+
+
+def test_fetch_data_batches_max_bytes(mocker: MockerFixture) -> None:
+    """
+    Test that `fetch_data_batches` aborts once the rows exceed the maximum size.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.exceptions import SupersetResultTooLargeException
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "varchar")]
+    cursor.fetchmany.return_value = [("x" * 1000,)] * 10
+
+    batches = BaseEngineSpec.fetch_data_batches(cursor, 10, max_bytes=15000)
+    assert len(next(batches)) == 10
+    with pytest.raises(SupersetResultTooLargeException):
+        next(batches)
+
+
+def test_mutate_column_types(mocker: MockerFixture) -> None:
+    """
+    Test that the column type mutators are applied to their columns only.
+    """
+    from sqlalchemy import types
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class UpperEngineSpec(BaseEngineSpec):
+        column_type_mutators = {types.String: lambda value: value.upper()}
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "varchar"), ("b", "int"), ("a", "varchar")]
+    cursor.fetchmany.side_effect = [[("x", 1, "y"), ("z", 2, "w")], []]
+
+    assert list(UpperEngineSpec.fetch_data_batches(cursor, 2)) == [
+        [("X", 1, "Y"), ("Z", 2, "W")]
+    ]
+
+
+def test_query_poller(mocker: MockerFixture) -> None:
+    """
+    Test that the poll interval backs off up to its maximum, unless progress is made.
+    """
+    from superset.db_engine_specs import base
+    from superset.db_engine_specs.base import QueryPoller
+
+    sleep = mocker.patch.object(base.time, "sleep")
+    mocker.patch.object(base.random, "uniform", return_value=1)
+
+    poller = QueryPoller("db", min_interval=0.1, max_interval=0.5)
+    intervals = [
+        poller.sleep(progress) for progress in [None, None, 10, 20, 20, 20, 20]
+    ]
+    assert intervals == pytest.approx([0.1, 0.2, 0.4, 0.4, 0.4, 0.5, 0.5])
+    assert sleep.call_count == 7
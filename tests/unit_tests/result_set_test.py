@@ -164,3 +164,72 @@ def test_timezone_series(mocker: MockerFixture) -> None:
         [pd.Timestamp("2023-01-01 00:00:00+0000", tz="UTC")]
     ]
     logger.exception.assert_not_called()
+
+
+def test_mixed_row_types_and_column_fallback() -> None:
+    """
+    Test that rows are transposed per column, and that only the columns Arrow
+    cannot convert are stringified.
+    """
+    data = [
+        [1, "a", {"foo": 1}, [1, 2]],
+        (2, 3, None, [3]),
+    ]
+    description = [
+        ("id", "int", None, None, None, None, False),
+        ("mixed", "string", None, None, None, None, False),
+        ("obj", "json", None, None, None, None, False),
+        ("arr", "array", None, None, None, None, False),
+    ]
+    result_set = SupersetResultSet(
+        data,  # type: ignore
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+    assert result_set.size == 2
+    assert result_set.to_pandas_df().values.tolist() == [
+        [1, "a", "{'foo': 1}", "[1, 2]"],
+        [2, "3", None, "[3]"],
+    ]
+
+
+def test_from_batches() -> None:
+    """
+    Test that batches are converted one at a time, promoting the types of the null
+    columns of some batches and stringifying the columns of different types.
+    """
+    description = [
+        ("id", "int", None, None, None, None, False),
+        ("value", "int", None, None, None, None, False),
+        ("mixed", "string", None, None, None, None, False),
+    ]
+    batches = iter(
+        [
+            [(1, None, 1), (2, None, 2)],
+            [(3, 3, "c")],
+        ]
+    )
+    result_set = SupersetResultSet.from_batches(
+        batches,  # type: ignore
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+    assert result_set.size == 3
+    assert result_set.to_pandas_df().values.tolist() == [
+        [1, None, "1"],
+        [2, None, "2"],
+        [3, 3, "c"],
+    ]
+    assert [column["column_name"] for column in result_set.columns] == [
+        "id",
+        "value",
+        "mixed",
+    ]
+
+    result_set = SupersetResultSet.from_batches(
+        iter([]),
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+    assert result_set.size == 0
+    assert result_set.columns == []
@@ -16,11 +16,16 @@
 # under the License.
 
 import pytest
+from flask import Flask, g
+from flask_caching import Cache
 from pytest_mock import MockFixture
 
 from superset.exceptions import SupersetSecurityException
-from superset.extensions import appbuilder
-from superset.security.manager import SupersetSecurityManager
+from superset.extensions import appbuilder, cache_manager
+from superset.security.manager import (
+    RowLevelSecurityFilterClause,
+    SupersetSecurityManager,
+)
 
 
 def test_security_manager(app_context: None) -> None:
@@ -88,3 +93,38 @@ def test_raise_for_access_query_default_schema(
         == """You need access to the following tables: `public.ab_user`,
             `all_database_access` or `all_datasource_access` permission"""
     )
+
+
+def test_get_rls_filters_cached(
+    mocker: MockFixture,
+    app: Flask,
+    app_context: None,
+) -> None:
+    """
+    Test that RLS filters are memoized per request and cached until they change.
+    """
+    mocker.patch.object(
+        cache_manager, "_cache", Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    )
+    sm = SupersetSecurityManager(appbuilder)
+    rls_filter = RowLevelSecurityFilterClause(1, None, "a = 1")
+    query_rls_filters = mocker.patch.object(
+        sm, "_query_rls_filters", return_value=[rls_filter]
+    )
+    mocker.patch.object(sm, "get_user_roles", return_value=[mocker.MagicMock(id=2)])
+    table = mocker.MagicMock(id=3)
+    g.user = mocker.MagicMock()
+
+    assert sm.get_rls_filters(table) == [rls_filter]
+    assert sm.get_rls_filters(table) == [rls_filter]
+    query_rls_filters.assert_called_once_with([2], table)
+
+    # another request reads them from the shared cache
+    g.pop("rls_filters")
+    assert sm.get_rls_filters(table) == [rls_filter]
+    query_rls_filters.assert_called_once()
+
+    sm.rls_filters_after_change(None, None, None)  # type: ignore
+    assert "rls_filters" not in g
+    assert sm.get_rls_filters(table) == [rls_filter]
+    assert query_rls_filters.call_count == 2
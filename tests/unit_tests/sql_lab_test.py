@@ -16,6 +16,7 @@
 # under the License.
 # pylint: disable=import-outside-toplevel, invalid-name, unused-argument, too-many-locals
 
+import pytest
 import sqlparse
 from pytest_mock import MockerFixture
 from sqlalchemy.orm.session import Session
@@ -212,3 +213,220 @@ def test_sql_lab_insert_rls_as_subquery(
         query.executed_sql
         == "SELECT c FROM (SELECT * FROM t WHERE (t.c > 5)) AS t\nLIMIT 6"
     )
+
+
+def test_execute_sql_statement_in_chunks(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that `execute_sql_statement` writes batches to the results writer.
+    """
+    from superset.sql_lab import execute_sql_statement
+    from superset.sqllab.limiting_factor import LimitingFactor
+
+    query = mocker.MagicMock()
+    query.limit = 3
+    query.select_as_cta_used = False
+    database = query.database
+    database.allow_dml = False
+    database.apply_limit_to_sql.return_value = "SELECT a FROM t LIMIT 4"
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_data_batches.return_value = iter([[(1,), (2,)], [(3,), (4,)]])
+
+    cursor = mocker.MagicMock()
+    SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")
+    results_writer = mocker.MagicMock()
+
+    execute_sql_statement(
+        "SELECT a FROM t",
+        query,
+        cursor=cursor,
+        log_params={},
+        apply_ctas=False,
+        results_writer=results_writer,
+    )
+
+    db_engine_spec.fetch_data.assert_not_called()
+    assert SupersetResultSet.call_args_list == [
+        mocker.call([(1,), (2,)], cursor.description, db_engine_spec),
+        mocker.call([(3,)], cursor.description, db_engine_spec),
+        mocker.call([], cursor.description, db_engine_spec),
+    ]
+    assert results_writer.write.call_count == 2
+    assert query.limiting_factor != LimitingFactor.NOT_LIMITED
+
+
+def test_chunked_results(mocker: MockerFixture, app: None) -> None:
+    """
+    Test writing and reading results stored in chunks.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.sqllab.chunked_results import (
+        ChunkedResultsWriter,
+        read_chunked_results,
+    )
+
+    store: dict[str, bytes] = {}
+    results_backend = mocker.patch(
+        "superset.sqllab.chunked_results.results_backend", new=mocker.MagicMock()
+    )
+    results_backend.set.side_effect = lambda key, value, timeout: bool(
+        store.__setitem__(key, value) or True
+    )
+    results_backend.get.side_effect = store.get
+
+    description = [("a", "int", None, None, None, None, False)]
+    writer = ChunkedResultsWriter("key", 60)
+    writer.write(SupersetResultSet([], description, BaseEngineSpec))
+    writer.write(SupersetResultSet([(1,), (2,)], description, BaseEngineSpec))
+    writer.write(SupersetResultSet([("a",)], description, BaseEngineSpec))
+
+    assert writer.rows == 3
+    assert writer.columns[0]["column_name"] == "a"
+    assert writer.manifest == {"keys": ["key-chunk-0", "key-chunk-1"], "rows": [2, 1]}
+
+    table = read_chunked_results(writer.manifest, limit=2)
+    assert table.to_pydict() == {"a": [1, 2]}
+    assert results_backend.get.call_count == 1
+
+    table = read_chunked_results(writer.manifest)
+    assert table.to_pydict() == {"a": ["1", "2", "a"]}
+
+
+def test_read_chunked_results_page(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that reading a page of chunked results only reads the chunks it needs.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.sqllab.chunked_results import (
+        ChunkedResultsWriter,
+        read_chunked_results,
+    )
+
+    store: dict[str, bytes] = {}
+    results_backend = mocker.patch(
+        "superset.sqllab.chunked_results.results_backend", new=mocker.MagicMock()
+    )
+    results_backend.set.side_effect = lambda key, value, timeout: bool(
+        store.__setitem__(key, value) or True
+    )
+    results_backend.get.side_effect = store.get
+
+    description = [("a", "int", None, None, None, None, False)]
+    writer = ChunkedResultsWriter("key", 60)
+    for start in range(0, 10, 3):
+        rows = [(i,) for i in range(start, min(start + 3, 10))]
+        writer.write(SupersetResultSet(rows, description, BaseEngineSpec))
+
+    table = read_chunked_results(writer.manifest, offset=4, limit=4)
+    assert table.to_pydict() == {"a": [4, 5, 6, 7]}
+    assert [call.args[0] for call in results_backend.get.call_args_list] == [
+        "key-chunk-1",
+        "key-chunk-2",
+    ]
+
+    table = read_chunked_results(writer.manifest, offset=8)
+    assert table.to_pydict() == {"a": [8, 9]}
+
+    table = read_chunked_results(writer.manifest, offset=20, limit=5)
+    assert table.num_rows == 0
+
+
+@pytest.mark.parametrize("use_msgpack", [True, False])
+@pytest.mark.parametrize("stored_columnar", [True, False])
+@pytest.mark.parametrize("columnar", [True, False])
+def test_deserialize_results_payload_shape(
+    mocker: MockerFixture,
+    app: None,
+    use_msgpack: bool,
+    stored_columnar: bool,
+    columnar: bool,
+) -> None:
+    """
+    Test that results are returned in the shape requested when fetching them,
+    whatever the shape they were stored in.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.sql_lab import _serialize_and_expand_data, _serialize_payload
+    from superset.views.utils import _deserialize_results_payload, ResultsOptions
+
+    description = [
+        ("a", "int", None, None, None, None, False),
+        ("b", "string", None, None, None, None, False),
+    ]
+    result_set = SupersetResultSet([(1, "x"), (2, "y")], description, BaseEngineSpec)
+    data, selected_columns, all_columns, _ = _serialize_and_expand_data(
+        result_set, BaseEngineSpec, use_msgpack, columnar=stored_columnar
+    )
+    payload = _serialize_payload(
+        {
+            "data": data,
+            "columns": all_columns,
+            "selected_columns": selected_columns,
+            "expanded_columns": [],
+        },
+        use_msgpack,
+    )
+    query = mocker.MagicMock()
+    query.database.db_engine_spec = BaseEngineSpec
+
+    results = _deserialize_results_payload(
+        payload, query, use_msgpack, ResultsOptions(columnar=columnar)
+    )
+    if columnar:
+        assert results["data"] == {"a": [1, 2], "b": ["x", "y"]}
+    else:
+        assert results["data"] == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+
+
+def test_deserialize_results_payload_page_expanded(
+    mocker: MockerFixture, app: None
+) -> None:
+    """
+    Test that results whose rows are expanded are paged after being expanded.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.sql_lab import _serialize_and_expand_data, _serialize_payload
+    from superset.views.utils import _deserialize_results_payload, ResultsOptions
+
+    class ExpandingEngineSpec(BaseEngineSpec):
+        @classmethod
+        def expands_data(cls) -> bool:
+            return True
+
+        @classmethod
+        def expand_data(cls, columns, data):  # type: ignore
+            return columns, [row for row in data for _ in range(2)], []
+
+    description = [("a", "int", None, None, None, None, False)]
+    result_set = SupersetResultSet(
+        [(i,) for i in range(5)], description, BaseEngineSpec
+    )
+    data, selected_columns, all_columns, _ = _serialize_and_expand_data(
+        result_set, BaseEngineSpec, True
+    )
+    payload = _serialize_payload(
+        {
+            "data": data,
+            "columns": all_columns,
+            "selected_columns": selected_columns,
+            "expanded_columns": [],
+        },
+        True,
+    )
+    query = mocker.MagicMock()
+    query.database.db_engine_spec = ExpandingEngineSpec
+
+    results = _deserialize_results_payload(
+        payload, query, True, ResultsOptions(offset=3, limit=4)
+    )
+    assert results["data"] == [{"a": 1}, {"a": 2}, {"a": 2}, {"a": 3}]
+
+    # columnar data isn't expanded
+    results = _deserialize_results_payload(
+        payload, query, True, ResultsOptions(columnar=True, offset=3, limit=4)
+    )
+    assert results["data"] == {"a": [3, 4]}
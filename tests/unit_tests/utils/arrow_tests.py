@@ -0,0 +1,134 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import date, datetime
+from decimal import Decimal
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from superset.utils.arrow import (
+    df_to_arrow_table,
+    df_to_ipc,
+    ipc_to_df,
+    iter_arrow_stream,
+    iter_parquet,
+    read_arrow_stream,
+)
+
+
+def test_df_to_arrow_table() -> None:
+    """
+    Test that unconvertible object columns are stringified.
+    """
+    df = pd.DataFrame(
+        {
+            "num": [1, 2],
+            "name": ["foo", None],
+            "mixed": [{"a": 1}, 2],
+        }
+    )
+    table = df_to_arrow_table(df)
+    assert table.schema.types == [pa.int64(), pa.string(), pa.string()]
+    assert table.to_pydict() == {
+        "num": [1, 2],
+        "name": ["foo", None],
+        "mixed": ["{'a': 1}", "2"],
+    }
+
+
+def test_df_to_arrow_table_index() -> None:
+    """
+    Test that a non-default index is kept as leading columns when requested.
+    """
+    df = pd.DataFrame({"num": [1, 2]}, index=pd.Index(["a", "b"], name="key"))
+    assert df_to_arrow_table(df).column_names == ["num"]
+    assert df_to_arrow_table(df, index=True).column_names == ["key", "num"]
+
+
+def test_arrow_stream_roundtrip() -> None:
+    """
+    Test that the stream is written in batches and carries the metadata.
+    """
+    table = pa.table({"num": list(range(10))})
+    chunks = list(
+        iter_arrow_stream(
+            table,
+            metadata={"colnames": ["num"], "dttm": datetime(1970, 1, 2)},
+            max_chunksize=3,
+        )
+    )
+    assert len(chunks) == 5
+
+    result, metadata = read_arrow_stream(b"".join(chunks))
+    assert result.equals(table)
+    assert metadata == {"colnames": ["num"], "dttm": 86400000.0}
+
+    result, metadata = read_arrow_stream(b"".join(iter_arrow_stream(table)))
+    assert result.equals(table)
+    assert metadata is None
+
+
+def test_iter_parquet() -> None:
+    """
+    Test that the Parquet file is written one row group at a time.
+    """
+    table = pa.table({"num": list(range(10)), "name": [str(i) for i in range(10)]})
+    chunks = list(iter_parquet(table, row_group_size=4))
+    assert len(chunks) > 1
+
+    parquet_file = pq.ParquetFile(pa.BufferReader(b"".join(chunks)))
+    assert parquet_file.num_row_groups == 3
+    assert parquet_file.read().equals(table)
+
+
+def test_df_to_ipc_roundtrip() -> None:
+    """
+    Test that DataFrames are read back with the same index, dtypes and values.
+    """
+    df = pd.DataFrame(
+        {
+            "num": [1, 2],
+            "nullable": pd.Series([1, None], dtype=object),
+            "name": ["foo", None],
+            "ds": [date(2020, 1, 1), None],
+            "ts": pd.to_datetime(["2020-01-01", "2021-01-01"]).tz_localize("UTC"),
+            "amount": [Decimal("1.5"), None],
+            "tags": [["a", "b"], None],
+        },
+    ).set_index(pd.Index(["p", "q"], name="key"))
+    result = ipc_to_df(df_to_ipc(df, compression="lz4"))
+    pd.testing.assert_frame_equal(result, df)
+    assert result["nullable"].tolist() == [1, None]
+    assert result["tags"].tolist() == [["a", "b"], None]
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"mixed": [1, "a"]}),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+        pd.DataFrame({0: [1]}),
+    ],
+)
+def test_df_to_ipc_unsupported(df: pd.DataFrame) -> None:
+    """
+    Test that DataFrames that can't be converted losslessly are rejected.
+    """
+    with pytest.raises(ValueError):
+        df_to_ipc(df)
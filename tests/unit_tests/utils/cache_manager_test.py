@@ -0,0 +1,157 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any, Optional
+
+import pandas as pd
+from cachelib import SimpleCache
+from flask import Flask
+from flask_caching import Cache
+from pytest_mock import MockFixture
+
+from superset.utils.cache_manager import CacheManager, LocalCache, LocalTierCache
+
+
+def test_local_cache_eviction() -> None:
+    """
+    Test that the least recently used values are evicted to stay within the size.
+    """
+    local = LocalCache(max_size=10)
+    local.set("a", b"1234", "v1", 0)
+    local.set("b", b"1234", "v1", 0)
+    assert local.get("a")
+    local.set("c", b"1234", "v1", 0)
+
+    assert local.size == 8
+    assert local.get("a")
+    assert local.get("b") is None
+    assert local.get("c")
+
+    local.set("d", b"12345678901", "v1", 0)
+    assert local.get("d") is None
+    assert local.size == 8
+
+
+def test_local_cache_timeout(mocker: MockFixture) -> None:
+    """
+    Test that values expire with their timeout.
+    """
+    monotonic = mocker.patch("superset.utils.cache_manager.time.monotonic")
+    monotonic.return_value = 100
+    local = LocalCache(max_size=10)
+    local.set("a", b"1", "v1", 60)
+
+    monotonic.return_value = 159
+    assert local.get("a")
+    monotonic.return_value = 160
+    assert local.get("a") is None
+    assert local.size == 0
+
+
+def test_local_tier_cache(mocker: MockFixture) -> None:
+    """
+    Test that values are served locally while their version is the current one.
+    """
+    backend = SimpleCache()
+    cache = LocalTierCache(backend, max_size=1024)
+    other = LocalTierCache(backend, max_size=1024)
+    get_many = mocker.spy(backend, "get_many")
+
+    cache.set("key", {"value": 1})
+    assert cache.get("key") == {"value": 1}
+    get_many.assert_called_once_with("key", "key__version")
+    assert cache.get("key") == {"value": 1}
+    get_many.assert_called_with("key__version")
+
+    # values written by other processes are fetched
+    other.set("key", {"value": 2})
+    assert cache.get("key") == {"value": 2}
+    assert other.get("key") == {"value": 2}
+
+    # as are deleted ones
+    other.delete("key")
+    assert cache.get("key") is None
+    assert cache.local.get("key") is None
+
+    # values not written through the local tier are not kept locally
+    backend.set("legacy", 1)
+    assert cache.get_many("key", "legacy") == [None, 1]
+    assert cache.local.get("legacy") is None
+
+
+def test_local_tier_cache_interleaved_writes(mocker: MockFixture) -> None:
+    """
+    Test that values aren't kept locally while concurrent writes are interleaved.
+    """
+    backend = SimpleCache()
+    cache = LocalTierCache(backend, max_size=1024)
+    other = LocalTierCache(backend, max_size=1024)
+    cache.set("key", 0)
+    assert cache.get("key") == 0
+
+    # the versions are written in the reverse order of the values
+    versions = []
+    backend_set = backend.set
+
+    def set_(key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        if key.endswith("__version"):
+            versions.append((key, value, timeout))
+            return True
+        return backend_set(key, value, timeout)
+
+    mocker.patch.object(backend, "set", side_effect=set_)
+    cache.set("key", 1)
+    other.set("key", 2)
+    for version in reversed(versions):
+        backend_set(*version)
+
+    assert other.get("key") == 2
+    assert cache.get("key") == 2
+    assert cache.local.get("key") is None
+
+
+def test_local_tier_cache_copy() -> None:
+    """
+    Test that modifying a value in place doesn't alter the local one.
+    """
+    cache = LocalTierCache(SimpleCache(), max_size=1024)
+    cache.set("key", {"df": pd.DataFrame({"a": [1]})})
+
+    cache.get("key")["df"].columns = ["b"]
+    assert cache.get("key")["df"].columns.tolist() == ["a"]
+
+
+def test_cache_manager_local_tier() -> None:
+    """
+    Test that the local tier is enabled by the cache config.
+    """
+    app = Flask(__name__)
+    app.config["CACHE_DEFAULT_TIMEOUT"] = 60
+    app.config["CACHE_CONFIG"] = {
+        "CACHE_TYPE": "SimpleCache",
+        "CACHE_LOCAL_MAX_SIZE": 1024,
+    }
+    app.config["DATA_CACHE_CONFIG"] = {"CACHE_TYPE": "SimpleCache"}
+    cache = Cache()
+    data_cache = Cache()
+
+    CacheManager._init_cache(app, cache, "CACHE_CONFIG")
+    CacheManager._init_cache(app, data_cache, "DATA_CACHE_CONFIG")
+
+    with app.app_context():
+        assert isinstance(cache.cache, LocalTierCache)
+        assert cache.cache.default_timeout == 60
+        assert isinstance(data_cache.cache, SimpleCache)
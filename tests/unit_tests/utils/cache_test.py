@@ -49,3 +49,64 @@ def test_memoized_func(mocker: MockerFixture) -> None:
     cache.get.return_value = 43
     result = decorated(self, "public", cache=True)
     assert result == 43
+
+
+def test_get_data_cache_timeout(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test the admission policy of the data cache.
+    """
+    from flask import current_app
+
+    from superset.utils import cache
+
+    stats_logger = mocker.patch.object(cache, "stats_logger")
+    value = {"df_arrow": b"x" * 1000}
+
+    # no limits
+    assert cache.get_data_cache_timeout(value, 300, cost=1) == 300
+    stats_logger.incr.assert_not_called()
+
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "DATA_CACHE_MAX_ENTRY_SIZE": 2000,
+            "DATA_CACHE_MAX_SIZE_PER_SECOND": 100,
+            "DATA_CACHE_DOWNTIER_TIMEOUT": 60,
+        },
+    )
+    assert cache.get_data_cache_timeout(value, 300, cost=20) == 300
+    stats_logger.incr.assert_called_with("cache_admit")
+
+    # cheap to compute for its size
+    assert cache.get_data_cache_timeout(value, 300, cost=1) == 60
+    assert cache.get_data_cache_timeout(value, 0, cost=1) == 60
+    stats_logger.incr.assert_any_call("cache_downtier")
+
+    # unknown cost
+    assert cache.get_data_cache_timeout(value, 300) == 300
+
+    # too large
+    assert cache.get_data_cache_timeout({"df_arrow": b"x" * 3000}, 300) is None
+    stats_logger.incr.assert_called_with("cache_reject_size")
+
+
+def test_set_and_log_cache_rejected(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that results refused by the data cache are not cached.
+    """
+    from flask import current_app
+
+    from superset.extensions import cache_manager
+    from superset.utils.cache import set_and_log_cache
+
+    mocker.patch.dict(current_app.config, {"DATA_CACHE_MAX_ENTRY_SIZE": 10})
+    data_cache = mocker.MagicMock()
+    mocker.patch.object(cache_manager, "_data_cache", data_cache)
+
+    set_and_log_cache(data_cache, "key", {"df_arrow": b"x" * 100})
+    data_cache.set.assert_not_called()
+
+    # other caches are not subject to the policy
+    other_cache = mocker.MagicMock()
+    set_and_log_cache(other_cache, "key", {"df_arrow": b"x" * 100})
+    other_cache.set.assert_called_once()
@@ -0,0 +1,69 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.utils.compression import (
+    compress,
+    CompressionCodec,
+    decompress,
+    get_codec,
+    HEADER,
+    MAGIC,
+)
+from superset.utils.core import zlib_compress
+
+
+@pytest.mark.parametrize("codec", ["zstd", "lz4", "zlib", "none", None])
+def test_compress_decompress(codec: str) -> None:
+    data = '{"test": 1}' * 100
+
+    blob = compress(data, codec)
+
+    assert blob.startswith(MAGIC)
+    assert decompress(blob) == data
+    assert decompress(blob, decode=False) == data.encode("utf-8")
+
+
+def test_decompress_legacy_zlib() -> None:
+    assert decompress(zlib_compress('{"test": 1}')) == '{"test": 1}'
+
+
+def test_compress_legacy_zlib() -> None:
+    """
+    Test that the legacy codec writes blobs readable by previous releases.
+    """
+    blob = compress('{"test": 1}', "legacy")
+
+    assert blob == zlib_compress('{"test": 1}')
+    assert decompress(blob) == '{"test": 1}'
+
+
+def test_decompress_unknown_codec() -> None:
+    with pytest.raises(ValueError):
+        decompress(HEADER.pack(MAGIC, 42, 0))
+
+
+def test_get_codec(mocker: MockerFixture) -> None:
+    assert get_codec("zstd") == CompressionCodec.ZSTD
+    assert get_codec(None) == CompressionCodec.NONE
+    with pytest.raises(ValueError):
+        get_codec("snappy")
+
+    pa = mocker.patch("superset.utils.compression.pa")
+    pa.Codec.is_available.return_value = False
+    assert get_codec("zstd") == CompressionCodec.ZLIB
@@ -0,0 +1,64 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+
+import pytest
+from flask import Flask, g, request
+
+from superset.utils.concurrency import map_in_app_context
+
+
+def test_map_in_app_context(app: Flask) -> None:
+    """
+    Test that calls run in threads with the request and `g` values of the caller.
+    """
+    main_thread = threading.get_ident()
+
+    def func(item: int) -> tuple[int, str, str, bool]:
+        return (
+            item * 2,
+            g.user,
+            request.args["a"],
+            threading.get_ident() != main_thread,
+        )
+
+    with app.test_request_context("/?a=b"):
+        g.user = "admin"
+        assert map_in_app_context(func, [1, 2, 3], max_workers=2) == [
+            (2, "admin", "b", True),
+            (4, "admin", "b", True),
+            (6, "admin", "b", True),
+        ]
+        assert map_in_app_context(func, [1, 2], max_workers=1) == [
+            (2, "admin", "b", False),
+            (4, "admin", "b", False),
+        ]
+
+
+def test_map_in_app_context_error(app: Flask) -> None:
+    """
+    Test that exceptions raised by the calls are raised to the caller.
+    """
+
+    def func(item: int) -> int:
+        if item == 2:
+            raise ValueError("boom")
+        return item
+
+    with app.app_context():
+        with pytest.raises(ValueError, match="boom"):
+            map_in_app_context(func, [1, 2, 3], max_workers=3)
@@ -19,7 +19,8 @@ from datetime import datetime, timezone
 
 import pandas as pd
 
-from superset.utils.excel import df_to_excel
+from superset.utils import excel
+from superset.utils.excel import df_to_excel, df_to_excel_chunks
 
 
 def test_timezone_conversion() -> None:
@@ -29,3 +30,31 @@ def test_timezone_conversion() -> None:
     df = pd.DataFrame({"dt": [datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc)]})
     contents = df_to_excel(df)
     assert pd.read_excel(contents)["dt"][0] == "2023-01-01 00:00:00+00:00"
+
+
+def test_df_to_excel_chunks(monkeypatch) -> None:
+    """
+    Test that the streamed Excel file has the same content as the pandas one.
+    """
+    monkeypatch.setattr(excel, "EXCEL_CHUNK_SIZE", 2)
+    monkeypatch.setattr(excel, "EXCEL_READ_SIZE", 1024)
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, None],
+            "b": ["x", None, "z"],
+            "dt": [datetime(2023, 1, 1), None, datetime(2023, 1, 3)],
+            "tz": [datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc)] * 3,
+            "obj": [[1], {"a": 1}, 3.5],
+        },
+        index=pd.Index([10, 20, 30], name="idx"),
+    )
+
+    chunks = list(df_to_excel_chunks(df))
+
+    assert len(chunks) > 1
+    expected = pd.read_excel(df_to_excel(df.copy()))
+    pd.testing.assert_frame_equal(pd.read_excel(b"".join(chunks)), expected)
+    pd.testing.assert_frame_equal(
+        pd.read_excel(b"".join(df_to_excel_chunks(df, index=False))),
+        pd.read_excel(df_to_excel(df.copy(), index=False)),
+    )
@@ -0,0 +1,151 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument
+
+import threading
+
+import pytest
+from flask import current_app
+from flask_caching import Cache
+from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def cache(mocker: MockerFixture, app_context: None) -> Cache:
+    from superset.extensions import cache_manager
+
+    cache = Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.object(cache_manager, "_cache", cache)
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "DATABASE_QUERY_CONCURRENCY_LIMITS": {"other": 2},
+            "DATABASE_QUERY_CONCURRENCY_DEFAULT_LIMIT": 1,
+            "DATABASE_QUERY_QUEUE_TIMEOUT": 0,
+        },
+    )
+    return cache
+
+
+def test_admit_query(cache: Cache) -> None:
+    """
+    Test that queries wait for a slot of the limit of their database.
+    """
+    from superset.exceptions import QueryQueueTimeoutException
+    from superset.models.core import Database
+    from superset.utils.query_admission import admit_query, QueryPriority
+
+    app = current_app._get_current_object()
+    database = Database(id=1, database_name="db")
+    with admit_query(database, "admin", QueryPriority.INTERACTIVE):
+        # nested connections of the same thread hold the same slot
+        with admit_query(database, "admin", QueryPriority.INTERACTIVE):
+            pass
+
+        # while other threads wait for it
+        errors = []
+
+        def query() -> None:
+            with app.app_context():
+                try:
+                    with admit_query(database, "alpha", QueryPriority.INTERACTIVE):
+                        pass
+                except QueryQueueTimeoutException as ex:
+                    errors.append(ex)
+
+        thread = threading.Thread(target=query)
+        thread.start()
+        thread.join()
+        assert len(errors) == 1
+
+    with admit_query(database, "admin", QueryPriority.INTERACTIVE):
+        pass
+
+    other = Database(id=2, database_name="other")
+    with admit_query(other, "admin", QueryPriority.INTERACTIVE):
+        with admit_query(database, "admin", QueryPriority.INTERACTIVE):
+            pass
+
+
+def test_admit_query_slot_taken(cache: Cache) -> None:
+    """
+    Test that queries time out when all the slots of their database are taken.
+    """
+    from superset.exceptions import QueryQueueTimeoutException
+    from superset.models.core import Database
+    from superset.utils.query_admission import admit_query, QueryPriority
+
+    database = Database(id=1, database_name="db")
+    cache.add("database_query_slots__1__0", "token")
+    with pytest.raises(QueryQueueTimeoutException):
+        with admit_query(database, "admin", QueryPriority.INTERACTIVE):
+            pass
+
+    cache.delete("database_query_slots__1__0")
+    with admit_query(database, "admin", QueryPriority.INTERACTIVE):
+        assert cache.has("database_query_slots__1__0")
+    assert not cache.has("database_query_slots__1__0")
+
+
+def test_admit_query_priority(cache: Cache) -> None:
+    """
+    Test that background queries let queued interactive queries go first.
+    """
+    from superset.exceptions import QueryQueueTimeoutException
+    from superset.models.core import Database
+    from superset.utils.query_admission import admit_query, QueryPriority
+
+    database = Database(id=1, database_name="db")
+    cache.set("database_query_slots__1__interactive", True)
+    with pytest.raises(QueryQueueTimeoutException):
+        with admit_query(database, None, QueryPriority.BACKGROUND):
+            pass
+
+    with admit_query(database, "admin", QueryPriority.INTERACTIVE):
+        pass
+
+    cache.delete("database_query_slots__1__interactive")
+    with admit_query(database, None, QueryPriority.BACKGROUND):
+        pass
+
+
+def test_admit_query_user_limit(mocker: MockerFixture, cache: Cache) -> None:
+    """
+    Test that each user can be limited to a number of queries on a database.
+    """
+    from superset.exceptions import QueryQueueTimeoutException
+    from superset.models.core import Database
+    from superset.utils.query_admission import admit_query, QueryPriority
+
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "DATABASE_QUERY_CONCURRENCY_DEFAULT_LIMIT": None,
+            "DATABASE_QUERY_CONCURRENCY_USER_LIMIT": 1,
+        },
+    )
+    database = Database(id=1, database_name="db")
+    cache.add("database_query_slots__1__admin__0", "token")
+    with pytest.raises(QueryQueueTimeoutException):
+        with admit_query(database, "admin", QueryPriority.INTERACTIVE):
+            pass
+
+    with admit_query(database, "alpha", QueryPriority.INTERACTIVE):
+        pass
+    # queries without a user are only bound by the database limit
+    with admit_query(database, None, QueryPriority.INTERACTIVE):
+        pass
@@ -16,8 +16,10 @@
 # under the License.
 import os
 from dataclasses import dataclass
+from io import BytesIO
 from typing import Any, Optional
 from unittest.mock import MagicMock, patch
+from zipfile import ZipFile
 
 import pandas as pd
 import pytest
@@ -31,6 +33,7 @@ from superset.utils.core import (
     generic_find_constraint_name,
     generic_find_fk_constraint_name,
     is_test,
+    iter_zip,
     normalize_dttm_col,
     parse_boolean_string,
     QueryObjectFilterClause,
@@ -371,3 +374,16 @@ def test_generic_find_fk_constraint_none_exist():
     )
 
     assert result is None
+
+
+def test_iter_zip() -> None:
+    """
+    Test that zip files are streamed as their files are written
+    """
+    chunks = list(iter_zip({"a.csv": (b"1,2\n" for _ in range(1000)), "b.txt": [b"b"]}))
+
+    assert len(chunks) > 2
+    with ZipFile(BytesIO(b"".join(chunks))) as bundle:
+        assert bundle.namelist() == ["a.csv", "b.txt"]
+        assert bundle.read("a.csv") == b"1,2\n" * 1000
+        assert bundle.read("b.txt") == b"b"